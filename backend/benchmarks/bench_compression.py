@@ -0,0 +1,82 @@
+"""
+Measure response compression CPU cost against bytes saved.
+
+Builds representative API payloads from synthetic markdown (one page,
+a 100-page ``view=full`` listing, a 100-page ``view=summary`` listing and
+the tree-view script), then compresses each with every available encoding
+and level and reports output size and CPU time per response. The
+middleware runs gzip at level 1 and brotli (if installed) at quality 4;
+static assets are precompressed once at the maximum levels. Run from the
+backend directory:
+
+    python -m benchmarks.bench_compression --rounds 50
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.common import MarkdownGenerator, build_vocabulary
+from src.api.middleware.compression import available_encodings, compress
+from src.core.common.markdown import extract_plain_text
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 11)}
+
+
+def build_payloads(generator: MarkdownGenerator):
+    """``name -> bytes`` of responses as the API would serialize them."""
+    now = datetime.utcnow().isoformat()
+    section_id = str(uuid.uuid4())
+
+    def page(order: int) -> dict:
+        content = generator.markdown()
+        return {
+            "id": str(uuid.uuid4()), "section_id": section_id, "parent_page_id": None,
+            "title": generator.title(), "content": content,
+            "content_plain": extract_plain_text(content), "display_order": order,
+            "created_at": now, "updated_at": now, "deleted_at": None,
+        }
+
+    pages = [page(i) for i in range(100)]
+    summary_keys = ("id", "section_id", "parent_page_id", "title", "display_order", "updated_at")
+    return {
+        "page": json.dumps(pages[0]).encode(),
+        "list-full-100": json.dumps(pages).encode(),
+        "list-summary-100": json.dumps(
+            [{key: p[key] for key in summary_keys} for p in pages]
+        ).encode(),
+        "tree-view-app.js": Path("src/api/static/js/tree-view-app.js").read_bytes(),
+    }
+
+
+def main(args) -> None:
+    payloads = build_payloads(MarkdownGenerator(build_vocabulary()))
+    print(
+        f"{'payload':<18} {'encoding':<9} {'bytes':>9} {'ratio':>6} "
+        f"{'cpu/resp':>10} {'saved/cpu-ms':>13}"
+    )
+    for name, data in payloads.items():
+        print(f"{name:<18} {'identity':<9} {len(data):>9,}")
+        for encoding in available_encodings():
+            for level in LEVELS[encoding]:
+                started = time.process_time()
+                for _ in range(args.rounds):
+                    encoded = compress(data, encoding, level)
+                cpu_ms = (time.process_time() - started) * 1000 / args.rounds
+                saved = len(data) - len(encoded)
+                print(
+                    f"{'':<18} {f'{encoding}-{level}':<9} {len(encoded):>9,} "
+                    f"{len(data) / len(encoded):>6.1f} {cpu_ms:>8.3f}ms "
+                    f"{saved / max(cpu_ms, 1e-3):>11,.0f}B"
+                )
+    if "br" not in available_encodings():
+        print("brotli is not installed; only gzip was measured")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=50)
+    main(parser.parse_args())
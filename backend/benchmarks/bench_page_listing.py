@@ -0,0 +1,73 @@
+"""
+Compare full and summary page listings for 100-page sections.
+
+Seeds a throwaway SQLite database, then requests
+``/api/pages/?section_id=...`` with ``view=full`` and ``view=summary``
+through the ASGI app in-process and reports response size and latency.
+Run from the backend directory:
+
+    python -m benchmarks.bench_page_listing --sections 10 --pages 100 --rounds 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+
+async def main(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        # Settings and the engine are read at import time
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["DEBUG"] = "false"
+
+        import httpx
+
+        from benchmarks.common import (
+            MarkdownGenerator,
+            build_vocabulary,
+            latency_summary,
+            seed_database,
+        )
+        from src.infrastructure.config.database import Base, engine
+        from src.main import app
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        ids = await seed_database(
+            engine, 1, args.sections, args.pages, MarkdownGenerator(build_vocabulary())
+        )
+        print(f"Seeded {len(ids['sections'])} sections x {args.pages} pages")
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for view in ("full", "summary"):
+                sizes, samples = [], []
+                for round_number in range(args.rounds + 1):
+                    for section_id in ids["sections"]:
+                        started = time.perf_counter()
+                        response = await client.get(
+                            "/api/pages/", params={"section_id": section_id, "view": view}
+                        )
+                        elapsed = (time.perf_counter() - started) * 1000
+                        response.raise_for_status()
+                        if round_number:  # first round warms up
+                            samples.append(elapsed)
+                            sizes.append(len(response.content))
+                print(
+                    f"view={view:<8} bytes={statistics.fmean(sizes):>10,.0f}  "
+                    f"{latency_summary(samples)}"
+                )
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=100, help="pages per section")
+    parser.add_argument("--rounds", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
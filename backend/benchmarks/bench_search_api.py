@@ -0,0 +1,157 @@
+"""
+Benchmark the search API at SC-007 scale through the ASGI app.
+
+Seeds a throwaway SQLite database with 50 notebooks x 20 sections x 100
+pages of synthetic markdown (deterministic), builds the search indexes,
+then drives a query mix against ``/api/search/`` and
+``/api/search/suggest`` in-process and reports p50/p95/p99 latency per
+query kind and the index build times. Run from the backend directory:
+
+    python -m benchmarks.bench_search_api
+    python -m benchmarks.bench_search_api --backend memory --notebooks 10
+
+The result cache is disabled unless ``--cache`` is given, so repeated
+queries measure the backend rather than dictionary lookups.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+P95_TARGET_MS = 200.0
+
+
+def build_request_mix(vocabulary, notebook_ids, count: int):
+    """
+    ``(kind, path, params)`` requests covering the ways the UI searches.
+
+    Kinds: single and two-term queries, notebook-scoped queries, typos that
+    take the fuzzy fallback, second pages via cursor (marked ``"next"``) and
+    autocomplete prefixes.
+    """
+    from benchmarks.bench_search_backends import build_query_mix
+
+    queries = build_query_mix(vocabulary, count)
+    middle = vocabulary[200:400]
+    mix = []
+    for i, query in enumerate(queries):
+        kind = i % 6
+        if kind == 0:
+            mix.append(("search", "/api/search/", {"q": query}))
+        elif kind == 1:
+            mix.append(("search-scoped", "/api/search/", {
+                "q": query, "notebook_id": notebook_ids[i % len(notebook_ids)],
+            }))
+        elif kind == 2:
+            word = middle[i % len(middle)]
+            typo = word[:-2] + word[-1] + word[-2] if len(word) > 3 else word + "x"
+            mix.append(("search-typo", "/api/search/", {"q": typo}))
+        elif kind == 3:
+            mix.append(("search-next", "/api/search/", {"q": query}))
+        else:
+            prefix = query.split()[0][: 2 + i % 3]
+            mix.append(("suggest", "/api/search/suggest", {"q": prefix}))
+    return mix
+
+
+async def run_requests(client, mix, limit: int):
+    samples = defaultdict(list)
+    for kind, path, params in mix:
+        params = dict(params)
+        if path == "/api/search/":
+            params["limit"] = limit
+        started = time.perf_counter()
+        response = await client.get(path, params=params)
+        elapsed = (time.perf_counter() - started) * 1000
+        response.raise_for_status()
+
+        if kind == "search-next":
+            # Time the follow-up page only; the first page is plain "search"
+            samples["search"].append(elapsed)
+            cursor = response.json().get("next_cursor")
+            if not cursor:
+                continue
+            params["cursor"] = cursor
+            started = time.perf_counter()
+            (await client.get(path, params=params)).raise_for_status()
+            elapsed = (time.perf_counter() - started) * 1000
+        samples[kind].append(elapsed)
+    return samples
+
+
+async def main(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        # Settings and the engine are read at import time
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["SEARCH_BACKEND"] = args.backend
+        os.environ["SEARCH_CACHE_SIZE"] = "1024" if args.cache else "0"
+        os.environ["DEBUG"] = "false"
+
+        import httpx
+
+        from benchmarks.common import (
+            MarkdownGenerator,
+            build_vocabulary,
+            latency_summary,
+            percentile,
+            seed_database,
+        )
+        from src.infrastructure.config.database import Base, engine, AsyncSessionLocal
+        from src.infrastructure.data.repositories.search_repository import ensure_search_schema
+        from src.infrastructure.search.index_set import get_search_index_set
+        from src.main import app
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        vocabulary = build_vocabulary()
+        started = time.perf_counter()
+        ids = await seed_database(
+            engine, args.notebooks, args.sections, args.pages, MarkdownGenerator(vocabulary)
+        )
+        print(f"Seeded {len(ids['pages'])} pages in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        async with engine.begin() as conn:
+            await conn.run_sync(ensure_search_schema)
+        print(f"FTS5 index build:        {time.perf_counter() - started:8.2f}s")
+
+        started = time.perf_counter()
+        indexed = await get_search_index_set().load(AsyncSessionLocal)
+        print(
+            f"In-memory indexes build: {time.perf_counter() - started:8.2f}s "
+            f"({indexed} pages, backend={args.backend})"
+        )
+
+        mix = build_request_mix(vocabulary, ids["notebooks"], args.queries)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await run_requests(client, mix[:20], args.limit)  # warm up
+            samples = await run_requests(client, mix, args.limit)
+
+        for kind in sorted(samples):
+            print(f"{kind:<14} {latency_summary(samples[kind])}")
+
+        search_samples = [
+            s for kind, values in samples.items() if kind != "suggest" for s in values
+        ]
+        p95 = percentile(search_samples, 95)
+        verdict = "PASS" if p95 < P95_TARGET_MS else "FAIL"
+        print(f"search p95 {p95:.1f}ms vs target <{P95_TARGET_MS:.0f}ms: {verdict}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--notebooks", type=int, default=50)
+    parser.add_argument("--sections", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=100, help="pages per section")
+    parser.add_argument("--queries", type=int, default=600)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--backend", choices=["database", "memory"], default="database")
+    parser.add_argument("--cache", action="store_true", help="enable the search result cache")
+    asyncio.run(main(parser.parse_args()))
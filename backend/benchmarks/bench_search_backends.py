@@ -0,0 +1,107 @@
+"""
+Compare the search backends on the same synthetic corpus.
+
+Seeds a throwaway SQLite database, then measures index build time and
+query latency for the SQLite FTS5 repository and the in-process inverted
+index. Run from the backend directory:
+
+    python -m benchmarks.bench_search_backends --notebooks 10 --sections 10 --pages 100
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from benchmarks.common import MarkdownGenerator, build_vocabulary, latency_summary, seed_database
+from src.infrastructure.config.database import Base
+from src.infrastructure.data.repositories.search_repository import (
+    InMemorySearchRepository,
+    SqliteSearchRepository,
+    ensure_search_schema,
+)
+from src.infrastructure.search.index_set import SearchIndexSet
+from src.infrastructure.search.inverted_index import InvertedIndex
+
+
+def build_query_mix(vocabulary, count: int):
+    """Frequent, mid-frequency and rare single terms plus two-term queries."""
+    frequent, middle, rare = vocabulary[:20], vocabulary[200:400], vocabulary[3000:4000]
+    mix = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            mix.append(frequent[i % len(frequent)])
+        elif kind == 1:
+            mix.append(middle[i % len(middle)])
+        elif kind == 2:
+            mix.append(rare[i % len(rare)])
+        else:
+            mix.append(f"{middle[i % len(middle)]} {frequent[(i * 7) % len(frequent)]}")
+    return mix
+
+
+async def time_queries(repository, queries, limit: int):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        await repository.search(query, limit=limit)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def main(args) -> None:
+    vocabulary = build_vocabulary()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        started = time.perf_counter()
+        ids = await seed_database(
+            engine, args.notebooks, args.sections, args.pages, MarkdownGenerator(vocabulary)
+        )
+        print(f"Seeded {len(ids['pages'])} pages in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        async with engine.begin() as conn:
+            await conn.run_sync(ensure_search_schema)
+        print(f"FTS5 index build:      {time.perf_counter() - started:8.2f}s")
+
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        index = InvertedIndex()
+        started = time.perf_counter()
+        await SearchIndexSet([index]).load(session_factory)
+        print(f"Inverted index build:  {time.perf_counter() - started:8.2f}s")
+
+        queries = build_query_mix(vocabulary, args.queries)
+        async with session_factory() as session:
+            backends = {
+                "sqlite-fts5": SqliteSearchRepository(session),
+                "in-memory": InMemorySearchRepository(session, index),
+            }
+            for name, repository in backends.items():
+                await time_queries(repository, queries[:10], args.limit)  # warm up
+                samples = await time_queries(repository, queries, args.limit)
+                print(f"{name:<14} {latency_summary(samples)}")
+
+        async with engine.connect() as conn:
+            size = (await conn.execute(text(
+                "SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()"
+            ))).scalar()
+        print(f"Database size incl. FTS5: {size / 1_048_576:.1f} MiB")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--notebooks", type=int, default=10)
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=100, help="pages per section")
+    parser.add_argument("--queries", type=int, default=400)
+    parser.add_argument("--limit", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,186 @@
+"""
+Break down where a large page listing spends its time.
+
+Seeds a throwaway SQLite database with one section of pages, then times
+each stage of ``GET /api/pages/?section_id=...`` separately:
+
+- fetch: ORM entities converted field by field (``orm``) against column
+  rows unpacked straight into the domain dataclasses (``rows``);
+- serialize: domain -> Pydantic response models -> FastAPI's
+  ``response_model`` validation and serialization -> ``json.dumps``
+  (``pydantic``) against ``orjson`` encoding the dataclasses directly
+  (``orjson``);
+- end to end through the ASGI app.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_serialization --pages 1000 --rounds 30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+
+def _timed(samples: list, started: float) -> None:
+    samples.append((time.perf_counter() - started) * 1000)
+
+
+async def main(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        # Settings and the engine are read at import time
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["DEBUG"] = "false"
+
+        import httpx
+        from fastapi.routing import serialize_response
+        from fastapi.utils import create_response_field
+        from sqlalchemy import select
+        from sqlalchemy.orm import load_only, raiseload
+
+        from benchmarks.common import (
+            MarkdownGenerator,
+            build_vocabulary,
+            latency_summary,
+            seed_database,
+        )
+        from src.api.responses import FastJSONResponse
+        from src.api.schemas import PageResponse, PageSummaryResponse
+        from src.core.domain.page import Page, PageSummary
+        from src.infrastructure.config.database import AsyncSessionLocal, Base, engine
+        from src.infrastructure.data.load_profiles import PAGE_SUMMARY_COLUMNS, SCALARS
+        from src.infrastructure.data.models.page_model import PageModel
+        from src.infrastructure.data.repositories.page_repository import PageRepository
+        from src.main import app
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        ids = await seed_database(engine, 1, 1, args.pages, MarkdownGenerator(build_vocabulary()))
+        section_id = ids["sections"][0]
+        print(f"Seeded one section with {args.pages} pages")
+
+        async def fetch_orm(summaries: bool):
+            # The previous repository path: ORM instances copied field by field
+            async with AsyncSessionLocal() as session:
+                options = (
+                    (load_only(*PAGE_SUMMARY_COLUMNS, raiseload=True), raiseload("*"))
+                    if summaries
+                    else SCALARS
+                )
+                query = (
+                    select(PageModel).options(*options)
+                    .where(PageModel.section_id == section_id, PageModel.deleted_at.is_(None))
+                    .order_by(PageModel.display_order, PageModel.id)
+                )
+                models = (await session.execute(query)).scalars().all()
+                if summaries:
+                    return [
+                        PageSummary(
+                            id=m.id,
+                            section_id=m.section_id,
+                            title=m.title,
+                            parent_page_id=m.parent_page_id,
+                            display_order=m.display_order,
+                            updated_at=m.updated_at,
+                        )
+                        for m in models
+                    ]
+                return [Page(
+                    id=m.id, section_id=m.section_id, title=m.title, content=m.content,
+                    content_plain=m.content_plain, parent_page_id=m.parent_page_id,
+                    display_order=m.display_order, version=m.version, created_at=m.created_at,
+                    updated_at=m.updated_at, deleted_at=m.deleted_at,
+                ) for m in models]
+
+        async def fetch_rows(summaries: bool):
+            async with AsyncSessionLocal() as session:
+                repository = PageRepository(session)
+                if summaries:
+                    return await repository.get_summaries_by_section_id(section_id)
+                return await repository.get_by_section_id(section_id)
+
+        full_field = create_response_field("response", List[PageResponse], mode="serialization")
+        summary_field = create_response_field(
+            "response", List[PageSummaryResponse], mode="serialization"
+        )
+
+        async def serialize_pydantic(pages, summaries: bool) -> bytes:
+            # The previous route path: response models built field by field, then
+            # validated and serialized again against response_model
+            if summaries:
+                models = [PageSummaryResponse(
+                    id=p.id, section_id=p.section_id, parent_page_id=p.parent_page_id,
+                    title=p.title, display_order=p.display_order, updated_at=p.updated_at,
+                ) for p in pages]
+                field = summary_field
+            else:
+                models = [PageResponse(
+                    id=p.id, section_id=p.section_id, parent_page_id=p.parent_page_id,
+                    title=p.title, content=p.content, content_plain=p.content_plain,
+                    display_order=p.display_order, version=p.version, created_at=p.created_at,
+                    updated_at=p.updated_at, deleted_at=p.deleted_at,
+                ) for p in pages]
+                field = full_field
+            content = await serialize_response(field=field, response_content=models)
+            return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+        async def serialize_orjson(pages, summaries: bool) -> bytes:
+            return FastJSONResponse(pages).body
+
+        for summaries in (False, True):
+            view = "summary" if summaries else "full"
+            print(f"\nview={view}")
+            pages = await fetch_rows(summaries)
+            assert json.loads(await serialize_pydantic(pages, summaries)) == json.loads(
+                await serialize_orjson(pages, summaries)
+            ), "serializers disagree"
+
+            for name, stage in (("fetch orm", fetch_orm), ("fetch rows", fetch_rows)):
+                samples = []
+                for round_number in range(args.rounds + 1):
+                    started = time.perf_counter()
+                    await stage(summaries)
+                    if round_number:
+                        _timed(samples, started)
+                print(f"  {name:<20} {latency_summary(samples)}")
+
+            for name, stage in (
+                ("serialize pydantic", serialize_pydantic),
+                ("serialize orjson", serialize_orjson),
+            ):
+                samples, size = [], 0
+                for round_number in range(args.rounds + 1):
+                    started = time.perf_counter()
+                    size = len(await stage(pages, summaries))
+                    if round_number:
+                        _timed(samples, started)
+                print(f"  {name:<20} {latency_summary(samples)}  bytes={size:,}")
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                samples = []
+                for round_number in range(args.rounds + 1):
+                    started = time.perf_counter()
+                    response = await client.get(
+                        "/api/pages/",
+                        params={"section_id": section_id, "view": view},
+                        headers={"Accept-Encoding": "identity"},
+                    )
+                    response.raise_for_status()
+                    if round_number:
+                        _timed(samples, started)
+                print(f"  {'end to end':<20} {latency_summary(samples)}")
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=30)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,130 @@
+"""Shared helpers for the benchmark scripts: synthetic data and latency stats."""
+
+import random
+import statistics
+import uuid
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.common.markdown import extract_plain_text
+from src.infrastructure.data.models.notebook_model import NotebookModel
+from src.infrastructure.data.models.section_model import SectionModel
+from src.infrastructure.data.models.page_model import PageModel
+from src.infrastructure.data.models.page_path_model import PagePathModel
+
+_SYLLABLES = [
+    "ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "pa",
+    "qu", "ri", "do", "fe", "gu", "ha", "ji", "ko", "la", "mo",
+]
+
+INSERT_BATCH_SIZE = 500
+
+
+def build_vocabulary(size: int = 5000, seed: int = 7) -> List[str]:
+    """Deterministic pseudo-words, most frequent first."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words, key=lambda word: (len(word), word))
+
+
+class MarkdownGenerator:
+    """Generates markdown pages with Zipf-distributed words."""
+
+    def __init__(self, vocabulary: Sequence[str], seed: int = 42):
+        self.vocabulary = list(vocabulary)
+        self.weights = [1.0 / rank for rank in range(1, len(self.vocabulary) + 1)]
+        self.rng = random.Random(seed)
+
+    def words(self, count: int) -> List[str]:
+        return self.rng.choices(self.vocabulary, weights=self.weights, k=count)
+
+    def title(self) -> str:
+        return " ".join(self.words(self.rng.randint(2, 5))).capitalize()
+
+    def markdown(self, paragraphs: int = 4) -> str:
+        blocks = [f"# {self.title()}"]
+        for _ in range(paragraphs):
+            sentence = self.words(self.rng.randint(30, 80))
+            sentence[0] = f"**{sentence[0]}**"
+            blocks.append(" ".join(sentence) + ".")
+        blocks.append("```\ncode block " + " ".join(self.words(5)) + "\n```")
+        return "\n\n".join(blocks)
+
+
+async def seed_database(
+    engine: AsyncEngine,
+    notebooks: int,
+    sections_per_notebook: int,
+    pages_per_section: int,
+    generator: MarkdownGenerator,
+) -> Dict[str, List[str]]:
+    """
+    Bulk insert a synthetic notebook/section/page hierarchy.
+
+    Returns:
+        Ids keyed by ``"notebooks"``, ``"sections"`` and ``"pages"``.
+    """
+    now = datetime.utcnow()
+    ids: Dict[str, List[str]] = {"notebooks": [], "sections": [], "pages": []}
+    notebook_rows, section_rows, page_rows = [], [], []
+
+    for n in range(notebooks):
+        notebook_id = str(uuid.uuid4())
+        ids["notebooks"].append(notebook_id)
+        notebook_rows.append({
+            "id": notebook_id, "name": f"Notebook {n}", "color": "#0078D4",
+            "created_at": now, "updated_at": now,
+        })
+        for s in range(sections_per_notebook):
+            section_id = str(uuid.uuid4())
+            ids["sections"].append(section_id)
+            section_rows.append({
+                "id": section_id, "notebook_id": notebook_id, "name": f"Section {s}",
+                "display_order": s, "created_at": now, "updated_at": now,
+            })
+            for p in range(pages_per_section):
+                page_id = str(uuid.uuid4())
+                ids["pages"].append(page_id)
+                content = generator.markdown()
+                page_rows.append({
+                    "id": page_id, "section_id": section_id, "parent_page_id": None,
+                    "title": generator.title(), "content": content,
+                    "content_plain": extract_plain_text(content), "display_order": p,
+                    "created_at": now, "updated_at": now,
+                })
+
+    async with engine.begin() as conn:
+        await conn.execute(insert(NotebookModel.__table__), notebook_rows)
+        await conn.execute(insert(SectionModel.__table__), section_rows)
+        for start in range(0, len(page_rows), INSERT_BATCH_SIZE):
+            batch = page_rows[start:start + INSERT_BATCH_SIZE]
+            await conn.execute(insert(PageModel.__table__), batch)
+            await conn.execute(insert(PagePathModel.__table__), [
+                {"ancestor_id": row["id"], "descendant_id": row["id"], "depth": 0} for row in batch
+            ])
+
+    return ids
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, round(pct / 100.0 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def latency_summary(samples_ms: Sequence[float]) -> str:
+    """Format p50/p95/p99/mean of millisecond samples."""
+    return (
+        f"p50={percentile(samples_ms, 50):7.2f}ms  "
+        f"p95={percentile(samples_ms, 95):7.2f}ms  "
+        f"p99={percentile(samples_ms, 99):7.2f}ms  "
+        f"mean={statistics.fmean(samples_ms):7.2f}ms  n={len(samples_ms)}"
+    )
@@ -0,0 +1,56 @@
+"""Shared pytest fixtures."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from src.infrastructure.config.database import Base
+from src.infrastructure.data.models import (
+    notebook_model,
+    section_model,
+    page_model,
+    page_term_offsets_model,
+    page_path_model,
+)  # noqa: F401
+from src.infrastructure.data.repositories.search_repository import ensure_search_schema
+
+
+@pytest.fixture
+async def db_engine(tmp_path):
+    """Engine bound to a throwaway SQLite database with the full schema."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(ensure_search_schema)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(db_engine):
+    """Session on the throwaway database."""
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def count_statements(db_engine):
+    """Context manager collecting the SQL statements sent inside its block."""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
@@ -24,6 +24,8 @@ from infrastructure.data.models import (
     section_model,
     page_model,
     tag_model,
+    page_term_offsets_model,
+    page_path_model,
 )
 
 # this is the Alembic Config object, which provides
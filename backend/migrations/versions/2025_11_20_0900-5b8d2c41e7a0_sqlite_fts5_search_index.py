@@ -0,0 +1,76 @@
+"""sqlite_fts5_search_index
+
+Revision ID: 5b8d2c41e7a0
+Revises: 4e7e79a1f193
+Create Date: 2025-11-20 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d2c41e7a0'
+down_revision: Union[str, Sequence[str], None] = '4e7e79a1f193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add FTS5 index over pages on SQLite (PostgreSQL uses search_vector)."""
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    # External-content index: page text is stored once, in pages
+    op.execute("""
+        CREATE VIRTUAL TABLE pages_fts USING fts5(
+            title,
+            content_plain,
+            content='pages',
+            content_rowid='rowid',
+            tokenize='porter unicode61 remove_diacritics 2'
+        );
+    """)
+
+    # Keep the index in sync with the pages table
+    op.execute("""
+        CREATE TRIGGER pages_fts_after_insert AFTER INSERT ON pages BEGIN
+            INSERT INTO pages_fts(rowid, title, content_plain)
+            VALUES (new.rowid, new.title, new.content_plain);
+        END;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER pages_fts_after_delete AFTER DELETE ON pages BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, content_plain)
+            VALUES ('delete', old.rowid, old.title, old.content_plain);
+        END;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER pages_fts_after_update
+        AFTER UPDATE OF title, content_plain ON pages BEGIN
+            INSERT INTO pages_fts(pages_fts, rowid, title, content_plain)
+            VALUES ('delete', old.rowid, old.title, old.content_plain);
+            INSERT INTO pages_fts(rowid, title, content_plain)
+            VALUES (new.rowid, new.title, new.content_plain);
+        END;
+    """)
+
+    # Index pages that already exist
+    op.execute("INSERT INTO pages_fts(pages_fts) VALUES ('rebuild');")
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the FTS5 index and its triggers."""
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    op.execute('DROP TRIGGER IF EXISTS pages_fts_after_update;')
+    op.execute('DROP TRIGGER IF EXISTS pages_fts_after_delete;')
+    op.execute('DROP TRIGGER IF EXISTS pages_fts_after_insert;')
+    op.execute('DROP TABLE IF EXISTS pages_fts;')
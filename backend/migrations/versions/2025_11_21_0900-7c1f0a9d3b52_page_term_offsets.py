@@ -0,0 +1,45 @@
+"""page_term_offsets
+
+Revision ID: 7c1f0a9d3b52
+Revises: 5b8d2c41e7a0
+Create Date: 2025-11-21 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f0a9d3b52'
+down_revision: Union[str, Sequence[str], None] = '5b8d2c41e7a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add per-page term offsets used for highlighting.
+
+    Existing pages are not backfilled here; their offsets are computed on
+    the first highlight request (or by a reindex).
+    """
+
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == 'postgresql'
+    uuid_type = postgresql.UUID(as_uuid=True) if is_postgres else sa.String(36)
+
+    op.create_table(
+        'page_term_offsets',
+        sa.Column('page_id', uuid_type, nullable=False),
+        sa.Column('term', sa.String(64), nullable=False),
+        sa.Column('offsets', sa.LargeBinary, nullable=False),
+        sa.PrimaryKeyConstraint('page_id', 'term'),
+        sa.ForeignKeyConstraint(['page_id'], ['pages.id'], ondelete='CASCADE'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the term offsets table."""
+
+    op.drop_table('page_term_offsets')
@@ -0,0 +1,56 @@
+"""page_paths
+
+Revision ID: 9a3e6f2b1c84
+Revises: 7c1f0a9d3b52
+Create Date: 2025-11-22 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3e6f2b1c84'
+down_revision: Union[str, Sequence[str], None] = '7c1f0a9d3b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add the page hierarchy closure table and backfill it."""
+
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == 'postgresql'
+    uuid_type = postgresql.UUID(as_uuid=True) if is_postgres else sa.String(36)
+
+    op.create_table(
+        'page_paths',
+        sa.Column('ancestor_id', uuid_type, nullable=False),
+        sa.Column('descendant_id', uuid_type, nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id'),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['pages.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], ['pages.id'], ondelete='CASCADE'),
+    )
+    op.create_index('ix_page_paths_descendant_depth', 'page_paths', ['descendant_id', 'depth'])
+
+    # Every page (deleted ones included) gets its self row plus one row per ancestor
+    op.execute("""
+        INSERT INTO page_paths (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE paths(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM pages
+            UNION ALL
+            SELECT paths.ancestor_id, pages.id, paths.depth + 1
+            FROM pages JOIN paths ON pages.parent_page_id = paths.descendant_id
+        )
+        SELECT ancestor_id, descendant_id, depth FROM paths
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the closure table."""
+
+    op.drop_index('ix_page_paths_descendant_depth', table_name='page_paths')
+    op.drop_table('page_paths')
@@ -0,0 +1,36 @@
+"""page_version
+
+Revision ID: b4d1e8f0a2c6
+Revises: 9a3e6f2b1c84
+Create Date: 2025-11-23 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d1e8f0a2c6'
+down_revision: Union[str, Sequence[str], None] = '9a3e6f2b1c84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add the page edit counter used for optimistic concurrency.
+
+    Existing pages start at version 1 through the server default.
+    """
+
+    op.add_column('pages', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the page edit counter.
+
+    Plain ALTER TABLE rather than a batch table copy, which would lose the
+    search triggers on ``pages``; SQLite needs 3.35 or later for this.
+    """
+
+    op.drop_column('pages', 'version')
@@ -0,0 +1,51 @@
+"""page_term_offsets_blob
+
+Revision ID: c7e2a5d9f3b1
+Revises: b4d1e8f0a2c6
+Create Date: 2025-11-24 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a5d9f3b1'
+down_revision: Union[str, Sequence[str], None] = 'b4d1e8f0a2c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_table(*columns: sa.Column, primary_key: Sequence[str]) -> None:
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == 'postgresql'
+    uuid_type = postgresql.UUID(as_uuid=True) if is_postgres else sa.String(36)
+
+    op.create_table(
+        'page_term_offsets',
+        sa.Column('page_id', uuid_type, nullable=False),
+        *columns,
+        sa.Column('offsets', sa.LargeBinary, nullable=False),
+        sa.PrimaryKeyConstraint(*primary_key),
+        sa.ForeignKeyConstraint(['page_id'], ['pages.id'], ondelete='CASCADE'),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema - store term offsets as one blob per page, stamped with its version.
+
+    The per-term rows are dropped rather than converted; offsets are
+    recomputed on the next highlight request of each page (or by a reindex).
+    """
+
+    op.drop_table('page_term_offsets')
+    _create_table(sa.Column('version', sa.Integer(), nullable=False), primary_key=['page_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema - back to one row per (page, term), recomputed on demand."""
+
+    op.drop_table('page_term_offsets')
+    _create_table(sa.Column('term', sa.String(64), nullable=False), primary_key=['page_id', 'term'])
@@ -1,6 +1,7 @@
 """Dependency injection providers for FastAPI."""
 
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import AsyncGenerator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 
@@ -8,6 +9,29 @@ from src.infrastructure.config.database import AsyncSessionLocal
 from src.infrastructure.data.repositories.notebook_repository import NotebookRepository
 from src.infrastructure.data.repositories.section_repository import SectionRepository
 from src.infrastructure.data.repositories.page_repository import PageRepository
+from src.infrastructure.data.repositories.search_repository import (
+    InMemorySearchRepository,
+    create_search_repository,
+)
+from src.infrastructure.data.repositories.highlight_repository import HighlightRepository
+from src.infrastructure.data.autosave_buffer import AutosaveBuffer
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.search.reindex import PageReindexer
+from src.infrastructure.search.result_cache import (
+    CachedSearchRepository,
+    SearchCacheInvalidator,
+    get_search_result_cache,
+)
+from src.infrastructure.search.index_set import (
+    CommittedSearchIndex,
+    CompositeSearchIndex,
+    get_inverted_index,
+    get_prefix_index,
+    get_search_index_set,
+    get_trigram_index,
+)
+from src.core.interfaces.repositories import ISearchRepository
+from src.core.interfaces.search_index import ISearchIndex
 
 # Import services
 from src.core.services.create_notebook_service import CreateNotebookService
@@ -20,9 +44,16 @@ from src.core.services.delete_section_service import DeleteSectionService
 from src.core.services.get_sections_service import GetSectionsService
 from src.core.services.reorder_sections_service import ReorderSectionsService
 from src.core.services.create_page_service import CreatePageService
+from src.core.services.bulk_create_pages_service import BulkCreatePagesService
 from src.core.services.update_page_service import UpdatePageService
+from src.core.services.autosave_page_service import AutosavePageService
 from src.core.services.delete_page_service import DeletePageService
+from src.core.services.move_page_service import MovePageService
 from src.core.services.get_pages_service import GetPagesService
+from src.core.services.search_pages_service import SearchPagesService
+from src.core.services.get_search_suggestions_service import GetSearchSuggestionsService
+from src.core.services.get_page_highlights_service import GetPageHighlightsService
+from src.core.services.reindex_pages_service import ReindexPagesService
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -64,6 +95,60 @@ def get_page_repository(db: AsyncSession) -> PageRepository:
     return PageRepository(db)
 
 
+def get_search_repository(db: AsyncSession) -> ISearchRepository:
+    """Get search repository instance for the configured search backend."""
+    settings = get_settings()
+    if settings.search_backend == "memory":
+        repository = InMemorySearchRepository(db, get_inverted_index())
+    else:
+        repository = create_search_repository(db)
+    if settings.search_cache_size > 0:
+        repository = CachedSearchRepository(repository, get_search_result_cache())
+    return repository
+
+
+def get_highlight_repository(db: AsyncSession) -> HighlightRepository:
+    """Get highlight repository instance."""
+    return HighlightRepository(db)
+
+
+def get_search_cache(db: AsyncSession) -> SearchCacheInvalidator:
+    """Get the search result cache invalidator for this session."""
+    return SearchCacheInvalidator(get_search_result_cache(), db)
+
+
+def get_search_index(db: AsyncSession) -> ISearchIndex:
+    """Get the search indexes updated by page writes in this session."""
+    # Highlight offsets are left to the reindexer and the first highlight request
+    return CompositeSearchIndex([
+        CommittedSearchIndex(get_search_index_set(), db),
+        get_search_cache(db),
+    ])
+
+
+def get_reindex_search_index(db: AsyncSession) -> ISearchIndex:
+    """Get the search indexes rebuilt by the reindex job, highlight offsets included."""
+    return CompositeSearchIndex([
+        get_highlight_repository(db),
+        CommittedSearchIndex(get_search_index_set(), db),
+        get_search_cache(db),
+    ])
+
+
+@lru_cache()
+def get_autosave_buffer() -> Optional[AutosaveBuffer]:
+    """Get the process-wide autosave write-behind buffer, or None when disabled."""
+    settings = get_settings()
+    if not settings.autosave_write_behind:
+        return None
+    return AutosaveBuffer(
+        AsyncSessionLocal,
+        get_search_index,
+        settings.autosave_journal_path,
+        fsync=settings.autosave_journal_fsync,
+    )
+
+
 # Notebook service factories
 def get_create_notebook_service(db: AsyncSession = Depends(get_db)) -> CreateNotebookService:
     """Get create notebook service instance."""
@@ -77,7 +162,7 @@ def get_update_notebook_service(db: AsyncSession = Depends(get_db)) -> UpdateNot
 
 def get_delete_notebook_service(db: AsyncSession = Depends(get_db)) -> DeleteNotebookService:
     """Get delete notebook service instance."""
-    return DeleteNotebookService(get_notebook_repository(db))
+    return DeleteNotebookService(get_notebook_repository(db), get_search_index(db))
 
 
 def get_get_notebooks_service(db: AsyncSession = Depends(get_db)) -> GetNotebooksService:
@@ -117,20 +202,61 @@ def get_reorder_sections_service(db: AsyncSession = Depends(get_db)) -> ReorderS
 # Page service factories
 def get_create_page_service(db: AsyncSession = Depends(get_db)) -> CreatePageService:
     """Get create page service instance."""
-    return CreatePageService(get_page_repository(db))
+    return CreatePageService(get_page_repository(db), get_search_index(db))
+
+
+def get_bulk_create_pages_service(db: AsyncSession = Depends(get_db)) -> BulkCreatePagesService:
+    """Get bulk create pages service instance."""
+    return BulkCreatePagesService(get_page_repository(db), get_search_index(db))
 
 
 def get_update_page_service(db: AsyncSession = Depends(get_db)) -> UpdatePageService:
     """Get update page service instance."""
-    return UpdatePageService(get_page_repository(db))
+    return UpdatePageService(get_page_repository(db), get_search_index(db), get_autosave_buffer())
+
+
+def get_autosave_page_service(db: AsyncSession = Depends(get_db)) -> AutosavePageService:
+    """Get autosave page service instance."""
+    return AutosavePageService(get_page_repository(db), get_search_index(db), get_autosave_buffer())
+
+
+def get_move_page_service(db: AsyncSession = Depends(get_db)) -> MovePageService:
+    """Get move page service instance."""
+    return MovePageService(get_page_repository(db), get_autosave_buffer())
 
 
 def get_delete_page_service(db: AsyncSession = Depends(get_db)) -> DeletePageService:
     """Get delete page service instance."""
-    return DeletePageService(get_page_repository(db))
+    return DeletePageService(get_page_repository(db), get_search_index(db))
 
 
 def get_get_pages_service(db: AsyncSession = Depends(get_db)) -> GetPagesService:
     """Get pages query service instance."""
-    return GetPagesService(get_page_repository(db))
+    return GetPagesService(get_page_repository(db), get_autosave_buffer())
+
+
+# Search service factories
+def get_search_pages_service(db: AsyncSession = Depends(get_db)) -> SearchPagesService:
+    """Get search pages service instance."""
+    return SearchPagesService(get_search_repository(db), get_trigram_index())
+
+
+def get_search_suggestions_service() -> GetSearchSuggestionsService:
+    """Get search suggestions service instance."""
+    return GetSearchSuggestionsService(get_prefix_index())
+
+
+def get_page_highlights_service(db: AsyncSession = Depends(get_db)) -> GetPageHighlightsService:
+    """Get page highlights service instance."""
+    return GetPageHighlightsService(get_highlight_repository(db))
+
+
+@lru_cache()
+def get_page_reindexer() -> PageReindexer:
+    """Get the process-wide search reindex job."""
+    return PageReindexer(AsyncSessionLocal, get_reindex_search_index)
+
 
+def get_reindex_pages_service() -> ReindexPagesService:
+    """Get reindex pages service instance."""
+    return ReindexPagesService(get_page_reindexer())
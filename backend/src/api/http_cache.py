@@ -0,0 +1,45 @@
+"""HTTP validators for conditional GET requests."""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Optional
+
+from fastapi import Request
+
+
+def make_etag(*parts) -> str:
+    """
+    Strong ETag derived from the given version parts (ids, timestamps, ...).
+    
+    Include the resource kind and id, so different resources with the same
+    version never share an ETag.
+    """
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=12)
+    return f'"{digest.hexdigest()}"'
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """
+    Headers that let clients cache a response and revalidate it.
+    
+    Args:
+        etag: ETag of the representation.
+        last_modified: Naive UTC timestamp of the last change, if known.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.replace(tzinfo=timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already matches ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # Weak comparison, as required for If-None-Match
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
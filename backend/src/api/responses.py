@@ -0,0 +1,21 @@
+"""JSON responses encoded with orjson straight from domain objects."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that serializes domain dataclasses directly.
+
+    orjson encodes dataclasses, datetimes and lists natively, so routes can
+    return repository results without building Pydantic response models.
+    FastAPI returns a ``Response`` as-is, skipping ``response_model``
+    validation; the route's ``response_model`` still documents the shape,
+    so the dataclass fields must match it.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -0,0 +1,81 @@
+"""API router for administrative operations."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.api.dependencies import get_reindex_pages_service
+from src.api.schemas import ReindexProgressResponse
+from src.core.commands.search_commands import ReindexPagesCommand
+from src.core.domain.reindex_progress import ReindexProgress
+from src.core.services.reindex_pages_service import ReindexPagesService, MAX_REINDEX_BATCH_SIZE
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["admin"],
+)
+
+
+def _to_response(progress: ReindexProgress) -> ReindexProgressResponse:
+    return ReindexProgressResponse(
+        status=progress.status,
+        total=progress.total,
+        processed=progress.processed,
+        updated=progress.updated,
+        batch_size=progress.batch_size,
+        started_at=progress.started_at,
+        finished_at=progress.finished_at,
+        error=progress.error
+    )
+
+
+@router.post(
+    "/reindex", response_model=ReindexProgressResponse, status_code=status.HTTP_202_ACCEPTED
+)
+async def start_reindex(
+    batch_size: int = Query(default=200, ge=1, le=MAX_REINDEX_BATCH_SIZE),
+    rebuild_fulltext: bool = Query(default=False),
+    service: ReindexPagesService = Depends(get_reindex_pages_service),
+):
+    """
+    Rebuild page search data in the background.
+    
+    Recomputes each page's plain text and refreshes the search indexes,
+    one short transaction per batch of pages.
+    
+    Args:
+        batch_size: Number of pages per batch.
+        rebuild_fulltext: First rebuild the SQLite FTS5 index from the
+            pages table in one transaction; run it after a ``VACUUM``.
+    
+    Returns:
+        Progress of the started reindex.
+    
+    Raises:
+        HTTPException: 409 if a reindex is already running.
+    """
+    command = ReindexPagesCommand(batch_size=batch_size, rebuild_fulltext=rebuild_fulltext)
+    result = await service.execute(command)
+    
+    if not result.success:
+        if result.errors:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
+        if "already running" in result.message:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result.message)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message
+        )
+    
+    return _to_response(result.data)
+
+
+@router.get("/reindex", response_model=ReindexProgressResponse)
+async def get_reindex_progress(
+    service: ReindexPagesService = Depends(get_reindex_pages_service),
+):
+    """
+    Get the progress of the current or last reindex.
+    
+    Returns:
+        Reindex progress; ``status`` is ``idle`` if none has run.
+    """
+    result = await service.get_progress()
+    return _to_response(result.data)
@@ -1,7 +1,7 @@
 """API router for notebook operations."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import List, Optional
 
 from src.api.dependencies import (
     get_create_notebook_service,
@@ -9,13 +9,23 @@ from src.api.dependencies import (
     get_delete_notebook_service,
     get_get_notebooks_service
 )
-from src.api.schemas import NotebookCreate, NotebookUpdate, NotebookResponse
+from src.api.http_cache import is_not_modified, make_etag, validator_headers
+from src.api.responses import FastJSONResponse
+from src.api.schemas import (
+    NotebookCreate,
+    NotebookUpdate,
+    NotebookResponse,
+    NotebookTreeResponse,
+    TreeSectionResponse,
+    PageSummaryResponse,
+)
 from src.core.commands.notebook_commands import (
     CreateNotebookCommand,
     UpdateNotebookCommand,
     DeleteNotebookCommand
 )
-from src.core.queries.queries import GetNotebooksQuery, GetNotebookByIdQuery
+from src.core.common.pagination import MAX_LIST_LIMIT
+from src.core.queries.queries import GetNotebooksQuery, GetNotebookByIdQuery, GetNotebookTreeQuery
 from src.core.services.create_notebook_service import CreateNotebookService
 from src.core.services.update_notebook_service import UpdateNotebookService
 from src.core.services.delete_notebook_service import DeleteNotebookService
@@ -29,28 +39,31 @@ router = APIRouter(
 
 @router.get("/", response_model=List[NotebookResponse])
 async def list_notebooks(
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_LIST_LIMIT),
+    cursor: Optional[str] = None,
     service: GetNotebooksService = Depends(get_get_notebooks_service),
 ):
     """
-    List all notebooks.
+    List notebooks, newest first.
+    
+    Args:
+        limit: Optional page size; all notebooks are returned without it.
+        cursor: Opaque cursor from a previous response's ``X-Next-Cursor``.
     
     Returns:
-        List of notebooks with basic information.
+        List of notebooks with basic information. When more remain, the
+        ``X-Next-Cursor`` response header carries the cursor for the next page.
     """
-    query = GetNotebooksQuery(include_deleted=False)
-    result = await service.execute(query)
+    query = GetNotebooksQuery(include_deleted=False, limit=limit, cursor=cursor)
+    result = await service.list_paginated(query)
     
     if not result.success:
+        if result.errors:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message)
     
-    return [NotebookResponse(
-        id=nb.id,
-        name=nb.name,
-        color=nb.color,
-        created_at=nb.created_at,
-        updated_at=nb.updated_at,
-        deleted_at=nb.deleted_at
-    ) for nb in result.data]
+    headers = {"X-Next-Cursor": result.data.next_cursor} if result.data.next_cursor else None
+    return FastJSONResponse(result.data.items, headers=headers)
 
 
 @router.post("/", response_model=NotebookResponse, status_code=status.HTTP_201_CREATED)
@@ -88,11 +101,16 @@ async def create_notebook(
 @router.get("/{notebook_id}", response_model=NotebookResponse)
 async def get_notebook(
     notebook_id: str,
+    request: Request,
+    response: Response,
     service: GetNotebooksService = Depends(get_get_notebooks_service),
 ):
     """
     Get notebook by ID.
     
+    The ETag comes from a version probe that reads ``updated_at`` only;
+    a matching If-None-Match gets 304 Not Modified without loading the notebook.
+    
     Args:
         notebook_id: UUID of the notebook.
     
@@ -100,6 +118,15 @@ async def get_notebook(
         Notebook details with sections.
     """
     query = GetNotebookByIdQuery(id=notebook_id)
+    version = await service.get_version(query)
+    if version.success:
+        etag = make_etag("notebook", notebook_id, version.data)
+        if is_not_modified(request, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag)
+            )
+        response.headers.update(validator_headers(etag))
+    
     result = await service.get_by_id(query)
     
     if not result.success:
@@ -116,6 +143,71 @@ async def get_notebook(
     )
 
 
+@router.get("/{notebook_id}/tree", response_model=NotebookTreeResponse)
+async def get_notebook_tree(
+    notebook_id: str,
+    request: Request,
+    response: Response,
+    service: GetNotebooksService = Depends(get_get_notebooks_service),
+):
+    """
+    Get a notebook's sections and page metadata in one request.
+    
+    Pages carry no content; open a page through ``GET /api/pages/{id}``.
+    The ETag comes from a single aggregate version probe; a matching
+    If-None-Match gets 304 Not Modified without building the tree.
+    
+    Args:
+        notebook_id: UUID of the notebook.
+    
+    Returns:
+        Sections in display order, each with its pages in display order.
+    """
+    query = GetNotebookTreeQuery(notebook_id=notebook_id)
+    version = await service.get_tree_version(query)
+    if version.success:
+        etag = make_etag("tree", notebook_id, version.data)
+        if is_not_modified(request, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag)
+            )
+        response.headers.update(validator_headers(etag))
+    
+    result = await service.get_tree(query)
+    
+    if not result.success:
+        if "not found" in result.message:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=result.message)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message
+        )
+    
+    tree = result.data
+    pages_by_section = {section.id: [] for section in tree.sections}
+    for page in tree.pages:
+        pages_by_section[page.section_id].append(PageSummaryResponse(
+            id=page.id,
+            section_id=page.section_id,
+            parent_page_id=page.parent_page_id,
+            title=page.title,
+            display_order=page.display_order,
+            updated_at=page.updated_at
+        ))
+    
+    return NotebookTreeResponse(
+        notebook_id=tree.notebook_id,
+        sections=[TreeSectionResponse(
+            id=section.id,
+            notebook_id=section.notebook_id,
+            name=section.name,
+            display_order=section.display_order,
+            created_at=section.created_at,
+            updated_at=section.updated_at,
+            pages=pages_by_section[section.id]
+        ) for section in tree.sections]
+    )
+
+
 @router.put("/{notebook_id}", response_model=NotebookResponse)
 async def update_notebook(
     notebook_id: str,
@@ -176,4 +268,3 @@ async def delete_notebook(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=result.message)
     
     return None
-
@@ -1,24 +1,55 @@
 """API router for page operations."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import List, Optional, Union
 
 from src.api.dependencies import (
     get_create_page_service,
+    get_bulk_create_pages_service,
     get_update_page_service,
     get_delete_page_service,
-    get_get_pages_service
+    get_get_pages_service,
+    get_move_page_service,
+    get_autosave_page_service
+)
+from src.api.http_cache import is_not_modified, make_etag, validator_headers
+from src.api.responses import FastJSONResponse
+from src.api.schemas import (
+    AutosaveAck,
+    BreadcrumbItemResponse,
+    BreadcrumbResponse,
+    PageAutosave,
+    PageBulkCreate,
+    PageCreate,
+    PageUpdate,
+    PageMove,
+    PageResponse,
+    PageSummaryResponse,
+    SubtreePageResponse,
 )
-from src.api.schemas import PageCreate, PageUpdate, PageResponse
 from src.core.commands.page_commands import (
     CreatePageCommand,
+    BulkCreatePagesCommand,
+    BulkPageItem,
     UpdatePageCommand,
+    AutosavePageCommand,
+    MovePageCommand,
     DeletePageCommand
 )
-from src.core.queries.queries import GetPagesQuery, GetPageByIdQuery
+from src.core.common.pagination import MAX_LIST_LIMIT
+from src.core.common.text_patch import TextPatch
+from src.core.queries.queries import (
+    GetPagesQuery,
+    GetPageByIdQuery,
+    GetPageBreadcrumbQuery,
+    GetPageSubtreeQuery,
+)
 from src.core.services.create_page_service import CreatePageService
+from src.core.services.bulk_create_pages_service import BulkCreatePagesService
 from src.core.services.update_page_service import UpdatePageService
+from src.core.services.autosave_page_service import AutosavePageService
 from src.core.services.delete_page_service import DeletePageService
+from src.core.services.move_page_service import MovePageService
 from src.core.services.get_pages_service import GetPagesService
 
 router = APIRouter(
@@ -27,9 +58,12 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[PageResponse])
+@router.get("/", response_model=Union[List[PageResponse], List[PageSummaryResponse]])
 async def list_pages(
     section_id: Optional[str] = None,
+    view: str = Query(default="full", pattern="^(full|summary)$"),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_LIST_LIMIT),
+    cursor: Optional[str] = None,
     service: GetPagesService = Depends(get_get_pages_service),
 ):
     """
@@ -37,28 +71,27 @@ async def list_pages(
     
     Args:
         section_id: Optional section UUID to filter by.
+        view: ``full`` for complete pages, ``summary`` for metadata only
+            (no ``content``/``content_plain``, which are never loaded).
+        limit: Optional page size; all pages are returned without it.
+        cursor: Opaque cursor from a previous response's ``X-Next-Cursor``.
     
     Returns:
-        List of pages.
+        List of pages in display order, encoded straight from the domain
+        objects. When more remain, the ``X-Next-Cursor`` response header
+        carries the cursor for the next page.
     """
-    query = GetPagesQuery(section_id=section_id, include_deleted=False)
-    result = await service.execute(query)
+    query = GetPagesQuery(section_id=section_id, include_deleted=False, limit=limit, cursor=cursor)
+    result = await service.list_paginated(query, summaries=view == "summary")
     
     if not result.success:
+        if result.errors:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message)
     
-    return [PageResponse(
-        id=page.id,
-        section_id=page.section_id,
-        parent_page_id=page.parent_page_id,
-        title=page.title,
-        content=page.content,
-        content_plain=page.content_plain,
-        display_order=page.display_order,
-        created_at=page.created_at,
-        updated_at=page.updated_at,
-        deleted_at=page.deleted_at
-    ) for page in result.data]
+    headers = {"X-Next-Cursor": result.data.next_cursor} if result.data.next_cursor else None
+    # Page and PageSummary carry exactly the response_model fields
+    return FastJSONResponse(result.data.items, headers=headers)
 
 
 @router.post("/", response_model=PageResponse, status_code=status.HTTP_201_CREATED)
@@ -94,20 +127,68 @@ async def create_page(
         content=page.content,
         content_plain=page.content_plain,
         display_order=page.display_order,
+        version=page.version,
         created_at=page.created_at,
         updated_at=page.updated_at,
         deleted_at=page.deleted_at
     )
 
 
+@router.post("/bulk", response_model=List[PageResponse], status_code=status.HTTP_201_CREATED)
+async def create_pages_bulk(
+    bulk_data: PageBulkCreate,
+    service: BulkCreatePagesService = Depends(get_bulk_create_pages_service),
+):
+    """
+    Create many pages in one request, e.g. for imports and generated notes.
+    
+    All pages are created in one transaction with batched inserts, or none
+    are. A page nests under an earlier page of the same request through
+    ``parent_index``.
+    
+    Args:
+        bulk_data: Pages to create, in order.
+    
+    Returns:
+        Created pages with IDs, in request order.
+    """
+    command = BulkCreatePagesCommand(pages=[
+        BulkPageItem(
+            section_id=item.section_id,
+            title=item.title,
+            content=item.content,
+            parent_page_id=item.parent_page_id,
+            parent_index=item.parent_index,
+            display_order=item.display_order
+        )
+        for item in bulk_data.pages
+    ])
+    
+    result = await service.execute(command)
+    
+    if not result.success:
+        detail = (
+            f"{result.errors[0].field}: {result.errors[0].message}"
+            if result.errors
+            else result.message
+        )
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    
+    return FastJSONResponse(result.data, status_code=status.HTTP_201_CREATED)
+
+
 @router.get("/{page_id}", response_model=PageResponse)
 async def get_page(
     page_id: str,
+    request: Request,
     service: GetPagesService = Depends(get_get_pages_service),
 ):
     """
     Get page by ID.
     
+    The ETag comes from a version probe that reads ``updated_at`` only;
+    a matching If-None-Match gets 304 Not Modified without loading the page.
+    
     Args:
         page_id: UUID of the page.
     
@@ -115,11 +196,131 @@ async def get_page(
         Page details with content.
     """
     query = GetPageByIdQuery(id=page_id)
+    headers = None
+    version = await service.get_version(query)
+    if version.success:
+        etag = make_etag("page", page_id, version.data)
+        headers = validator_headers(etag)
+        if is_not_modified(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
     result = await service.get_by_id(query)
     
     if not result.success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=result.message)
     
+    return FastJSONResponse(result.data, headers=headers)
+
+
+@router.get("/{page_id}/breadcrumb", response_model=BreadcrumbResponse)
+async def get_page_breadcrumb(
+    page_id: str,
+    request: Request,
+    response: Response,
+    service: GetPagesService = Depends(get_get_pages_service),
+):
+    """
+    Get the Notebook > Section > parent pages > page chain of a page.
+    
+    The ETag covers every item's id and ``updated_at``, so renames and
+    moves anywhere in the chain invalidate it; a matching If-None-Match
+    gets 304 Not Modified.
+    
+    Args:
+        page_id: UUID of the page.
+    
+    Returns:
+        Breadcrumb items, outermost first.
+    """
+    query = GetPageBreadcrumbQuery(page_id=page_id)
+    result = await service.get_breadcrumb(query)
+    
+    if not result.success:
+        if "not found" in result.message:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=result.message)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message
+        )
+    
+    breadcrumb = result.data
+    etag = make_etag("breadcrumb", *((item.id, item.updated_at) for item in breadcrumb.items))
+    headers = validator_headers(etag, breadcrumb.last_modified())
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    return BreadcrumbResponse(
+        page_id=breadcrumb.page_id,
+        items=[
+            BreadcrumbItemResponse(id=item.id, kind=item.kind, name=item.name)
+            for item in breadcrumb.items
+        ],
+    )
+
+
+@router.get("/{page_id}/subtree", response_model=List[SubtreePageResponse])
+async def get_page_subtree(
+    page_id: str,
+    max_depth: Optional[int] = Query(default=None, ge=0),
+    service: GetPagesService = Depends(get_get_pages_service),
+):
+    """
+    Get a page and all its nested subpages in pre-order.
+    
+    Args:
+        page_id: UUID of the subtree root.
+        max_depth: Optional number of subpage levels to include
+            (0 returns the root only).
+    
+    Returns:
+        Page metadata with ``depth`` relative to the root, without content.
+    """
+    query = GetPageSubtreeQuery(page_id=page_id, max_depth=max_depth)
+    result = await service.get_subtree(query)
+    
+    if not result.success:
+        if "not found" in result.message:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=result.message)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
+    
+    return FastJSONResponse(result.data)
+
+
+@router.put("/{page_id}", response_model=PageResponse)
+async def update_page(
+    page_id: str,
+    page_data: PageUpdate,
+    service: UpdatePageService = Depends(get_update_page_service),
+):
+    """
+    Update page content and metadata.
+    
+    Args:
+        page_id: UUID of the page.
+        page_data: New fields, and optionally the ``base_version`` they
+            were edited from.
+    
+    Returns:
+        Updated page with its new ``version``. 409 Conflict when the page
+        was saved by someone else since ``base_version``.
+    """
+    command = UpdatePageCommand(
+        id=page_id,
+        title=page_data.title,
+        content=page_data.content,
+        display_order=page_data.display_order,
+        base_version=page_data.base_version
+    )
+    
+    result = await service.execute(command)
+    
+    if not result.success:
+        if "not found" in result.message:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=result.message)
+        if result.message.startswith("Version conflict"):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result.message)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
+    
     page = result.data
     return PageResponse(
         id=page.id,
@@ -129,32 +330,33 @@ async def get_page(
         content=page.content,
         content_plain=page.content_plain,
         display_order=page.display_order,
+        version=page.version,
         created_at=page.created_at,
         updated_at=page.updated_at,
         deleted_at=page.deleted_at
     )
 
 
-@router.put("/{page_id}", response_model=PageResponse)
-async def update_page(
+@router.put("/{page_id}/move", response_model=PageResponse)
+async def move_page(
     page_id: str,
-    page_data: PageUpdate,
-    service: UpdatePageService = Depends(get_update_page_service),
+    move_data: PageMove,
+    service: MovePageService = Depends(get_move_page_service),
 ):
     """
-    Update page content and metadata.
+    Move a page, with its subpages, under another parent page.
     
     Args:
         page_id: UUID of the page.
+        move_data: New parent (``null`` for top level) and display order.
     
     Returns:
-        Updated page.
+        Moved page.
     """
-    command = UpdatePageCommand(
+    command = MovePageCommand(
         id=page_id,
-        title=page_data.title,
-        content=page_data.content,
-        display_order=page_data.display_order
+        parent_page_id=move_data.parent_page_id,
+        display_order=move_data.display_order
     )
     
     result = await service.execute(command)
@@ -173,6 +375,7 @@ async def update_page(
         content=page.content,
         content_plain=page.content_plain,
         display_order=page.display_order,
+        version=page.version,
         created_at=page.created_at,
         updated_at=page.updated_at,
         deleted_at=page.deleted_at
@@ -202,27 +405,33 @@ async def delete_page(
     return None
 
 
-@router.post("/{page_id}/autosave", response_model=PageResponse)
+@router.post("/{page_id}/autosave", response_model=AutosaveAck)
 async def autosave_page(
     page_id: str,
-    page_data: PageUpdate,
-    service: UpdatePageService = Depends(get_update_page_service),
+    autosave_data: PageAutosave,
+    service: AutosavePageService = Depends(get_autosave_page_service),
 ):
     """
-    Auto-save page content (debounced updates).
+    Auto-save page edits (debounced updates).
+    
+    Send ``patches`` computed against ``base_version`` rather than the whole
+    document; ``content`` replaces it outright. The reply carries only the
+    new version to base the next autosave on.
     
     Args:
         page_id: UUID of the page.
+        autosave_data: Patches and their base version, or the full content.
     
     Returns:
-        Success confirmation with timestamp.
+        The page's new version and timestamp. 409 Conflict when
+        ``base_version`` is stale; resend the full content or reload.
     """
-    # For auto-save, use the same update logic
-    command = UpdatePageCommand(
+    command = AutosavePageCommand(
         id=page_id,
-        title=page_data.title,
-        content=page_data.content,
-        display_order=page_data.display_order
+        base_version=autosave_data.base_version,
+        patches=[TextPatch(start=p.start, end=p.end, text=p.text) for p in autosave_data.patches],
+        content=autosave_data.content,
+        title=autosave_data.title
     )
     
     result = await service.execute(command)
@@ -230,18 +439,9 @@ async def autosave_page(
     if not result.success:
         if "not found" in result.message:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=result.message)
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
+        if result.message.startswith("Version conflict"):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result.message)
+        detail = result.errors[0].message if result.errors else result.message
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
     
-    page = result.data
-    return PageResponse(
-        id=page.id,
-        section_id=page.section_id,
-        parent_page_id=page.parent_page_id,
-        title=page.title,
-        content=page.content,
-        content_plain=page.content_plain,
-        display_order=page.display_order,
-        created_at=page.created_at,
-        updated_at=page.updated_at,
-        deleted_at=page.deleted_at
-    )
+    return FastJSONResponse(result.data)
@@ -1,9 +1,33 @@
 """API router for search operations."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from src.api.dependencies import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.api.dependencies import (
+    get_page_highlights_service,
+    get_search_pages_service,
+    get_search_suggestions_service,
+)
+from src.api.schemas import (
+    HighlightRangeResponse,
+    HighlightsResponse,
+    SearchResponse,
+    SearchResultResponse,
+    SuggestionsResponse,
+    SuggestionResponse,
+)
+from src.core.queries.queries import (
+    GetPageHighlightsQuery,
+    SearchPagesQuery,
+    SearchSuggestionsQuery,
+)
+from src.core.services.get_page_highlights_service import GetPageHighlightsService
+from src.core.services.search_pages_service import SearchPagesService, MAX_SEARCH_LIMIT
+from src.core.services.get_search_suggestions_service import (
+    GetSearchSuggestionsService,
+    MAX_SUGGESTION_LIMIT,
+)
 
 router = APIRouter(
     prefix="/api/search",
@@ -11,37 +35,142 @@ router = APIRouter(
 )
 
 
-@router.get("/")
+@router.get("/", response_model=SearchResponse)
 async def search_pages(
     q: str = "",
-    db: AsyncSession = Depends(get_db),
+    notebook_id: Optional[str] = None,
+    section_id: Optional[str] = None,
+    limit: int = Query(default=20, ge=1, le=MAX_SEARCH_LIMIT),
+    cursor: Optional[str] = None,
+    fuzzy: bool = True,
+    service: SearchPagesService = Depends(get_search_pages_service),
 ):
     """
     Full-text search across pages.
     
     Args:
         q: Search query string.
+        notebook_id: Optional notebook UUID to restrict results to.
+        section_id: Optional section UUID to restrict results to.
+        limit: Maximum number of results to return.
+        cursor: Opaque cursor from a previous response's ``next_cursor``.
+        fuzzy: Retry with a spelling-corrected query when the exact query
+            finds too few pages.
     
     Returns:
-        List of matching pages with highlights.
+        List of matching pages with highlights, best matches first, and the
+        cursor for the next page of results. ``corrected_query`` is set when
+        the results are for a corrected query; pass it as ``q`` together
+        with ``next_cursor`` to fetch the next page.
     """
-    # TODO: Implement in Phase 6 (User Story 4)
-    return {"results": [], "query": q}
+    query = SearchPagesQuery(
+        q=q,
+        notebook_id=notebook_id,
+        section_id=section_id,
+        limit=limit,
+        cursor=cursor,
+        fuzzy=fuzzy
+    )
+    result = await service.execute(query)
+    
+    if not result.success:
+        if result.errors:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message
+        )
+    
+    return SearchResponse(
+        query=q,
+        results=[SearchResultResponse(
+            id=hit.page_id,
+            section_id=hit.section_id,
+            notebook_id=hit.notebook_id,
+            title=hit.title,
+            snippet=hit.snippet,
+            rank=hit.rank
+        ) for hit in result.data.hits],
+        next_cursor=result.data.next_cursor,
+        corrected_query=result.data.corrected_query
+    )
 
 
-@router.get("/suggest")
+@router.get("/suggest", response_model=SuggestionsResponse)
 async def search_suggestions(
     q: str = "",
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(default=10, ge=1, le=MAX_SUGGESTION_LIMIT),
+    service: GetSearchSuggestionsService = Depends(get_search_suggestions_service),
 ):
     """
     Get search suggestions/autocomplete.
     
+    Served from the in-memory prefix index; no database access.
+    
     Args:
         q: Partial search query.
+        limit: Maximum number of suggestions.
     
     Returns:
         List of suggested completions.
     """
-    # TODO: Implement in Phase 6 (User Story 4)
-    return {"suggestions": [], "query": q}
+    query = SearchSuggestionsQuery(q=q, limit=limit)
+    result = await service.execute(query)
+    
+    if not result.success:
+        if result.errors:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message
+        )
+    
+    return SuggestionsResponse(
+        query=q,
+        suggestions=[SuggestionResponse(
+            text=suggestion.text,
+            kind=suggestion.kind,
+            page_id=suggestion.page_id,
+            count=suggestion.count
+        ) for suggestion in result.data]
+    )
+
+
+@router.get("/pages/{page_id}/highlights", response_model=HighlightsResponse)
+async def get_page_highlights(
+    page_id: str,
+    q: str = "",
+    service: GetPageHighlightsService = Depends(get_page_highlights_service),
+):
+    """
+    Get search-term highlight ranges for an opened page.
+    
+    Ranges come from token offsets stored when the page was indexed, so
+    the page content is not re-scanned per request.
+    
+    Args:
+        page_id: Page UUID.
+        q: Search query whose words should be highlighted.
+    
+    Returns:
+        Character ranges into the page's Markdown content, in order.
+    """
+    query = GetPageHighlightsQuery(page_id=page_id, q=q)
+    result = await service.execute(query)
+    
+    if not result.success:
+        if result.errors:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
+        if "not found" in result.message:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=result.message)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message
+        )
+    
+    return HighlightsResponse(
+        page_id=page_id,
+        query=q,
+        ranges=[HighlightRangeResponse(
+            start=highlight.start,
+            end=highlight.end,
+            term=highlight.term
+        ) for highlight in result.data]
+    )
@@ -1,6 +1,6 @@
 """API router for section operations."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from typing import List, Optional
 
 from src.api.dependencies import (
@@ -10,6 +10,8 @@ from src.api.dependencies import (
     get_get_sections_service,
     get_reorder_sections_service
 )
+from src.api.http_cache import is_not_modified, make_etag, validator_headers
+from src.api.responses import FastJSONResponse
 from src.api.schemas import SectionCreate, SectionUpdate, SectionResponse
 from src.core.commands.section_commands import (
     CreateSectionCommand,
@@ -17,6 +19,7 @@ from src.core.commands.section_commands import (
     DeleteSectionCommand,
     ReorderSectionsCommand
 )
+from src.core.common.pagination import MAX_LIST_LIMIT
 from src.core.queries.queries import GetSectionsQuery, GetSectionByIdQuery
 from src.core.services.create_section_service import CreateSectionService
 from src.core.services.update_section_service import UpdateSectionService
@@ -33,6 +36,8 @@ router = APIRouter(
 @router.get("/", response_model=List[SectionResponse])
 async def list_sections(
     notebook_id: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_LIST_LIMIT),
+    cursor: Optional[str] = None,
     service: GetSectionsService = Depends(get_get_sections_service),
 ):
     """
@@ -40,25 +45,25 @@ async def list_sections(
     
     Args:
         notebook_id: Optional notebook UUID to filter by.
+        limit: Optional page size; all sections are returned without it.
+        cursor: Opaque cursor from a previous response's ``X-Next-Cursor``.
     
     Returns:
-        List of sections.
+        List of sections in display order. When more remain, the
+        ``X-Next-Cursor`` response header carries the cursor for the next page.
     """
-    query = GetSectionsQuery(notebook_id=notebook_id, include_deleted=False)
-    result = await service.execute(query)
+    query = GetSectionsQuery(
+        notebook_id=notebook_id, include_deleted=False, limit=limit, cursor=cursor
+    )
+    result = await service.list_paginated(query)
     
     if not result.success:
+        if result.errors:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result.message)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.message)
     
-    return [SectionResponse(
-        id=section.id,
-        notebook_id=section.notebook_id,
-        name=section.name,
-        display_order=section.display_order,
-        created_at=section.created_at,
-        updated_at=section.updated_at,
-        deleted_at=section.deleted_at
-    ) for section in result.data]
+    headers = {"X-Next-Cursor": result.data.next_cursor} if result.data.next_cursor else None
+    return FastJSONResponse(result.data.items, headers=headers)
 
 
 @router.post("/", response_model=SectionResponse, status_code=status.HTTP_201_CREATED)
@@ -98,11 +103,16 @@ async def create_section(
 @router.get("/{section_id}", response_model=SectionResponse)
 async def get_section(
     section_id: str,
+    request: Request,
+    response: Response,
     service: GetSectionsService = Depends(get_get_sections_service),
 ):
     """
     Get section by ID.
     
+    The ETag comes from a version probe that reads ``updated_at`` only;
+    a matching If-None-Match gets 304 Not Modified without loading the section.
+    
     Args:
         section_id: UUID of the section.
     
@@ -110,6 +120,15 @@ async def get_section(
         Section details with pages.
     """
     query = GetSectionByIdQuery(id=section_id)
+    version = await service.get_version(query)
+    if version.success:
+        etag = make_etag("section", section_id, version.data)
+        if is_not_modified(request, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag)
+            )
+        response.headers.update(validator_headers(etag))
+    
     result = await service.get_by_id(query)
     
     if not result.success:
@@ -1,9 +1,11 @@
 """Pydantic schemas for API request/response models."""
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
+from src.core.commands.page_commands import MAX_BULK_PAGES
+
 
 # Notebook schemas
 class NotebookCreate(BaseModel):
@@ -69,11 +71,65 @@ class PageCreate(BaseModel):
     display_order: int = Field(default=0, ge=0)
 
 
+class PageBulkItem(PageCreate):
+    """
+    Schema for one page of a bulk create.
+    
+    ``parent_index`` nests the page under an earlier item of the same
+    request, instead of an existing ``parent_page_id``.
+    """
+    parent_index: Optional[int] = Field(None, ge=0)
+
+
+class PageBulkCreate(BaseModel):
+    """Schema for creating many pages in one request."""
+    pages: List[PageBulkItem] = Field(..., min_length=1, max_length=MAX_BULK_PAGES)
+
+
 class PageUpdate(BaseModel):
-    """Schema for updating a page."""
+    """
+    Schema for updating a page.
+    
+    ``base_version`` is the page ``version`` the edit started from; the
+    update is refused when the page has been saved since.
+    """
     title: Optional[str] = Field(None, min_length=1, max_length=255)
     content: Optional[str] = None
     display_order: Optional[int] = Field(None, ge=0)
+    base_version: Optional[int] = Field(None, ge=1)
+
+
+class ContentPatch(BaseModel):
+    """Replace ``content[start:end]`` (character offsets into the base version) with ``text``."""
+    start: int = Field(..., ge=0)
+    end: int = Field(..., ge=0)
+    text: str = ""
+
+
+class PageAutosave(BaseModel):
+    """
+    Schema for an autosave: patches against ``base_version``, or the full content.
+    
+    ``base_version`` is the ``version`` of the previous autosave ack, or the
+    page's ``version`` as last returned by the API.
+    """
+    base_version: Optional[int] = Field(None, ge=1)
+    patches: List[ContentPatch] = Field(default_factory=list)
+    content: Optional[str] = None
+    title: Optional[str] = Field(None, min_length=1, max_length=255)
+
+
+class AutosaveAck(BaseModel):
+    """Schema for an autosave acknowledgement."""
+    id: str
+    version: int
+    updated_at: Optional[datetime]
+
+
+class PageMove(BaseModel):
+    """Schema for moving a page under another parent."""
+    parent_page_id: Optional[str] = None
+    display_order: int = Field(default=0, ge=0)
 
 
 class PageResponse(BaseModel):
@@ -85,9 +141,115 @@ class PageResponse(BaseModel):
     content: str
     content_plain: str
     display_order: int
+    version: int
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
     deleted_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
+
+
+# Notebook tree schemas
+class PageSummaryResponse(BaseModel):
+    """Schema for page metadata in the notebook tree."""
+    id: str
+    section_id: str
+    parent_page_id: Optional[str] = None
+    title: str
+    display_order: int
+    updated_at: Optional[datetime] = None
+
+
+class SubtreePageResponse(PageSummaryResponse):
+    """Schema for a page in a subpage hierarchy."""
+    depth: int
+
+
+class BreadcrumbItemResponse(BaseModel):
+    """Schema for one breadcrumb link."""
+    id: str
+    kind: str
+    name: str
+
+
+class BreadcrumbResponse(BaseModel):
+    """Schema for a page's breadcrumb, outermost item first."""
+    page_id: str
+    items: List[BreadcrumbItemResponse]
+
+
+class TreeSectionResponse(BaseModel):
+    """Schema for a section and its pages in the notebook tree."""
+    id: str
+    notebook_id: str
+    name: str
+    display_order: int
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    pages: List[PageSummaryResponse]
+
+
+class NotebookTreeResponse(BaseModel):
+    """Schema for a notebook's navigation tree."""
+    notebook_id: str
+    sections: List[TreeSectionResponse]
+
+
+# Search schemas
+class SearchResultResponse(BaseModel):
+    """Schema for a single search hit."""
+    id: str
+    section_id: str
+    notebook_id: Optional[str] = None
+    title: str
+    snippet: str
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    """Schema for search results."""
+    query: str
+    results: List[SearchResultResponse]
+    next_cursor: Optional[str] = None
+    corrected_query: Optional[str] = None
+
+
+class HighlightRangeResponse(BaseModel):
+    """Schema for one highlighted term occurrence."""
+    start: int
+    end: int
+    term: str
+
+
+class HighlightsResponse(BaseModel):
+    """Schema for search-term highlights in a page's content."""
+    page_id: str
+    query: str
+    ranges: List[HighlightRangeResponse]
+
+
+class SuggestionResponse(BaseModel):
+    """Schema for a single autocomplete suggestion."""
+    text: str
+    kind: str
+    page_id: Optional[str] = None
+    count: int = 0
+
+
+class SuggestionsResponse(BaseModel):
+    """Schema for autocomplete suggestions."""
+    query: str
+    suggestions: List[SuggestionResponse]
+
+
+class ReindexProgressResponse(BaseModel):
+    """Schema for search reindex progress."""
+    status: str
+    total: int
+    processed: int
+    updated: int
+    batch_size: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
@@ -12,7 +12,14 @@ const AppState = {
     currentSectionId: null,
     currentPageId: null,
     markdownEditor: null,
-    isDirty: false
+    isDirty: false,
+    // Content and version of the last saved state; autosaves send patches against it
+    savedContent: '',
+    pageVersion: null,
+    // Set when an autosave finds the page saved elsewhere; autosave pauses until Save or reload
+    versionConflict: false,
+    autosaveTimer: null,
+    autosaveRunning: false
 };
 
 // Utility functions
@@ -209,18 +216,14 @@ const NotebookManager = {
 const TreeViewManager = {
     async loadTreeView(notebookId) {
         try {
-            // Load sections
-            const sectionsResponse = await fetch(`/api/sections/?notebook_id=${notebookId}`);
-            if (!sectionsResponse.ok) throw new Error('Failed to load sections');
-            AppState.sections = await sectionsResponse.json();
+            // Load sections and page metadata in one request; page content
+            // is fetched when a page is opened
+            const treeResponse = await fetch(`/api/notebooks/${notebookId}/tree`);
+            if (!treeResponse.ok) throw new Error('Failed to load notebook tree');
+            const tree = await treeResponse.json();
             
-            // Load all pages for this notebook
-            const pagesPromises = AppState.sections.map(section =>
-                fetch(`/api/pages/?section_id=${section.id}`).then(r => r.json())
-            );
-            
-            const pagesArrays = await Promise.all(pagesPromises);
-            AppState.pages = pagesArrays.flat();
+            AppState.sections = tree.sections;
+            AppState.pages = tree.sections.flatMap(section => section.pages);
             
             this.renderTreeView();
         } catch (error) {
@@ -437,6 +440,8 @@ const SectionManager = {
 // Page Management
 const PageManager = {
     async selectPage(pageId) {
+        await AutosaveManager.flush();
+        
         // Check if there are unsaved changes
         if (AppState.isDirty) {
             if (!confirm('You have unsaved changes. Do you want to continue without saving?')) {
@@ -480,28 +485,38 @@ const PageManager = {
         
         const content = AppState.markdownEditor.value();
         const title = document.getElementById('pageTitle').textContent;
+        AutosaveManager.cancel();
+        const put = (baseVersion) => fetch(`/api/pages/${AppState.currentPageId}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ 
+                title,
+                content,
+                section_id: AppState.currentSectionId,
+                base_version: baseVersion
+            })
+        });
         
         try {
-            const response = await fetch(`/api/pages/${AppState.currentPageId}`, {
-                method: 'PUT',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ 
-                    title,
-                    content,
-                    section_id: AppState.currentSectionId
-                })
-            });
+            let response = await put(AppState.pageVersion);
+            if (response.status === 409) {
+                if (!confirm('This page was changed elsewhere since you opened it. Overwrite those changes?')) {
+                    return;
+                }
+                response = await put(null);
+            }
             
             if (!response.ok) throw new Error('Failed to save page');
             
-            AppState.isDirty = false;
+            const page = await response.json();
+            AutosaveManager.setBase(content, page.version);
+            AppState.isDirty = AppState.markdownEditor.value() !== content;
             Utils.showSuccess('Page saved successfully');
             
             // Update the tree view
             await TreeViewManager.loadTreeView(AppState.currentNotebookId);
             
             // Update metadata
-            const page = await response.json();
             document.getElementById('pageMeta').textContent = 
                 `Last updated: ${Utils.formatDate(page.updated_at)}`;
         } catch (error) {
@@ -599,7 +614,10 @@ const EditorManager = {
         });
         
         AppState.markdownEditor.codemirror.on('change', () => {
+            // Loading a page into the editor also fires change
+            if (AppState.markdownEditor.value() === AppState.savedContent) return;
             AppState.isDirty = true;
+            AutosaveManager.schedule();
         });
     },
     
@@ -611,6 +629,8 @@ const EditorManager = {
         document.getElementById('pageMeta').textContent = 
             `Last updated: ${Utils.formatDate(page.updated_at)}`;
         
+        AutosaveManager.cancel();
+        AutosaveManager.setBase(page.content || '', page.version);
         if (AppState.markdownEditor) {
             AppState.markdownEditor.value(page.content || '');
             AppState.isDirty = false;
@@ -621,6 +641,8 @@ const EditorManager = {
         document.getElementById('welcomeScreen').style.display = 'flex';
         document.getElementById('editorContainer').style.display = 'none';
         
+        AutosaveManager.cancel();
+        AutosaveManager.setBase('', null);
         if (AppState.markdownEditor) {
             AppState.markdownEditor.value('');
             AppState.isDirty = false;
@@ -628,6 +650,101 @@ const EditorManager = {
     }
 };
 
+// Autosave: sends only what changed since the last acknowledged version
+const AutosaveManager = {
+    delayMs: window.AUTOSAVE_INTERVAL_MS || 3000,
+    
+    schedule() {
+        clearTimeout(AppState.autosaveTimer);
+        AppState.autosaveTimer = setTimeout(() => this.save(), this.delayMs);
+    },
+    
+    cancel() {
+        clearTimeout(AppState.autosaveTimer);
+        AppState.autosaveTimer = null;
+    },
+    
+    async flush() {
+        if (AppState.autosaveTimer) {
+            this.cancel();
+            await this.save();
+        }
+    },
+    
+    setBase(content, version) {
+        AppState.savedContent = content;
+        AppState.pageVersion = version;
+        AppState.versionConflict = false;
+    },
+    
+    // One patch spanning everything between the common prefix and suffix.
+    // Offsets count code points, like the server's string indices.
+    diff(before, after) {
+        const a = Array.from(before);
+        const b = Array.from(after);
+        let start = 0;
+        while (start < a.length && start < b.length && a[start] === b[start]) start++;
+        let endA = a.length;
+        let endB = b.length;
+        while (endA > start && endB > start && a[endA - 1] === b[endB - 1]) {
+            endA--;
+            endB--;
+        }
+        return { start, end: endA, text: b.slice(start, endB).join('') };
+    },
+    
+    post(pageId, body) {
+        return fetch(`/api/pages/${pageId}/autosave`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(body)
+        });
+    },
+    
+    async save() {
+        AppState.autosaveTimer = null;
+        if (!AppState.currentPageId || !AppState.markdownEditor || !AppState.isDirty) return;
+        if (AppState.versionConflict) return;
+        if (AppState.autosaveRunning) {
+            this.schedule();
+            return;
+        }
+        
+        const pageId = AppState.currentPageId;
+        const content = AppState.markdownEditor.value();
+        if (content === AppState.savedContent) {
+            AppState.isDirty = false;
+            return;
+        }
+        const body = AppState.pageVersion
+            ? { base_version: AppState.pageVersion, patches: [this.diff(AppState.savedContent, content)] }
+            : { content };
+        
+        AppState.autosaveRunning = true;
+        try {
+            const response = await this.post(pageId, body);
+            if (response.status === 409) {
+                // Saved elsewhere since our base version; only an explicit Save may overwrite it
+                AppState.versionConflict = true;
+                Utils.showError('This page was changed elsewhere. Save to overwrite those changes, or reopen the page.');
+                return;
+            }
+            if (!response.ok) throw new Error('Failed to autosave page');
+            
+            const ack = await response.json();
+            if (AppState.currentPageId !== pageId) return;
+            this.setBase(content, ack.version);
+            AppState.isDirty = AppState.markdownEditor.value() !== content;
+            document.getElementById('pageMeta').textContent = 
+                `Last updated: ${Utils.formatDate(ack.updated_at)}`;
+        } catch (error) {
+            console.error('Error autosaving page:', error);
+        } finally {
+            AppState.autosaveRunning = false;
+        }
+    }
+};
+
 // Search functionality
 const SearchManager = {
     async search(query) {
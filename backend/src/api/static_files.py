@@ -0,0 +1,109 @@
+"""
+Static files served from precompressed variants.
+
+``precompress_directory`` writes ``.br`` (when brotli is installed) and
+``.gz`` files next to each compressible asset at maximum compression, so
+no CPU is spent per request. ``PrecompressedStaticFiles`` serves the best
+variant the client accepts, with the original media type. Run it as part
+of a build, or let the application do it at startup:
+
+    python -m src.api.static_files src/api/static
+"""
+
+import logging
+import os
+import sys
+from mimetypes import guess_type
+from pathlib import Path
+from typing import Union
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from src.api.middleware.compression import accepted_encodings, available_encodings, compress
+
+logger = logging.getLogger(__name__)
+
+PRECOMPRESSED_SUFFIXES = (".css", ".html", ".js", ".json", ".map", ".svg", ".txt")
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+MAX_LEVELS = {"br": 11, "gzip": 9}
+
+
+def precompress_directory(directory: Union[str, Path]) -> int:
+    """
+    Write compressed variants of the text assets under ``directory``.
+
+    Variants newer than their source are kept, so repeated runs only
+    touch changed files.
+
+    Returns:
+        Number of variant files written.
+    """
+    written = 0
+    for path in Path(directory).rglob("*"):
+        if not path.is_file() or path.suffix not in PRECOMPRESSED_SUFFIXES:
+            continue
+        data = None
+        for encoding in available_encodings():
+            variant = path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+            if variant.exists() and variant.stat().st_mtime >= path.stat().st_mtime:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            encoded = compress(data, encoding, MAX_LEVELS[encoding])
+            if len(encoded) >= len(data):
+                continue
+            try:
+                variant.write_bytes(encoded)
+            except OSError as e:  # read-only deployments fall back to on-the-fly compression
+                logger.warning("Cannot write %s: %s", variant, e)
+                return written
+            written += 1
+    return written
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that answers with a ``.br``/``.gz`` variant when the client accepts it."""
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        for encoding in available_encodings():
+            if encoding not in accepted:
+                continue
+            variant = str(full_path) + ENCODING_SUFFIXES[encoding]
+            try:
+                variant_stat = os.stat(variant)
+            except OSError:
+                continue
+            if variant_stat.st_mtime < stat_result.st_mtime:
+                continue  # stale variant; the source changed since
+
+            response = FileResponse(
+                variant,
+                status_code=status_code,
+                stat_result=variant_stat,
+                method=scope["method"],
+                media_type=guess_type(str(full_path))[0] or "text/plain",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if Path(full_path).suffix in PRECOMPRESSED_SUFFIXES:
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "src/api/static"
+    print(f"Wrote {precompress_directory(target)} compressed variants under {target}")
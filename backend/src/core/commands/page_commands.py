@@ -1,7 +1,12 @@
 """Command objects for page operations."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.core.common.text_patch import TextPatch
+
+# Pages accepted by one bulk create
+MAX_BULK_PAGES = 500
 
 
 @dataclass
@@ -14,13 +19,64 @@ class CreatePageCommand:
     display_order: int = 0
 
 
+@dataclass
+class BulkPageItem:
+    """
+    One page of a bulk create.
+    
+    ``parent_index`` nests the page under an earlier item of the same
+    batch; ``parent_page_id`` nests it under an existing page.
+    """
+    section_id: str
+    title: str
+    content: str = ""
+    parent_page_id: Optional[str] = None
+    parent_index: Optional[int] = None
+    display_order: int = 0
+
+
+@dataclass
+class BulkCreatePagesCommand:
+    """Command to create many pages in one batch."""
+    pages: List[BulkPageItem] = field(default_factory=list)
+
+
 @dataclass
 class UpdatePageCommand:
-    """Command to update an existing page."""
+    """
+    Command to update an existing page.
+    
+    With ``base_version`` the update only applies while the page is still
+    at that version; without it, it applies to whatever version is read.
+    """
     id: str
     title: Optional[str] = None
     content: Optional[str] = None
     display_order: Optional[int] = None
+    base_version: Optional[int] = None
+
+
+@dataclass
+class AutosavePageCommand:
+    """
+    Command to save page edits incrementally.
+    
+    Either ``patches`` against the page at ``base_version`` or the full
+    ``content``; a ``base_version`` that is no longer current is a conflict.
+    """
+    id: str
+    base_version: Optional[int] = None
+    patches: List[TextPatch] = field(default_factory=list)
+    content: Optional[str] = None
+    title: Optional[str] = None
+
+
+@dataclass
+class MovePageCommand:
+    """Command to move a page, with its subpages, under another parent."""
+    id: str
+    parent_page_id: Optional[str] = None
+    display_order: int = 0
 
 
 @dataclass
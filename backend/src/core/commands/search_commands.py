@@ -0,0 +1,15 @@
+"""Command objects for search operations."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ReindexPagesCommand:
+    """
+    Command to rebuild search data for every page in batches.
+    
+    ``rebuild_fulltext`` first rebuilds the whole SQLite FTS5 index in one
+    transaction, which is needed after a ``VACUUM`` renumbered page rowids.
+    """
+    batch_size: int = 200
+    rebuild_fulltext: bool = False
@@ -0,0 +1,45 @@
+"""Opaque keyset pagination cursors."""
+
+import base64
+import binascii
+import json
+from typing import Any, Tuple
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last returned row as an opaque token.
+
+    Args:
+        values: JSON-serializable sort key components, e.g. ``(rank, id)``.
+
+    Returns:
+        URL-safe token to hand back to the client.
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, arity: int) -> Tuple[Any, ...]:
+    """
+    Decode a token produced by :func:`encode_cursor`.
+
+    Args:
+        token: Cursor received from the client.
+        arity: Expected number of sort key components.
+
+    Returns:
+        The sort key components.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Malformed cursor") from e
+
+    if not isinstance(values, list) or len(values) != arity:
+        raise ValueError("Malformed cursor")
+    return tuple(values)
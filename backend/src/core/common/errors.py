@@ -0,0 +1,11 @@
+"""Errors raised across layer boundaries."""
+
+
+class VersionConflictError(Exception):
+    """
+    A write was based on a version of an entity that is no longer current.
+
+    Raised by repositories whose conditional update matched no row; the
+    message starts with ``Version conflict`` so services can pass it on
+    as a failed ``Result`` that the API maps to 409 Conflict.
+    """
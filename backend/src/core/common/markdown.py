@@ -0,0 +1,27 @@
+"""Markdown helpers shared by the page services and the search reindex."""
+
+import re
+from typing import Iterable, List
+
+# Applied in order; compiled once for every page converted
+_PLAIN_TEXT_RULES = (
+    (re.compile(r'```[\s\S]*?```'), ''),  # Remove code blocks
+    (re.compile(r'`[^`]*`'), ''),  # Remove inline code
+    (re.compile(r'\[([^\]]+)\]\([^\)]+\)'), r'\1'),  # Remove links but keep text
+    (re.compile(r'!\[([^\]]*)\]\([^\)]+\)'), ''),  # Remove images
+    (re.compile(r'^#+\s+', flags=re.MULTILINE), ''),  # Remove headers
+    (re.compile(r'[*_]{1,2}([^*_]+)[*_]{1,2}'), r'\1'),  # Remove bold/italic
+)
+
+
+def extract_plain_text(markdown_content: str) -> str:
+    """Extract plain text from markdown for search indexing."""
+    text = markdown_content
+    for pattern, replacement in _PLAIN_TEXT_RULES:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+def extract_plain_texts(markdown_contents: Iterable[str]) -> List[str]:
+    """Extract plain text from a batch of markdown documents, in order."""
+    return [extract_plain_text(content) for content in markdown_contents]
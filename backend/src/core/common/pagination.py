@@ -0,0 +1,58 @@
+"""Keyset pagination for list queries."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from src.core.common.cursor import encode_cursor, decode_cursor
+
+T = TypeVar('T')
+
+MAX_LIST_LIMIT = 500
+
+
+@dataclass
+class Paginated(Generic[T]):
+    """
+    One page of a listing.
+    
+    ``next_cursor`` is an opaque keyset cursor for the following page, or
+    ``None`` when there are no more items.
+    """
+    
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def fetch_limit(limit: Optional[int]) -> Optional[int]:
+    """Rows to fetch for a page of ``limit`` items: one extra to detect a next page."""
+    return limit + 1 if limit else None
+
+
+def paginate(
+    items: Sequence[T], limit: Optional[int], sort_key: Callable[[T], Tuple[Any, ...]]
+) -> Paginated[T]:
+    """
+    Trim a :func:`fetch_limit` result to ``limit`` items and derive the next cursor.
+    
+    Args:
+        items: Rows fetched in sort order.
+        limit: Requested page size, or ``None`` for everything.
+        sort_key: JSON-serializable sort key of an item, e.g. ``(display_order, id)``.
+    """
+    if limit is None or len(items) <= limit:
+        return Paginated(items=list(items))
+    items = list(items[:limit])
+    return Paginated(items=items, next_cursor=encode_cursor(*sort_key(items[-1])))
+
+
+def decode_order_cursor(token: str) -> Tuple[int, str]:
+    """
+    Decode a ``(display_order, id)`` cursor.
+    
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    display_order, entity_id = decode_cursor(token, 2)
+    if not isinstance(display_order, int) or not isinstance(entity_id, str):
+        raise ValueError("Malformed cursor")
+    return display_order, entity_id
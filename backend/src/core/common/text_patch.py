@@ -0,0 +1,44 @@
+"""Text patches for incremental content updates."""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass
+class TextPatch:
+    """
+    Replace ``text[start:end]`` with ``text``.
+
+    Offsets are in characters (code points) of the base text the patch
+    was computed against, not of the text produced by earlier patches.
+    """
+
+    start: int
+    end: int
+    text: str = ""
+
+
+def apply_patches(base: str, patches: Sequence[TextPatch]) -> str:
+    """
+    Apply non-overlapping patches, all expressed against ``base``.
+
+    Args:
+        base: Text the patches were computed against.
+        patches: Patches in ascending, non-overlapping ``start`` order.
+
+    Returns:
+        The patched text.
+
+    Raises:
+        ValueError: If a patch is out of range, reversed or overlaps the previous one.
+    """
+    parts = []
+    position = 0
+    for patch in patches:
+        if patch.start < position or patch.end < patch.start or patch.end > len(base):
+            raise ValueError(f"Patch {patch.start}:{patch.end} does not fit the base text")
+        parts.append(base[position:patch.start])
+        parts.append(patch.text)
+        position = patch.end
+    parts.append(base[position:])
+    return "".join(parts)
@@ -0,0 +1,32 @@
+"""Breadcrumb domain entity."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass
+class BreadcrumbItem:
+    """One link of a breadcrumb: a notebook, a section or a page."""
+    
+    id: str
+    kind: str
+    name: str
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class Breadcrumb:
+    """
+    Location of a page: Notebook > Section > parent pages > page.
+    
+    Items are ordered outermost first and end with the page itself.
+    """
+    
+    page_id: str
+    items: List[BreadcrumbItem] = field(default_factory=list)
+    
+    def last_modified(self) -> Optional[datetime]:
+        """Most recent change to any item of the chain."""
+        timestamps = [item.updated_at for item in self.items if item.updated_at]
+        return max(timestamps) if timestamps else None
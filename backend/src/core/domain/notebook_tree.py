@@ -0,0 +1,21 @@
+"""Notebook tree domain entity."""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from src.core.domain.page import PageSummary
+from src.core.domain.section import Section
+
+
+@dataclass
+class NotebookTree:
+    """
+    Structure of a notebook for navigation.
+    
+    Live sections in display order and the metadata of their live pages,
+    ordered by section then page display order.
+    """
+    
+    notebook_id: str
+    sections: List[Section] = field(default_factory=list)
+    pages: List[PageSummary] = field(default_factory=list)
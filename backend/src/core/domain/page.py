@@ -11,6 +11,10 @@ class Page:
     Page domain entity.
     
     Represents an individual note or document within a section.
+    
+    ``version`` counts the page's edits; a write only succeeds against the
+    version it was based on, so concurrent editors cannot overwrite each
+    other unnoticed.
     """
     
     id: str
@@ -20,6 +24,7 @@ class Page:
     content_plain: str = ""
     parent_page_id: Optional[str] = None
     display_order: int = 0
+    version: int = 1
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
@@ -31,19 +36,40 @@ class Page:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Validate title
-        if not self.title or not self.title.strip():
-            return False, "Page title cannot be empty"
-        
-        if len(self.title) > 255:
-            return False, "Page title cannot exceed 255 characters"
+        is_valid, error_msg = self.validate_changes(
+            title=self.title or "", display_order=self.display_order
+        )
+        if not is_valid:
+            return is_valid, error_msg
         
         # Validate section_id
         if not self.section_id:
             return False, "Page must belong to a section"
         
+        return True, None
+    
+    @staticmethod
+    def validate_changes(
+        title: Optional[str] = None, display_order: Optional[int] = None
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Validate new values for a page's editable fields before applying them.
+        
+        Fields left as None are not being changed and are not checked.
+        
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        # Validate title
+        if title is not None:
+            if not title.strip():
+                return False, "Page title cannot be empty"
+            
+            if len(title) > 255:
+                return False, "Page title cannot exceed 255 characters"
+        
         # Validate display order
-        if self.display_order < 0:
+        if display_order is not None and display_order < 0:
             return False, "Display order must be non-negative"
         
         return True, None
@@ -63,3 +89,44 @@ class Page:
     def is_subpage(self) -> bool:
         """Check if this page is a subpage."""
         return self.parent_page_id is not None
+
+
+@dataclass
+class PageRevision:
+    """
+    Acknowledgement of a saved page state.
+    
+    Carries just enough for a client to base its next incremental save on.
+    """
+    
+    id: str
+    version: int
+    updated_at: Optional[datetime]
+
+
+@dataclass
+class PageSummary:
+    """
+    Page metadata without content.
+    
+    Lightweight projection of a page used where only structure is needed,
+    such as the notebook tree.
+    """
+    
+    id: str
+    section_id: str
+    title: str
+    parent_page_id: Optional[str] = None
+    display_order: int = 0
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class PageTreeNode(PageSummary):
+    """
+    Page metadata positioned in a subpage hierarchy.
+    
+    ``depth`` is 0 for the subtree root, 1 for its direct subpages, and so on.
+    """
+    
+    depth: int = 0
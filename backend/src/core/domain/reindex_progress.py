@@ -0,0 +1,28 @@
+"""Search reindex progress domain entity."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class ReindexProgress:
+    """
+    Progress of a search reindex job.
+    
+    ``processed`` counts pages visited so far out of ``total``; ``updated``
+    counts pages whose stored plain text was stale and has been rewritten.
+    """
+    
+    status: str = "idle"
+    total: int = 0
+    processed: int = 0
+    updated: int = 0
+    batch_size: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    
+    def is_running(self) -> bool:
+        """Check if the job is still running."""
+        return self.status == "running"
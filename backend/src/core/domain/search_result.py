@@ -0,0 +1,65 @@
+"""Search result domain entity."""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class SearchHit:
+    """
+    Search hit value object.
+
+    Represents a single page matching a full-text search query.
+    """
+
+    page_id: str
+    section_id: str
+    title: str
+    snippet: str = ""
+    rank: float = 0.0
+    notebook_id: Optional[str] = None
+
+
+@dataclass
+class SearchResults:
+    """
+    One page of search hits.
+
+    ``next_cursor`` is an opaque keyset cursor for the following page, or
+    ``None`` when there are no more hits. ``corrected_query`` is set when
+    the hits are for a spelling-corrected query rather than the original;
+    later pages should be requested with that query.
+    """
+
+    hits: List[SearchHit]
+    next_cursor: Optional[str] = None
+    corrected_query: Optional[str] = None
+
+
+@dataclass
+class Suggestion:
+    """
+    Autocomplete suggestion value object.
+
+    Either a page title (``kind="title"``, with ``page_id``) or a completed
+    query built from a frequent term (``kind="term"``, with ``count`` pages).
+    """
+
+    text: str
+    kind: str
+    page_id: Optional[str] = None
+    count: int = 0
+
+
+@dataclass
+class HighlightRange:
+    """
+    Highlight range value object.
+
+    Marks one occurrence of a search term in a page's Markdown ``content``;
+    ``start`` and ``end`` are character offsets (end exclusive).
+    """
+
+    start: int
+    end: int
+    term: str
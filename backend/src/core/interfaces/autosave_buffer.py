@@ -0,0 +1,43 @@
+"""Autosave buffer interface."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.core.domain.page import Page
+
+
+class IAutosaveBuffer(ABC):
+    """
+    Interface for a write-behind buffer of autosaved pages.
+
+    Only the latest autosave of each page is kept until it is flushed to
+    the repository; readers that need the stored page flush it first.
+    """
+
+    @abstractmethod
+    def get(self, page_id: str) -> Optional[Page]:
+        """Get a copy of the pending state of a page, or None if nothing is buffered."""
+        pass
+
+    @abstractmethod
+    async def put(self, page: Page, base_version: int) -> None:
+        """
+        Buffer a page state, replacing any pending one; it is durable once this returns.
+        
+        Args:
+            page: The page at its new ``version``.
+            base_version: Version the change was applied to. The flush only
+                writes while the stored page is still at the base version of
+                the first change it holds.
+        """
+        pass
+
+    @abstractmethod
+    async def flush(self, page_id: Optional[str] = None) -> int:
+        """
+        Write pending pages (all, or just ``page_id``) to the repository.
+
+        Returns:
+            Number of pages written.
+        """
+        pass
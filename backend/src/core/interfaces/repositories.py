@@ -1,10 +1,14 @@
 """Repository interfaces for domain entities."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
+from src.core.domain.breadcrumb import Breadcrumb
 from src.core.domain.notebook import Notebook
+from src.core.domain.notebook_tree import NotebookTree
 from src.core.domain.section import Section
-from src.core.domain.page import Page
+from src.core.domain.page import Page, PageSummary, PageTreeNode
+from src.core.domain.search_result import HighlightRange, SearchHit
 
 
 class INotebookRepository(ABC):
@@ -21,8 +25,28 @@ class INotebookRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, include_deleted: bool = False) -> List[Notebook]:
-        """Get all notebooks."""
+    async def get_version(self, notebook_id: str) -> Optional[str]:
+        """
+        Get a cheap change token for a notebook without loading the row.
+        
+        The token changes whenever the notebook is updated; ``None`` if it
+        does not exist.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_all(
+        self,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> List[Notebook]:
+        """
+        Get notebooks, newest first.
+        
+        Ordered by ``(created_at, id)`` descending; ``after`` is that key of
+        the last notebook already returned.
+        """
         pass
     
     @abstractmethod
@@ -39,6 +63,27 @@ class INotebookRepository(ABC):
     async def restore(self, notebook_id: str) -> bool:
         """Restore soft-deleted notebook."""
         pass
+    
+    @abstractmethod
+    async def get_page_ids(self, notebook_id: str) -> List[str]:
+        """Get the ids of the live pages in a notebook's live sections."""
+        pass
+    
+    @abstractmethod
+    async def get_tree_version(self, notebook_id: str) -> Optional[str]:
+        """
+        Get a cheap change token for a live notebook's tree.
+        
+        The token changes whenever the notebook or any of its sections or
+        pages is created, updated, moved or deleted; ``None`` if the
+        notebook does not exist.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_tree(self, notebook_id: str) -> Optional[NotebookTree]:
+        """Get a live notebook's sections and page metadata, without page content."""
+        pass
 
 
 class ISectionRepository(ABC):
@@ -55,8 +100,29 @@ class ISectionRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_notebook_id(self, notebook_id: str, include_deleted: bool = False) -> List[Section]:
-        """Get all sections in a notebook."""
+    async def get_version(self, section_id: str) -> Optional[str]:
+        """
+        Get a cheap change token for a section without loading the row.
+        
+        The token changes whenever the section is updated; ``None`` if it
+        does not exist.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_notebook_id(
+        self,
+        notebook_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[Section]:
+        """
+        Get sections in a notebook.
+        
+        Ordered by ``(display_order, id)``; ``after`` is that key of the last
+        section already returned.
+        """
         pass
     
     @abstractmethod
@@ -94,18 +160,162 @@ class IPageRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_section_id(self, section_id: str, include_deleted: bool = False) -> List[Page]:
-        """Get all pages in a section."""
+    async def get_version(self, page_id: str) -> Optional[str]:
+        """
+        Get a cheap change token for a page without loading the row.
+        
+        The token changes whenever the page is updated; ``None`` if it
+        does not exist.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_section_id(
+        self,
+        section_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[Page]:
+        """
+        Get pages in a section.
+        
+        Ordered by ``(display_order, id)``; ``after`` is that key of the last
+        page already returned.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_parent_id(
+        self,
+        parent_page_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[Page]:
+        """
+        Get subpages of a page.
+        
+        Ordered by ``(display_order, id)``; ``after`` is that key of the last
+        page already returned.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_summaries_by_section_id(
+        self,
+        section_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[PageSummary]:
+        """
+        Get metadata of pages in a section, without content.
+        
+        Ordered by ``(display_order, id)``; ``after`` is that key of the last
+        page already returned.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_summaries_by_parent_id(
+        self,
+        parent_page_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[PageSummary]:
+        """
+        Get metadata of subpages of a page, without content.
+        
+        Ordered by ``(display_order, id)``; ``after`` is that key of the last
+        page already returned.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_subtree(
+        self, page_id: str, max_depth: Optional[int] = None, include_deleted: bool = False
+    ) -> List[PageTreeNode]:
+        """Get a page and all its nested subpages in pre-order, without content."""
+        pass
+    
+    @abstractmethod
+    async def get_ancestors(self, page_id: str) -> List[PageSummary]:
+        """Get metadata of a page's ancestors, outermost first."""
+        pass
+    
+    @abstractmethod
+    async def get_breadcrumb(self, page_id: str) -> Optional[Breadcrumb]:
+        """Get a live page's notebook, section and ancestor chain."""
+        pass
+    
+    @abstractmethod
+    async def move(self, page_id: str, parent_page_id: Optional[str], display_order: int) -> Page:
+        """Re-parent a page together with its subpages."""
         pass
     
     @abstractmethod
-    async def get_by_parent_id(self, parent_page_id: str, include_deleted: bool = False) -> List[Page]:
-        """Get all subpages of a page."""
+    async def create_many(self, pages: List[Page]) -> List[Page]:
+        """
+        Create a batch of pages with set-based inserts.
+        
+        Pages whose parent is another page of the batch must come after it.
+        
+        Returns:
+            The created pages, in the given order.
+        
+        Raises:
+            ValueError: If a parent page does not exist or comes later in
+                the batch.
+        """
         pass
     
     @abstractmethod
-    async def update(self, page: Page) -> Page:
-        """Update existing page."""
+    async def update_fields(
+        self,
+        page_id: str,
+        expected_version: Optional[int] = None,
+        *,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        content_plain: Optional[str] = None,
+        display_order: Optional[int] = None
+    ) -> Optional[Page]:
+        """
+        Change some fields of a page without reading it first.
+        
+        Fields left as None keep their stored values; the version goes up
+        by one.
+        
+        Args:
+            page_id: UUID of the page.
+            expected_version: Version the stored page must still be at, or
+                None to apply the change to whatever version is stored.
+        
+        Returns:
+            The page as stored, or None if no page matched (it does not
+            exist, or is no longer at ``expected_version``).
+        """
+        pass
+    
+    @abstractmethod
+    async def update(self, page: Page, expected_version: int) -> Page:
+        """
+        Update existing page if it is still at the version the edit was based on.
+        
+        Args:
+            page: Page with the new title, content, display order and
+                ``version`` to store.
+            expected_version: Version the stored page must still be at.
+        
+        Returns:
+            The page as stored.
+        
+        Raises:
+            VersionConflictError: If the page was written since
+                ``expected_version`` or does not exist.
+        """
         pass
     
     @abstractmethod
@@ -117,3 +327,37 @@ class IPageRepository(ABC):
     async def restore(self, page_id: str) -> bool:
         """Restore soft-deleted page."""
         pass
+
+
+class ISearchRepository(ABC):
+    """Interface for full-text page search."""
+    
+    @abstractmethod
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 20,
+        notebook_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        after: Optional[Tuple[float, str]] = None
+    ) -> List[SearchHit]:
+        """
+        Search live pages by title and plain-text content.
+        
+        Hits are ordered by rank (descending) then page id; ``after`` is the
+        ``(rank, page_id)`` of the last hit already returned.
+        """
+        pass
+
+
+class IHighlightRepository(ABC):
+    """Interface for search-term highlighting in opened pages."""
+    
+    @abstractmethod
+    async def get_highlights(self, page_id: str, query_text: str) -> Optional[List[HighlightRange]]:
+        """
+        Find where the words of a query occur in a live page's content.
+        
+        Returns ranges ordered by position, or None if the page does not exist.
+        """
+        pass
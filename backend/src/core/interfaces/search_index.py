@@ -0,0 +1,73 @@
+"""Search index interfaces."""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.core.domain.page import Page
+from src.core.domain.reindex_progress import ReindexProgress
+from src.core.domain.search_result import Suggestion
+
+
+class ISearchIndex(ABC):
+    """Interface for search indexes that are maintained by the page services."""
+    
+    @abstractmethod
+    async def index_page(self, page: Page) -> None:
+        """Add or replace a page in the index."""
+        pass
+    
+    async def index_pages(self, pages: List[Page]) -> None:
+        """Add or replace a batch of pages; indexes override this to write them together."""
+        for page in pages:
+            await self.index_page(page)
+    
+    @abstractmethod
+    async def remove_page(self, page_id: str) -> None:
+        """Remove a page from the index."""
+        pass
+    
+    async def remove_pages(self, page_ids: List[str]) -> None:
+        """Remove a batch of pages; indexes override this to drop them together."""
+        for page_id in page_ids:
+            await self.remove_page(page_id)
+
+
+class ISuggestionIndex(ABC):
+    """Interface for search autocomplete."""
+    
+    @abstractmethod
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Suggestion]:
+        """Complete a partially typed query."""
+        pass
+
+
+class ISpellingIndex(ABC):
+    """Interface for typo correction of search queries."""
+    
+    @abstractmethod
+    async def correct(self, query_text: str) -> Optional[str]:
+        """Return the query with misspelled words replaced, or None if unchanged."""
+        pass
+
+
+class ISearchCache(ABC):
+    """Interface for invalidating cached search results."""
+    
+    @abstractmethod
+    async def invalidate(self) -> None:
+        """Discard every cached result once the current transaction commits."""
+        pass
+
+
+class ISearchReindexer(ABC):
+    """Interface for the background search reindex job."""
+    
+    @abstractmethod
+    async def start(self, batch_size: int, rebuild_fulltext: bool = False) -> ReindexProgress:
+        """Start a reindex unless one is already running; return its progress."""
+        pass
+    
+    @abstractmethod
+    def get_progress(self) -> ReindexProgress:
+        """Get the progress of the current or last reindex."""
+        pass
@@ -6,8 +6,10 @@ from typing import Optional
 
 @dataclass
 class GetNotebooksQuery:
-    """Query to get all notebooks."""
+    """Query to get all notebooks, newest first, optionally one page at a time."""
     include_deleted: bool = False
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -16,11 +18,19 @@ class GetNotebookByIdQuery:
     id: str
 
 
+@dataclass
+class GetNotebookTreeQuery:
+    """Query to get a notebook's sections and page metadata."""
+    notebook_id: str
+
+
 @dataclass
 class GetSectionsQuery:
     """Query to get sections, optionally filtered by notebook."""
     notebook_id: Optional[str] = None
     include_deleted: bool = False
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -35,9 +45,50 @@ class GetPagesQuery:
     section_id: Optional[str] = None
     parent_page_id: Optional[str] = None
     include_deleted: bool = False
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
 
 
 @dataclass
 class GetPageByIdQuery:
     """Query to get a specific page."""
     id: str
+
+
+@dataclass
+class GetPageBreadcrumbQuery:
+    """Query to get the location of a page."""
+    page_id: str
+
+
+@dataclass
+class GetPageSubtreeQuery:
+    """Query to get a page and its nested subpages."""
+    page_id: str
+    max_depth: Optional[int] = None
+    include_deleted: bool = False
+
+
+@dataclass
+class SearchPagesQuery:
+    """Query to run a full-text search, optionally scoped to a notebook or section."""
+    q: str
+    notebook_id: Optional[str] = None
+    section_id: Optional[str] = None
+    limit: int = 20
+    cursor: Optional[str] = None
+    fuzzy: bool = True
+
+
+@dataclass
+class SearchSuggestionsQuery:
+    """Query to autocomplete a partially typed search."""
+    q: str
+    limit: int = 10
+
+
+@dataclass
+class GetPageHighlightsQuery:
+    """Query to locate search terms in an opened page."""
+    page_id: str
+    q: str
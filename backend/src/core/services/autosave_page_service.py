@@ -0,0 +1,152 @@
+"""Service for incremental page autosaves."""
+
+from datetime import datetime
+from typing import Optional
+
+from src.core.commands.page_commands import AutosavePageCommand
+from src.core.common.errors import VersionConflictError
+from src.core.common.markdown import extract_plain_text
+from src.core.common.result import Result
+from src.core.common.text_patch import apply_patches
+from src.core.domain.page import Page, PageRevision
+from src.core.interfaces.autosave_buffer import IAutosaveBuffer
+from src.core.interfaces.repositories import IPageRepository
+from src.core.interfaces.search_index import ISearchIndex
+
+
+class AutosavePageService:
+    """Service to apply editor autosaves as patches against a known page version."""
+
+    def __init__(
+        self,
+        page_repository: IPageRepository,
+        search_index: Optional[ISearchIndex] = None,
+        autosave_buffer: Optional[IAutosaveBuffer] = None
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            page_repository: Repository for page persistence.
+            search_index: Optional index to keep in sync with page writes.
+            autosave_buffer: Optional write-behind buffer; autosaves are
+                written through to the repository without one.
+        """
+        self.page_repository = page_repository
+        self.search_index = search_index
+        self.autosave_buffer = autosave_buffer
+
+    async def execute(self, command: AutosavePageCommand) -> Result[PageRevision]:
+        """
+        Execute the autosave page command.
+
+        Args:
+            command: The autosave page command.
+
+        Returns:
+            Result containing the saved page's new version (held in the
+            write-behind buffer when one is configured), or error
+            information. The message starts with ``Version conflict`` when
+            ``command.base_version`` is no longer the page's current version.
+        """
+        if command.patches and command.content is not None:
+            return Result.validation_error("patches", "Send either patches or content, not both")
+        if command.patches and command.base_version is None:
+            return Result.validation_error(
+                "base_version", "Patches require the version they were computed against"
+            )
+
+        if not self.autosave_buffer and not command.patches:
+            return await self._write_content(command)
+
+        page = self.autosave_buffer.get(command.id) if self.autosave_buffer else None
+        if page is None:
+            page = await self.page_repository.get_by_id(command.id)
+        if not page:
+            return Result.fail(f"Page with id {command.id} not found")
+
+        if command.base_version is not None and command.base_version != page.version:
+            return Result.fail(
+                f"Version conflict: page {command.id} changed since version {command.base_version}"
+            )
+
+        if command.patches:
+            try:
+                content = apply_patches(page.content, command.patches)
+            except ValueError as e:
+                return Result.validation_error("patches", str(e))
+        else:
+            content = command.content
+
+        if command.title is not None:
+            page.title = command.title.strip()
+        if content is not None:
+            page.content = content
+
+        is_valid, error_msg = page.validate()
+        if not is_valid:
+            return Result.fail(f"Validation failed: {error_msg}")
+
+        expected_version = page.version
+        page.version += 1
+
+        if self.autosave_buffer:
+            # Plain text and search indexes are brought up to date when the buffer flushes
+            page.updated_at = datetime.utcnow()
+            try:
+                await self.autosave_buffer.put(page, expected_version)
+            except Exception as e:
+                return Result.fail(f"Failed to autosave page: {str(e)}")
+            return Result.ok(self._revision(page), "Page autosave buffered")
+
+        page.content_plain = extract_plain_text(page.content)
+        try:
+            saved_page = await self.page_repository.update(page, expected_version)
+            if self.search_index:
+                await self.search_index.index_page(saved_page)
+            return Result.ok(self._revision(saved_page), "Page autosaved successfully")
+        except VersionConflictError as e:
+            return Result.fail(str(e))
+        except Exception as e:
+            return Result.fail(f"Failed to autosave page: {str(e)}")
+
+    async def _write_content(self, command: AutosavePageCommand) -> Result[PageRevision]:
+        """Write full content in one conditional statement; nothing to patch, so nothing is read."""
+        title = command.title.strip() if command.title is not None else None
+        is_valid, error_msg = Page.validate_changes(title=title)
+        if not is_valid:
+            return Result.fail(f"Validation failed: {error_msg}")
+
+        try:
+            saved_page = await self.page_repository.update_fields(
+                command.id,
+                command.base_version,
+                title=title,
+                content=command.content,
+                content_plain=(
+                    extract_plain_text(command.content) if command.content is not None else None
+                ),
+            )
+            if saved_page is None:
+                if command.base_version is not None and await self.page_repository.get_version(
+                    command.id
+                ):
+                    return Result.fail(
+                        f"Version conflict: page {command.id} changed since version "
+                        f"{command.base_version}"
+                    )
+                return Result.fail(f"Page with id {command.id} not found")
+
+            is_valid, error_msg = saved_page.validate()
+            if not is_valid:
+                return Result.fail(f"Validation failed: {error_msg}")
+
+            if self.search_index:
+                await self.search_index.index_page(saved_page)
+            return Result.ok(self._revision(saved_page), "Page autosaved successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to autosave page: {str(e)}")
+
+    @staticmethod
+    def _revision(page: Page) -> PageRevision:
+        return PageRevision(id=page.id, version=page.version, updated_at=page.updated_at)
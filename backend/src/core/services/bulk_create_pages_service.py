@@ -0,0 +1,98 @@
+"""Service for creating pages in bulk."""
+
+import uuid
+from typing import List, Optional
+
+from src.core.commands.page_commands import MAX_BULK_PAGES, BulkCreatePagesCommand
+from src.core.common.markdown import extract_plain_texts
+from src.core.common.result import Result
+from src.core.domain.page import Page
+from src.core.interfaces.repositories import IPageRepository
+from src.core.interfaces.search_index import ISearchIndex
+
+
+class BulkCreatePagesService:
+    """Service to create many pages, e.g. from an import or a script, in one batch."""
+
+    def __init__(
+        self,
+        page_repository: IPageRepository,
+        search_index: Optional[ISearchIndex] = None
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            page_repository: Repository for page persistence.
+            search_index: Optional index to keep in sync with page writes.
+        """
+        self.page_repository = page_repository
+        self.search_index = search_index
+
+    async def execute(self, command: BulkCreatePagesCommand) -> Result[List[Page]]:
+        """
+        Execute the bulk create pages command.
+
+        Every page is validated before anything is written; the batch is
+        created, and indexed, all together or not at all.
+
+        Args:
+            command: The bulk create pages command.
+
+        Returns:
+            Result containing the created pages in request order, or error
+            information naming the first invalid page.
+        """
+        if not command.pages:
+            return Result.validation_error("pages", "At least one page is required")
+        if len(command.pages) > MAX_BULK_PAGES:
+            return Result.validation_error(
+                "pages", f"At most {MAX_BULK_PAGES} pages can be created at once"
+            )
+
+        # Plain text for search, extracted for the whole batch up front
+        contents_plain = extract_plain_texts(item.content for item in command.pages)
+
+        pages: List[Page] = []
+        for index, (item, content_plain) in enumerate(zip(command.pages, contents_plain)):
+            parent_page_id = item.parent_page_id
+            if item.parent_index is not None:
+                field = f"pages[{index}].parent_index"
+                if parent_page_id:
+                    return Result.validation_error(
+                        field, "Set either parent_index or parent_page_id, not both"
+                    )
+                if not 0 <= item.parent_index < index:
+                    return Result.validation_error(
+                        field, "parent_index must point at an earlier page of the batch"
+                    )
+                parent = pages[item.parent_index]
+                if parent.section_id != item.section_id:
+                    return Result.validation_error(field, "Parent page must be in the same section")
+                parent_page_id = parent.id
+
+            page = Page(
+                # Generated here so later items can name this one as their parent
+                id=str(uuid.uuid4()),
+                section_id=item.section_id,
+                title=item.title.strip(),
+                content=item.content,
+                content_plain=content_plain,
+                parent_page_id=parent_page_id,
+                display_order=item.display_order
+            )
+
+            # Validate domain rules
+            is_valid, error_msg = page.validate()
+            if not is_valid:
+                return Result.fail(f"Validation failed: page {index}: {error_msg}")
+            pages.append(page)
+
+        # Persist
+        try:
+            created_pages = await self.page_repository.create_many(pages)
+            if self.search_index:
+                await self.search_index.index_pages(created_pages)
+            return Result.ok(created_pages, f"{len(created_pages)} pages created successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to create pages: {str(e)}")
@@ -1,36 +1,32 @@
 """Service for creating pages."""
 
-import re
+from typing import Optional
 
 from src.core.commands.page_commands import CreatePageCommand
+from src.core.common.markdown import extract_plain_text
 from src.core.common.result import Result
 from src.core.domain.page import Page
 from src.core.interfaces.repositories import IPageRepository
-
-
-def extract_plain_text(markdown_content: str) -> str:
-    """Extract plain text from markdown for search indexing."""
-    text = markdown_content
-    text = re.sub(r'```[\s\S]*?```', '', text)  # Remove code blocks
-    text = re.sub(r'`[^`]*`', '', text)  # Remove inline code
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)  # Remove links but keep text
-    text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', '', text)  # Remove images
-    text = re.sub(r'^#+\s+', '', text, flags=re.MULTILINE)  # Remove headers
-    text = re.sub(r'[*_]{1,2}([^*_]+)[*_]{1,2}', r'\1', text)  # Remove bold/italic
-    return text.strip()
+from src.core.interfaces.search_index import ISearchIndex
 
 
 class CreatePageService:
     """Service to handle page creation business logic."""
     
-    def __init__(self, page_repository: IPageRepository):
+    def __init__(
+        self,
+        page_repository: IPageRepository,
+        search_index: Optional[ISearchIndex] = None
+    ):
         """
         Initialize the service.
         
         Args:
             page_repository: Repository for page persistence.
+            search_index: Optional index to keep in sync with page writes.
         """
         self.page_repository = page_repository
+        self.search_index = search_index
     
     async def execute(self, command: CreatePageCommand) -> Result[Page]:
         """
@@ -64,6 +60,8 @@ class CreatePageService:
         # Persist
         try:
             created_page = await self.page_repository.create(page)
+            if self.search_index:
+                await self.search_index.index_page(created_page)
             return Result.ok(created_page, "Page created successfully")
         except Exception as e:
             return Result.fail(f"Failed to create page: {str(e)}")
@@ -1,21 +1,31 @@
 """Service for deleting notebooks."""
 
+from typing import Optional
+
 from src.core.commands.notebook_commands import DeleteNotebookCommand
 from src.core.common.result import Result
 from src.core.interfaces.repositories import INotebookRepository
+from src.core.interfaces.search_index import ISearchIndex
 
 
 class DeleteNotebookService:
     """Service to handle notebook deletion business logic."""
     
-    def __init__(self, notebook_repository: INotebookRepository):
+    def __init__(
+        self,
+        notebook_repository: INotebookRepository,
+        search_index: Optional[ISearchIndex] = None
+    ):
         """
         Initialize the service.
         
         Args:
             notebook_repository: Repository for notebook persistence.
+            search_index: Optional index to drop the notebook's pages from,
+                since they no longer appear in search or suggestions.
         """
         self.notebook_repository = notebook_repository
+        self.search_index = search_index
     
     async def execute(self, command: DeleteNotebookCommand) -> Result[bool]:
         """
@@ -34,8 +44,14 @@ class DeleteNotebookService:
         
         # Perform soft delete
         try:
+            # Read before the delete, while the notebook's pages are still live
+            page_ids = []
+            if self.search_index:
+                page_ids = await self.notebook_repository.get_page_ids(command.id)
             success = await self.notebook_repository.delete(command.id)
             if success:
+                if self.search_index:
+                    await self.search_index.remove_pages(page_ids)
                 return Result.ok(True, "Notebook deleted successfully")
             else:
                 return Result.fail("Failed to delete notebook")
@@ -1,21 +1,30 @@
 """Service for deleting pages."""
 
+from typing import Optional
+
 from src.core.commands.page_commands import DeletePageCommand
 from src.core.common.result import Result
 from src.core.interfaces.repositories import IPageRepository
+from src.core.interfaces.search_index import ISearchIndex
 
 
 class DeletePageService:
     """Service to handle page deletion business logic."""
     
-    def __init__(self, page_repository: IPageRepository):
+    def __init__(
+        self,
+        page_repository: IPageRepository,
+        search_index: Optional[ISearchIndex] = None
+    ):
         """
         Initialize the service.
         
         Args:
             page_repository: Repository for page persistence.
+            search_index: Optional index to keep in sync with page writes.
         """
         self.page_repository = page_repository
+        self.search_index = search_index
     
     async def execute(self, command: DeletePageCommand) -> Result[bool]:
         """
@@ -47,6 +56,8 @@ class DeletePageService:
         try:
             success = await self.page_repository.delete(command.id)
             if success:
+                if self.search_index:
+                    await self.search_index.remove_page(command.id)
                 return Result.ok(True, "Page deleted successfully")
             else:
                 return Result.fail("Failed to delete page")
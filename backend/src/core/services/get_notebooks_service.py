@@ -1,10 +1,14 @@
 """Service for querying notebooks."""
 
+from datetime import datetime
 from typing import List
 
-from src.core.queries.queries import GetNotebooksQuery, GetNotebookByIdQuery
+from src.core.queries.queries import GetNotebooksQuery, GetNotebookByIdQuery, GetNotebookTreeQuery
+from src.core.common.cursor import decode_cursor
+from src.core.common.pagination import MAX_LIST_LIMIT, Paginated, fetch_limit, paginate
 from src.core.common.result import Result
 from src.core.domain.notebook import Notebook
+from src.core.domain.notebook_tree import NotebookTree
 from src.core.interfaces.repositories import INotebookRepository
 
 
@@ -28,16 +32,70 @@ class GetNotebooksService:
             query: The get notebooks query.
             
         Returns:
-            Result containing list of notebooks or error information.
+            Result containing list of notebooks (one page of them when
+            ``query.limit`` is set) or error information.
         """
+        result = await self.list_paginated(query)
+        if not result.success:
+            return result
+        return Result.ok(result.data.items, result.message)
+    
+    async def list_paginated(self, query: GetNotebooksQuery) -> Result[Paginated[Notebook]]:
+        """
+        Execute the get notebooks query one keyset page at a time.
+        
+        Args:
+            query: The get notebooks query.
+            
+        Returns:
+            Result containing up to ``query.limit`` notebooks, newest first,
+            and the cursor for the next page, or error information.
+        """
+        if query.limit is not None and not 1 <= query.limit <= MAX_LIST_LIMIT:
+            return Result.validation_error("limit", f"Limit must be between 1 and {MAX_LIST_LIMIT}")
+        
+        after = None
+        if query.cursor:
+            try:
+                created_at, notebook_id = decode_cursor(query.cursor, 2)
+                after = (datetime.fromisoformat(created_at), str(notebook_id))
+            except (TypeError, ValueError):
+                return Result.validation_error("cursor", "Invalid notebook cursor")
+        
         try:
             notebooks = await self.notebook_repository.get_all(
-                include_deleted=query.include_deleted
+                include_deleted=query.include_deleted,
+                limit=fetch_limit(query.limit),
+                after=after
             )
-            return Result.ok(notebooks, f"Retrieved {len(notebooks)} notebooks")
+            page = paginate(
+                notebooks,
+                query.limit,
+                lambda notebook: (notebook.created_at.isoformat(), notebook.id),
+            )
+            return Result.ok(page, f"Retrieved {len(page.items)} notebooks")
         except Exception as e:
             return Result.fail(f"Failed to retrieve notebooks: {str(e)}")
     
+    async def get_version(self, query: GetNotebookByIdQuery) -> Result[str]:
+        """
+        Get a notebook's change token without loading it.
+        
+        Args:
+            query: The get notebook by id query.
+            
+        Returns:
+            Result containing the token, which changes whenever the notebook
+            does, or error information.
+        """
+        try:
+            version = await self.notebook_repository.get_version(query.id)
+            if not version:
+                return Result.fail(f"Notebook with id {query.id} not found")
+            return Result.ok(version, "Notebook version retrieved successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to retrieve notebook version: {str(e)}")
+    
     async def get_by_id(self, query: GetNotebookByIdQuery) -> Result[Notebook]:
         """
         Execute the get notebook by id query.
@@ -55,3 +113,41 @@ class GetNotebooksService:
             return Result.ok(notebook, "Notebook retrieved successfully")
         except Exception as e:
             return Result.fail(f"Failed to retrieve notebook: {str(e)}")
+    
+    async def get_tree_version(self, query: GetNotebookTreeQuery) -> Result[str]:
+        """
+        Get a notebook tree's change token without building the tree.
+        
+        Args:
+            query: The get notebook tree query.
+            
+        Returns:
+            Result containing the token, which changes whenever the tree
+            does, or error information.
+        """
+        try:
+            version = await self.notebook_repository.get_tree_version(query.notebook_id)
+            if not version:
+                return Result.fail(f"Notebook with id {query.notebook_id} not found")
+            return Result.ok(version, "Notebook tree version retrieved successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to retrieve notebook tree version: {str(e)}")
+    
+    async def get_tree(self, query: GetNotebookTreeQuery) -> Result[NotebookTree]:
+        """
+        Execute the get notebook tree query.
+        
+        Args:
+            query: The get notebook tree query.
+            
+        Returns:
+            Result containing the notebook's sections and page metadata or
+            error information.
+        """
+        try:
+            tree = await self.notebook_repository.get_tree(query.notebook_id)
+            if not tree:
+                return Result.fail(f"Notebook with id {query.notebook_id} not found")
+            return Result.ok(tree, "Notebook tree retrieved successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to retrieve notebook tree: {str(e)}")
@@ -0,0 +1,48 @@
+"""Service for highlighting search terms in an opened page."""
+
+from typing import List
+
+from src.core.queries.queries import GetPageHighlightsQuery
+from src.core.common.result import Result
+from src.core.domain.search_result import HighlightRange
+from src.core.interfaces.repositories import IHighlightRepository
+
+MAX_HIGHLIGHT_QUERY_LENGTH = 500
+
+
+class GetPageHighlightsService:
+    """Service to handle page highlight business logic."""
+
+    def __init__(self, highlight_repository: IHighlightRepository):
+        """
+        Initialize the service.
+
+        Args:
+            highlight_repository: Repository of precomputed term offsets.
+        """
+        self.highlight_repository = highlight_repository
+
+    async def execute(self, query: GetPageHighlightsQuery) -> Result[List[HighlightRange]]:
+        """
+        Execute the get page highlights query.
+
+        Args:
+            query: The get page highlights query.
+
+        Returns:
+            Result containing highlight ranges in content order or error
+            information.
+        """
+        if len(query.q) > MAX_HIGHLIGHT_QUERY_LENGTH:
+            return Result.validation_error(
+                "q", f"Query must be at most {MAX_HIGHLIGHT_QUERY_LENGTH} characters"
+            )
+
+        try:
+            ranges = await self.highlight_repository.get_highlights(query.page_id, query.q)
+        except Exception as e:
+            return Result.fail(f"Failed to get highlights: {str(e)}")
+
+        if ranges is None:
+            return Result.fail(f"Page with id {query.page_id} not found")
+        return Result.ok(ranges, f"Found {len(ranges)} highlights")
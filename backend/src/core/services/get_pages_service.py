@@ -1,24 +1,43 @@
 """Service for querying pages."""
 
-from typing import List
+from typing import List, Optional
 
-from src.core.queries.queries import GetPagesQuery, GetPageByIdQuery
+from src.core.queries.queries import (
+    GetPagesQuery,
+    GetPageByIdQuery,
+    GetPageBreadcrumbQuery,
+    GetPageSubtreeQuery,
+)
+from src.core.common.pagination import (
+    MAX_LIST_LIMIT,
+    Paginated,
+    decode_order_cursor,
+    fetch_limit,
+    paginate,
+)
 from src.core.common.result import Result
-from src.core.domain.page import Page
+from src.core.domain.breadcrumb import Breadcrumb
+from src.core.domain.page import Page, PageSummary, PageTreeNode
+from src.core.interfaces.autosave_buffer import IAutosaveBuffer
 from src.core.interfaces.repositories import IPageRepository
 
 
 class GetPagesService:
     """Service to handle page retrieval business logic."""
     
-    def __init__(self, page_repository: IPageRepository):
+    def __init__(
+        self, page_repository: IPageRepository, autosave_buffer: Optional[IAutosaveBuffer] = None
+    ):
         """
         Initialize the service.
         
         Args:
             page_repository: Repository for page persistence.
+            autosave_buffer: Optional write-behind buffer; a page's pending
+                autosave is flushed before the page is read.
         """
         self.page_repository = page_repository
+        self.autosave_buffer = autosave_buffer
     
     async def execute(self, query: GetPagesQuery) -> Result[List[Page]]:
         """
@@ -28,25 +47,103 @@ class GetPagesService:
             query: The get pages query.
             
         Returns:
-            Result containing list of pages or error information.
+            Result containing list of pages (one page of them when
+            ``query.limit`` is set) or error information.
         """
+        result = await self.list_paginated(query)
+        if not result.success:
+            return result
+        return Result.ok(result.data.items, result.message)
+    
+    async def get_summaries(self, query: GetPagesQuery) -> Result[List[PageSummary]]:
+        """
+        Execute the get pages query returning metadata only.
+        
+        Args:
+            query: The get pages query.
+            
+        Returns:
+            Result containing list of page summaries (one page of them when
+            ``query.limit`` is set) or error information.
+        """
+        result = await self.list_paginated(query, summaries=True)
+        if not result.success:
+            return result
+        return Result.ok(result.data.items, result.message)
+    
+    async def list_paginated(
+        self, query: GetPagesQuery, summaries: bool = False
+    ) -> Result[Paginated]:
+        """
+        Execute the get pages query one keyset page at a time.
+        
+        Args:
+            query: The get pages query.
+            summaries: Return metadata-only page summaries instead of pages.
+            
+        Returns:
+            Result containing up to ``query.limit`` pages in display order and
+            the cursor for the next page, or error information.
+        """
+        if query.limit is not None and not 1 <= query.limit <= MAX_LIST_LIMIT:
+            return Result.validation_error("limit", f"Limit must be between 1 and {MAX_LIST_LIMIT}")
+        
+        after = None
+        if query.cursor:
+            try:
+                after = decode_order_cursor(query.cursor)
+            except ValueError:
+                return Result.validation_error("cursor", "Invalid page cursor")
+        
+        repository = self.page_repository
+        if query.section_id:
+            fetch = (
+                repository.get_summaries_by_section_id
+                if summaries
+                else repository.get_by_section_id
+            )
+            parent_id = query.section_id
+        elif query.parent_page_id:
+            fetch = (
+                repository.get_summaries_by_parent_id if summaries else repository.get_by_parent_id
+            )
+            parent_id = query.parent_page_id
+        else:
+            return Result.ok(Paginated(items=[]), "Retrieved 0 pages")
+        
         try:
-            if query.section_id:
-                pages = await self.page_repository.get_by_section_id(
-                    query.section_id,
-                    include_deleted=query.include_deleted
-                )
-            elif query.parent_page_id:
-                pages = await self.page_repository.get_by_parent_id(
-                    query.parent_page_id,
-                    include_deleted=query.include_deleted
-                )
-            else:
-                pages = []
-            return Result.ok(pages, f"Retrieved {len(pages)} pages")
+            pages = await fetch(
+                parent_id,
+                include_deleted=query.include_deleted,
+                limit=fetch_limit(query.limit),
+                after=after
+            )
+            page = paginate(pages, query.limit, lambda item: (item.display_order, item.id))
+            return Result.ok(page, f"Retrieved {len(page.items)} pages")
         except Exception as e:
             return Result.fail(f"Failed to retrieve pages: {str(e)}")
     
+    async def get_version(self, query: GetPageByIdQuery) -> Result[str]:
+        """
+        Get a page's change token without loading it.
+        
+        Args:
+            query: The get page by id query.
+            
+        Returns:
+            Result containing the token, which changes whenever the page
+            does, or error information.
+        """
+        try:
+            if self.autosave_buffer:
+                await self.autosave_buffer.flush(query.id)
+            version = await self.page_repository.get_version(query.id)
+            if not version:
+                return Result.fail(f"Page with id {query.id} not found")
+            return Result.ok(version, "Page version retrieved successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to retrieve page version: {str(e)}")
+    
     async def get_by_id(self, query: GetPageByIdQuery) -> Result[Page]:
         """
         Execute the get page by id query.
@@ -58,9 +155,55 @@ class GetPagesService:
             Result containing the page or error information.
         """
         try:
+            if self.autosave_buffer:
+                await self.autosave_buffer.flush(query.id)
             page = await self.page_repository.get_by_id(query.id)
             if not page:
                 return Result.fail(f"Page with id {query.id} not found")
             return Result.ok(page, "Page retrieved successfully")
         except Exception as e:
             return Result.fail(f"Failed to retrieve page: {str(e)}")
+    
+    async def get_subtree(self, query: GetPageSubtreeQuery) -> Result[List[PageTreeNode]]:
+        """
+        Execute the get page subtree query.
+        
+        Args:
+            query: The get page subtree query.
+            
+        Returns:
+            Result containing the page and its nested subpages in pre-order,
+            or error information.
+        """
+        if query.max_depth is not None and query.max_depth < 0:
+            return Result.fail("Max depth must be non-negative")
+        
+        try:
+            nodes = await self.page_repository.get_subtree(
+                query.page_id,
+                max_depth=query.max_depth,
+                include_deleted=query.include_deleted
+            )
+            if not nodes:
+                return Result.fail(f"Page with id {query.page_id} not found")
+            return Result.ok(nodes, f"Retrieved {len(nodes)} pages")
+        except Exception as e:
+            return Result.fail(f"Failed to retrieve page subtree: {str(e)}")
+    
+    async def get_breadcrumb(self, query: GetPageBreadcrumbQuery) -> Result[Breadcrumb]:
+        """
+        Execute the get page breadcrumb query.
+        
+        Args:
+            query: The get page breadcrumb query.
+            
+        Returns:
+            Result containing the page's breadcrumb or error information.
+        """
+        try:
+            breadcrumb = await self.page_repository.get_breadcrumb(query.page_id)
+            if not breadcrumb:
+                return Result.fail(f"Page with id {query.page_id} not found")
+            return Result.ok(breadcrumb, "Breadcrumb retrieved successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to retrieve breadcrumb: {str(e)}")
@@ -0,0 +1,47 @@
+"""Service for search autocomplete."""
+
+from typing import List
+
+from src.core.queries.queries import SearchSuggestionsQuery
+from src.core.common.result import Result
+from src.core.domain.search_result import Suggestion
+from src.core.interfaces.search_index import ISuggestionIndex
+
+MAX_SUGGESTION_LIMIT = 25
+
+
+class GetSearchSuggestionsService:
+    """Service to handle search suggestion business logic."""
+
+    def __init__(self, suggestion_index: ISuggestionIndex):
+        """
+        Initialize the service.
+
+        Args:
+            suggestion_index: Index of titles and terms to complete from.
+        """
+        self.suggestion_index = suggestion_index
+
+    async def execute(self, query: SearchSuggestionsQuery) -> Result[List[Suggestion]]:
+        """
+        Execute the search suggestions query.
+
+        Args:
+            query: The search suggestions query.
+
+        Returns:
+            Result containing suggestions or error information.
+        """
+        if query.limit < 1 or query.limit > MAX_SUGGESTION_LIMIT:
+            return Result.validation_error(
+                "limit", f"Limit must be between 1 and {MAX_SUGGESTION_LIMIT}"
+            )
+
+        if not query.q or not query.q.strip():
+            return Result.ok([], "Empty search query")
+
+        try:
+            suggestions = await self.suggestion_index.suggest(query.q, limit=query.limit)
+            return Result.ok(suggestions, f"Found {len(suggestions)} suggestions")
+        except Exception as e:
+            return Result.fail(f"Failed to get suggestions: {str(e)}")
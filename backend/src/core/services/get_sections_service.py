@@ -3,6 +3,13 @@
 from typing import List
 
 from src.core.queries.queries import GetSectionsQuery, GetSectionByIdQuery
+from src.core.common.pagination import (
+    MAX_LIST_LIMIT,
+    Paginated,
+    decode_order_cursor,
+    fetch_limit,
+    paginate,
+)
 from src.core.common.result import Result
 from src.core.domain.section import Section
 from src.core.interfaces.repositories import ISectionRepository
@@ -28,22 +35,73 @@ class GetSectionsService:
             query: The get sections query.
             
         Returns:
-            Result containing list of sections or error information.
+            Result containing list of sections (one page of them when
+            ``query.limit`` is set) or error information.
         """
+        result = await self.list_paginated(query)
+        if not result.success:
+            return result
+        return Result.ok(result.data.items, result.message)
+    
+    async def list_paginated(self, query: GetSectionsQuery) -> Result[Paginated[Section]]:
+        """
+        Execute the get sections query one keyset page at a time.
+        
+        Args:
+            query: The get sections query.
+            
+        Returns:
+            Result containing up to ``query.limit`` sections in display order
+            and the cursor for the next page, or error information.
+        """
+        if query.limit is not None and not 1 <= query.limit <= MAX_LIST_LIMIT:
+            return Result.validation_error("limit", f"Limit must be between 1 and {MAX_LIST_LIMIT}")
+        
+        after = None
+        if query.cursor:
+            try:
+                after = decode_order_cursor(query.cursor)
+            except ValueError:
+                return Result.validation_error("cursor", "Invalid section cursor")
+        
         try:
             if query.notebook_id:
                 sections = await self.section_repository.get_by_notebook_id(
                     query.notebook_id,
-                    include_deleted=query.include_deleted
+                    include_deleted=query.include_deleted,
+                    limit=fetch_limit(query.limit),
+                    after=after
                 )
             else:
                 sections = await self.section_repository.get_all(
                     include_deleted=query.include_deleted
                 )
-            return Result.ok(sections, f"Retrieved {len(sections)} sections")
+            page = paginate(
+                sections, query.limit, lambda section: (section.display_order, section.id)
+            )
+            return Result.ok(page, f"Retrieved {len(page.items)} sections")
         except Exception as e:
             return Result.fail(f"Failed to retrieve sections: {str(e)}")
     
+    async def get_version(self, query: GetSectionByIdQuery) -> Result[str]:
+        """
+        Get a section's change token without loading it.
+        
+        Args:
+            query: The get section by id query.
+            
+        Returns:
+            Result containing the token, which changes whenever the section
+            does, or error information.
+        """
+        try:
+            version = await self.section_repository.get_version(query.id)
+            if not version:
+                return Result.fail(f"Section with id {query.id} not found")
+            return Result.ok(version, "Section version retrieved successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to retrieve section version: {str(e)}")
+    
     async def get_by_id(self, query: GetSectionByIdQuery) -> Result[Section]:
         """
         Execute the get section by id query.
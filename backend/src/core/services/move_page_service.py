@@ -0,0 +1,78 @@
+"""Service for moving pages within the page hierarchy."""
+
+from typing import Optional
+
+from src.core.commands.page_commands import MovePageCommand
+from src.core.common.result import Result
+from src.core.domain.page import Page
+from src.core.interfaces.autosave_buffer import IAutosaveBuffer
+from src.core.interfaces.repositories import IPageRepository
+
+
+class MovePageService:
+    """Service to handle page move business logic."""
+    
+    def __init__(
+        self,
+        page_repository: IPageRepository,
+        autosave_buffer: Optional[IAutosaveBuffer] = None
+    ):
+        """
+        Initialize the service.
+        
+        Args:
+            page_repository: Repository for page persistence.
+            autosave_buffer: Optional write-behind buffer; a page's pending
+                autosave is flushed before the move, which it would
+                otherwise undo when it writes the old display order.
+        """
+        self.page_repository = page_repository
+        self.autosave_buffer = autosave_buffer
+    
+    async def execute(self, command: MovePageCommand) -> Result[Page]:
+        """
+        Execute the move page command.
+        
+        Subpages move along with the page. The new parent must be a live
+        page of the same section and must not lie inside the moved subtree.
+        
+        Args:
+            command: The move page command.
+            
+        Returns:
+            Result containing the moved page or error information.
+        """
+        if command.display_order < 0:
+            return Result.fail("Validation failed: Display order must be non-negative")
+        
+        if self.autosave_buffer:
+            try:
+                await self.autosave_buffer.flush(command.id)
+            except Exception as e:
+                return Result.fail(f"Failed to move page: {str(e)}")
+        
+        page = await self.page_repository.get_by_id(command.id)
+        if not page:
+            return Result.fail(f"Page with id {command.id} not found")
+        
+        if command.parent_page_id:
+            if command.parent_page_id == command.id:
+                return Result.fail("Cannot move a page under itself")
+            
+            parent = await self.page_repository.get_by_id(command.parent_page_id)
+            if not parent or parent.is_deleted():
+                return Result.fail(f"Parent page with id {command.parent_page_id} not found")
+            if parent.section_id != page.section_id:
+                return Result.fail("Parent page must be in the same section")
+            
+            ancestors = await self.page_repository.get_ancestors(parent.id)
+            if any(ancestor.id == page.id for ancestor in ancestors):
+                return Result.fail("Cannot move a page under one of its own subpages")
+        
+        try:
+            moved_page = await self.page_repository.move(
+                command.id, command.parent_page_id, command.display_order
+            )
+            return Result.ok(moved_page, "Page moved successfully")
+        except Exception as e:
+            return Result.fail(f"Failed to move page: {str(e)}")
@@ -0,0 +1,55 @@
+"""Service for rebuilding page search data."""
+
+from src.core.commands.search_commands import ReindexPagesCommand
+from src.core.common.result import Result
+from src.core.domain.reindex_progress import ReindexProgress
+from src.core.interfaces.search_index import ISearchReindexer
+
+MAX_REINDEX_BATCH_SIZE = 5000
+
+
+class ReindexPagesService:
+    """Service to handle search reindex business logic."""
+
+    def __init__(self, reindexer: ISearchReindexer):
+        """
+        Initialize the service.
+
+        Args:
+            reindexer: Background job that rewrites search data in batches.
+        """
+        self.reindexer = reindexer
+
+    async def execute(self, command: ReindexPagesCommand) -> Result[ReindexProgress]:
+        """
+        Execute the reindex pages command.
+
+        Args:
+            command: The reindex pages command.
+
+        Returns:
+            Result containing the progress of the started job, or error
+            information if a reindex is already running.
+        """
+        if command.batch_size < 1 or command.batch_size > MAX_REINDEX_BATCH_SIZE:
+            return Result.validation_error(
+                "batch_size", f"Batch size must be between 1 and {MAX_REINDEX_BATCH_SIZE}"
+            )
+
+        if self.reindexer.get_progress().is_running():
+            return Result.fail("A reindex is already running")
+
+        try:
+            progress = await self.reindexer.start(command.batch_size, command.rebuild_fulltext)
+            return Result.ok(progress, "Reindex started")
+        except Exception as e:
+            return Result.fail(f"Failed to start reindex: {str(e)}")
+
+    async def get_progress(self) -> Result[ReindexProgress]:
+        """
+        Get the progress of the current or last reindex.
+
+        Returns:
+            Result containing the reindex progress.
+        """
+        return Result.ok(self.reindexer.get_progress())
@@ -0,0 +1,110 @@
+"""Service for full-text page search."""
+
+from typing import List, Optional, Tuple
+
+from src.core.queries.queries import SearchPagesQuery
+from src.core.common.cursor import encode_cursor, decode_cursor
+from src.core.common.result import Result
+from src.core.domain.search_result import SearchHit, SearchResults
+from src.core.interfaces.repositories import ISearchRepository
+from src.core.interfaces.search_index import ISpellingIndex
+
+MAX_SEARCH_LIMIT = 100
+
+# Fewer exact hits than this on the first page triggers the fuzzy fallback
+FUZZY_MIN_HITS = 3
+
+
+class SearchPagesService:
+    """Service to handle page search business logic."""
+
+    def __init__(
+        self,
+        search_repository: ISearchRepository,
+        spelling_index: Optional[ISpellingIndex] = None
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            search_repository: Repository for full-text page search.
+            spelling_index: Optional typo corrector used when exact
+                matching finds too few pages.
+        """
+        self.search_repository = search_repository
+        self.spelling_index = spelling_index
+
+    async def execute(self, query: SearchPagesQuery) -> Result[SearchResults]:
+        """
+        Execute the search pages query.
+
+        Args:
+            query: The search pages query.
+
+        Returns:
+            Result containing one page of ranked hits and the cursor for the
+            next page, or error information.
+        """
+        if query.limit < 1 or query.limit > MAX_SEARCH_LIMIT:
+            return Result.validation_error(
+                "limit", f"Limit must be between 1 and {MAX_SEARCH_LIMIT}"
+            )
+
+        after = None
+        if query.cursor:
+            try:
+                rank, page_id = decode_cursor(query.cursor, 2)
+                after = (float(rank), str(page_id))
+            except (TypeError, ValueError):
+                return Result.validation_error("cursor", "Invalid search cursor")
+
+        # An empty query matches nothing rather than everything
+        if not query.q or not query.q.strip():
+            return Result.ok(SearchResults(hits=[]), "Empty search query")
+
+        try:
+            hits, next_cursor = await self._search(query.q.strip(), query, after)
+
+            # Only the first page falls back; later pages carry the corrected query
+            corrected_query = None
+            if (
+                query.fuzzy
+                and after is None
+                and self.spelling_index is not None
+                and len(hits) < FUZZY_MIN_HITS
+            ):
+                corrected_query = await self.spelling_index.correct(query.q.strip())
+                if corrected_query:
+                    fuzzy_hits, fuzzy_cursor = await self._search(corrected_query, query, None)
+                    if len(fuzzy_hits) > len(hits):
+                        hits, next_cursor = fuzzy_hits, fuzzy_cursor
+                    else:
+                        corrected_query = None
+        except Exception as e:
+            return Result.fail(f"Failed to search pages: {str(e)}")
+
+        return Result.ok(
+            SearchResults(hits=hits, next_cursor=next_cursor, corrected_query=corrected_query),
+            f"Found {len(hits)} matching pages"
+        )
+
+    async def _search(
+        self,
+        query_text: str,
+        query: SearchPagesQuery,
+        after: Optional[Tuple[float, str]]
+    ) -> Tuple[List[SearchHit], Optional[str]]:
+        # Fetch one extra hit to learn whether another page exists
+        hits = await self.search_repository.search(
+            query_text,
+            limit=query.limit + 1,
+            notebook_id=query.notebook_id,
+            section_id=query.section_id,
+            after=after
+        )
+
+        next_cursor = None
+        if len(hits) > query.limit:
+            hits = hits[:query.limit]
+            next_cursor = encode_cursor(hits[-1].rank, hits[-1].page_id)
+        return hits, next_cursor
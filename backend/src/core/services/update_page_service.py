@@ -1,36 +1,37 @@
 """Service for updating pages."""
 
-import re
+from typing import Optional
 
 from src.core.commands.page_commands import UpdatePageCommand
+from src.core.common.markdown import extract_plain_text
 from src.core.common.result import Result
 from src.core.domain.page import Page
+from src.core.interfaces.autosave_buffer import IAutosaveBuffer
 from src.core.interfaces.repositories import IPageRepository
-
-
-def extract_plain_text(markdown_content: str) -> str:
-    """Extract plain text from markdown for search indexing."""
-    text = markdown_content
-    text = re.sub(r'```[\s\S]*?```', '', text)  # Remove code blocks
-    text = re.sub(r'`[^`]*`', '', text)  # Remove inline code
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)  # Remove links but keep text
-    text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', '', text)  # Remove images
-    text = re.sub(r'^#+\s+', '', text, flags=re.MULTILINE)  # Remove headers
-    text = re.sub(r'[*_]{1,2}([^*_]+)[*_]{1,2}', r'\1', text)  # Remove bold/italic
-    return text.strip()
+from src.core.interfaces.search_index import ISearchIndex
 
 
 class UpdatePageService:
     """Service to handle page update business logic."""
     
-    def __init__(self, page_repository: IPageRepository):
+    def __init__(
+        self,
+        page_repository: IPageRepository,
+        search_index: Optional[ISearchIndex] = None,
+        autosave_buffer: Optional[IAutosaveBuffer] = None
+    ):
         """
         Initialize the service.
         
         Args:
             page_repository: Repository for page persistence.
+            search_index: Optional index to keep in sync with page writes.
+            autosave_buffer: Optional write-behind buffer; a page's pending
+                autosave is flushed before an explicit save.
         """
         self.page_repository = page_repository
+        self.search_index = search_index
+        self.autosave_buffer = autosave_buffer
     
     async def execute(self, command: UpdatePageCommand) -> Result[Page]:
         """
@@ -40,30 +41,53 @@ class UpdatePageService:
             command: The update page command.
             
         Returns:
-            Result containing the updated page or error information.
+            Result containing the updated page or error information. The
+            message starts with ``Version conflict`` when the page is no
+            longer at ``command.base_version``.
         """
-        # Retrieve existing page
-        page = await self.page_repository.get_by_id(command.id)
-        if not page:
-            return Result.fail(f"Page with id {command.id} not found")
-        
-        # Update fields
-        if command.title is not None:
-            page.title = command.title.strip()
-        if command.content is not None:
-            page.content = command.content
-            page.content_plain = extract_plain_text(command.content)
-        if command.display_order is not None:
-            page.display_order = command.display_order
+        if self.autosave_buffer:
+            try:
+                await self.autosave_buffer.flush(command.id)
+            except Exception as e:
+                return Result.fail(f"Failed to update page: {str(e)}")
         
-        # Validate domain rules
-        is_valid, error_msg = page.validate()
+        title = command.title.strip() if command.title is not None else None
+        is_valid, error_msg = Page.validate_changes(
+            title=title, display_order=command.display_order
+        )
         if not is_valid:
             return Result.fail(f"Validation failed: {error_msg}")
         
-        # Persist
+        # One conditional UPDATE ... RETURNING; the page is not read first
         try:
-            updated_page = await self.page_repository.update(page)
+            updated_page = await self.page_repository.update_fields(
+                command.id,
+                command.base_version,
+                title=title,
+                content=command.content,
+                content_plain=(
+                    extract_plain_text(command.content) if command.content is not None else None
+                ),
+                display_order=command.display_order,
+            )
+            if updated_page is None:
+                # Only failed updates pay for telling a missing page from a stale version
+                if command.base_version is not None and await self.page_repository.get_version(
+                    command.id
+                ):
+                    return Result.fail(
+                        f"Version conflict: page {command.id} changed since version "
+                        f"{command.base_version}"
+                    )
+                return Result.fail(f"Page with id {command.id} not found")
+            
+            # Validate the stored result; the caller's transaction is rolled back on failure
+            is_valid, error_msg = updated_page.validate()
+            if not is_valid:
+                return Result.fail(f"Validation failed: {error_msg}")
+            
+            if self.search_index:
+                await self.search_index.index_page(updated_page)
             return Result.ok(updated_page, "Page updated successfully")
         except Exception as e:
             return Result.fail(f"Failed to update page: {str(e)}")
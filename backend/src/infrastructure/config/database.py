@@ -32,11 +32,23 @@ async def init_db():
     """Initialize database - create tables."""
     async with engine.begin() as conn:
         # Import all models here to ensure they're registered
-        from src.infrastructure.data.models import notebook_model, section_model, page_model, tag_model
+        from src.infrastructure.data.models import (
+            notebook_model,
+            section_model,
+            page_model,
+            tag_model,
+            page_term_offsets_model,
+            page_path_model,
+        )
 
         # Create tables
         await conn.run_sync(Base.metadata.create_all)
 
+        # Create full-text search index and sync triggers
+        from src.infrastructure.data.repositories.search_repository import ensure_search_schema
+
+        await conn.run_sync(ensure_search_schema, settings.search_backend)
+
 
 async def get_db() -> AsyncSession:
     """Dependency for getting database session."""
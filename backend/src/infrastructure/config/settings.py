@@ -17,6 +17,15 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./notebooks.db"
 
+    # Search
+    search_backend: str = Field(default="database", pattern="^(database|memory)$")
+    search_cache_size: int = Field(default=1024, ge=0, le=100000)
+
+    # Compression
+    response_compression: bool = True
+    compression_minimum_size: int = Field(default=1000, ge=0)
+    precompress_static: bool = True
+
     # File Storage
     upload_dir: str = "./static/uploads"
     max_upload_size_mb: int = Field(default=5, ge=1, le=100)
@@ -27,6 +36,10 @@ class Settings(BaseSettings):
 
     # Auto-save
     auto_save_interval_ms: int = Field(default=3000, ge=1000, le=60000)
+    autosave_write_behind: bool = False
+    autosave_flush_interval_seconds: float = Field(default=10.0, gt=0, le=300)
+    autosave_journal_path: str = "./autosave-journal.jsonl"
+    autosave_journal_fsync: bool = False
 
     # Server
     host: str = "0.0.0.0"
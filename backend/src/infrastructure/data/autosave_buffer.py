@@ -0,0 +1,236 @@
+"""Write-behind buffer that coalesces page autosaves.
+
+Editors autosave every few seconds; writing each one through is a
+transaction per tick per open page. The buffer keeps only the latest
+autosave of each page in memory and writes them out together on a timer,
+when a page is saved explicitly or read back, and at shutdown.
+
+Every buffered autosave is first appended to a local JSON-lines journal,
+so a crashed process loses nothing: :meth:`AutosaveBuffer.replay` writes
+the journal's pages at the next startup. The journal is rewritten with
+just the still-pending pages after each flush.
+
+The buffer lives in one process, so it is off unless enabled with
+``AUTOSAVE_WRITE_BEHIND=true``; only enable it with a single worker.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.common.errors import VersionConflictError
+from src.core.common.markdown import extract_plain_text
+from src.core.domain.page import Page
+from src.core.interfaces.autosave_buffer import IAutosaveBuffer
+from src.core.interfaces.search_index import ISearchIndex
+from src.infrastructure.data.repositories.page_repository import PageRepository
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FIELDS = ("id", "section_id", "title", "content", "display_order", "version")
+
+
+class AutosaveBuffer(IAutosaveBuffer):
+    """
+    Latest pending autosave per page, journaled and flushed in batches.
+
+    A flush writes every pending page in one transaction, each with a
+    conditional update against the version its buffered changes started
+    from. A page saved again since is skipped, so a late flush or a
+    replayed journal never overwrites a newer state.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        index_factory: Callable[[AsyncSession], ISearchIndex],
+        journal_path: Union[str, Path],
+        fsync: bool = False
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            session_factory: Factory for the flush sessions.
+            index_factory: Builds the search indexes bound to a flush session.
+            journal_path: Append-only journal of buffered autosaves.
+            fsync: Force each journal append to disk. Without it a process
+                crash loses nothing, but an operating system crash may.
+        """
+        self.session_factory = session_factory
+        self.index_factory = index_factory
+        self.journal_path = Path(journal_path)
+        self.fsync = fsync
+        self._pending: Dict[str, Page] = {}
+        self._base_versions: Dict[str, int] = {}
+        self._journal = None
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def pending_ids(self) -> List[str]:
+        """Ids of the pages with an autosave not yet written."""
+        return list(self._pending)
+
+    def get(self, page_id: str) -> Optional[Page]:
+        """Get a copy of the pending state of a page, or None if nothing is buffered."""
+        page = self._pending.get(page_id)
+        return replace(page) if page else None
+
+    async def put(self, page: Page, base_version: int) -> None:
+        """Journal a page state, then make it the page's pending autosave."""
+        base_version = self._base_versions.get(page.id, base_version)
+        self._append(page, base_version)
+        self._pending[page.id] = replace(page)
+        self._base_versions[page.id] = base_version
+
+    async def flush(self, page_id: Optional[str] = None) -> int:
+        """
+        Write pending pages (all, or just ``page_id``) in one transaction.
+
+        Pages buffered again while the flush runs stay pending.
+
+        Returns:
+            Number of pages written.
+        """
+        if page_id is not None and page_id not in self._pending:
+            return 0
+
+        async with self._flush_lock:
+            if page_id is None:
+                batch = list(self._pending.values())
+            else:
+                batch = [self._pending[page_id]] if page_id in self._pending else []
+            if not batch:
+                return 0
+
+            written = await self._write(batch)
+
+            for page in batch:
+                if self._pending.get(page.id) is page:
+                    del self._pending[page.id]
+                    del self._base_versions[page.id]
+                elif page.id in written:
+                    # Buffered again during the write; that change builds on this one
+                    self._base_versions[page.id] = page.version
+            self._rewrite_journal()
+            return len(written)
+
+    async def replay(self) -> int:
+        """
+        Buffer the pages left in the journal by a previous process and flush them.
+
+        Returns:
+            Number of pages written.
+        """
+        for page, base_version in self._read_journal():
+            pending = self._pending.get(page.id)
+            if pending is None or pending.version <= page.version:
+                self._pending[page.id] = page
+            self._base_versions.setdefault(page.id, base_version)
+        return await self.flush()
+
+    def start(self, interval_seconds: float) -> None:
+        """Flush every ``interval_seconds`` in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(interval_seconds))
+
+    async def stop(self) -> None:
+        """Stop the timer and flush whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    async def _run(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                # Pages stay pending and journaled; the next tick retries
+                logger.exception("Autosave flush failed")
+
+    async def _write(self, batch: List[Page]) -> Set[str]:
+        written = set()
+        async with self.session_factory() as session:
+            repository = PageRepository(session)
+            index = self.index_factory(session)
+            for page in batch:
+                stored = replace(page, content_plain=extract_plain_text(page.content))
+                try:
+                    # Stamped with the flush time, not the autosave time, so the
+                    # write is newer than anything already in the notebook tree
+                    saved = await repository.update(stored, self._base_versions[page.id])
+                except VersionConflictError as e:
+                    # Already written, or saved again since
+                    logger.info("Skipping buffered autosave: %s", e)
+                    continue
+                await index.index_page(saved)
+                written.add(page.id)
+            await session.commit()
+        return written
+
+    def _append(self, page: Page, base_version: int) -> None:
+        if self._journal is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "ab")
+        self._journal.write(self._encode(page, base_version))
+        self._journal.flush()
+        if self.fsync:
+            os.fsync(self._journal.fileno())
+
+    def _rewrite_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if not self._pending:
+            self.journal_path.unlink(missing_ok=True)
+            return
+        compacted = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(compacted, "wb") as journal:
+            for page in self._pending.values():
+                journal.write(self._encode(page, self._base_versions[page.id]))
+            journal.flush()
+            os.fsync(journal.fileno())
+        os.replace(compacted, self.journal_path)
+
+    def _read_journal(self) -> List[Tuple[Page, int]]:
+        try:
+            lines = self.journal_path.read_bytes().splitlines()
+        except FileNotFoundError:
+            return []
+        pages = []
+        for line in lines:
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # A crash mid-append leaves at most one partial, final line
+                logger.warning("Skipping unreadable autosave journal entry")
+                continue
+            page = Page(
+                **{name: record[name] for name in JOURNAL_FIELDS},
+                updated_at=datetime.fromisoformat(record["updated_at"]),
+            )
+            pages.append((page, record["base_version"]))
+        return pages
+
+    @staticmethod
+    def _encode(page: Page, base_version: int) -> bytes:
+        record = {name: getattr(page, name) for name in JOURNAL_FIELDS}
+        record["updated_at"] = page.updated_at
+        record["base_version"] = base_version
+        return orjson.dumps(record) + b"\n"
@@ -0,0 +1,45 @@
+"""Named loader-option sets for repository queries.
+
+Model relationships are declared ``lazy="raise_on_sql"``, so nothing
+beyond an entity's own columns is loaded unless a query asks for it.
+Repositories pass one of these profiles to ``Select.options`` to state
+exactly what a method loads; touching anything outside the profile
+raises instead of silently issuing more SQL.
+
+To load related rows, add a profile here (e.g. ``selectinload(...)``
+followed by ``raiseload("*")``) and use it from the repository method
+that needs it. Read-only listings may select one of the column
+projections instead and build entities from the rows.
+"""
+
+from sqlalchemy.orm import raiseload
+
+from src.infrastructure.data.models.page_model import PageModel
+
+# The entity's columns and nothing else
+SCALARS = (raiseload("*"),)
+
+# Column projections for list reads. Rows unpack straight into the domain
+# dataclasses of the same field names (``Page(**row)``), skipping ORM
+# instances and the identity map.
+PAGE_COLUMNS = (
+    PageModel.id,
+    PageModel.section_id,
+    PageModel.title,
+    PageModel.content,
+    PageModel.content_plain,
+    PageModel.parent_page_id,
+    PageModel.display_order,
+    PageModel.version,
+    PageModel.created_at,
+    PageModel.updated_at,
+    PageModel.deleted_at,
+)
+PAGE_SUMMARY_COLUMNS = (
+    PageModel.id,
+    PageModel.section_id,
+    PageModel.title,
+    PageModel.parent_page_id,
+    PageModel.display_order,
+    PageModel.updated_at,
+)
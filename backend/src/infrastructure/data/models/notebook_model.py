@@ -18,11 +18,13 @@ class NotebookModel(Base, TimestampMixin, SoftDeleteMixin):
     color = Column(String(7), nullable=False, default="#0078D4")
     
     # Relationships
+    # Never loaded implicitly; repositories opt in through load profiles
     sections = relationship(
         "SectionModel",
         back_populates="notebook",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
     
     def to_dict(self):
@@ -1,7 +1,8 @@
 """SQLAlchemy model for Page."""
 
 from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, backref
 from datetime import datetime
 
 from src.infrastructure.data.models.base import TimestampMixin, SoftDeleteMixin
@@ -19,12 +20,20 @@ class PageModel(Base, TimestampMixin, SoftDeleteMixin):
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False, default="")
     content_plain = Column(Text, nullable=False, default="")
-    search_vector = Column(Text, nullable=True)
+    # tsvector on PostgreSQL; its index and trigger come from ensure_search_schema
+    search_vector = Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True)
     display_order = Column(Integer, nullable=False, default=0)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     # Relationships
-    section = relationship("SectionModel", back_populates="pages")
-    parent_page = relationship("PageModel", remote_side=[id], backref="subpages")
+    # Never loaded implicitly; repositories opt in through load profiles
+    section = relationship("SectionModel", back_populates="pages", lazy="raise_on_sql")
+    parent_page = relationship(
+        "PageModel",
+        remote_side=[id],
+        lazy="raise_on_sql",
+        backref=backref("subpages", lazy="raise_on_sql", passive_deletes=True)
+    )
     
     def to_dict(self):
         """Convert model to dictionary."""
@@ -36,6 +45,7 @@ class PageModel(Base, TimestampMixin, SoftDeleteMixin):
             "content": self.content,
             "content_plain": self.content_plain,
             "display_order": self.display_order,
+            "version": self.version,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
@@ -0,0 +1,25 @@
+"""SQLAlchemy model for the page hierarchy closure table."""
+
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+
+from src.infrastructure.config.database import Base
+
+
+class PagePathModel(Base):
+    """
+    One ancestor/descendant pair of the page hierarchy.
+
+    Every page has a row pointing at itself (``depth`` 0) plus one row per
+    ancestor, ``depth`` being the number of levels between the two. Kept
+    in step with ``pages.parent_page_id`` by the page repository.
+    """
+    
+    __tablename__ = "page_paths"
+    
+    ancestor_id = Column(String(36), ForeignKey("pages.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(String(36), ForeignKey("pages.id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_page_paths_descendant_depth", "descendant_id", "depth"),
+    )
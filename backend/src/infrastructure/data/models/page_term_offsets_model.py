@@ -0,0 +1,20 @@
+"""SQLAlchemy model for precomputed search-term offsets."""
+
+from sqlalchemy import Column, Integer, String, LargeBinary, ForeignKey
+
+from src.infrastructure.config.database import Base
+
+
+class PageTermOffsetsModel(Base):
+    """
+    Occurrences of every term in one page's Markdown content.
+
+    ``offsets`` packs the spans of all terms, see ``encode_term_offsets``;
+    ``version`` is the page version they were computed from.
+    """
+    
+    __tablename__ = "page_term_offsets"
+    
+    page_id = Column(String(36), ForeignKey("pages.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, nullable=False)
+    offsets = Column(LargeBinary, nullable=False)
@@ -19,12 +19,14 @@ class SectionModel(Base, TimestampMixin, SoftDeleteMixin):
     display_order = Column(Integer, nullable=False, default=0)
     
     # Relationships
-    notebook = relationship("NotebookModel", back_populates="sections")
+    # Never loaded implicitly; repositories opt in through load profiles
+    notebook = relationship("NotebookModel", back_populates="sections", lazy="raise_on_sql")
     pages = relationship(
         "PageModel",
         back_populates="section",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
     
     def to_dict(self):
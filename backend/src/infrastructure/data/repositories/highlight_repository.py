@@ -0,0 +1,131 @@
+"""Highlight repository backed by precomputed term offsets."""
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.page import Page
+from src.core.domain.search_result import HighlightRange
+from src.core.interfaces.repositories import IHighlightRepository
+from src.core.interfaces.search_index import ISearchIndex
+from src.infrastructure.data.models.page_model import PageModel
+from src.infrastructure.data.models.page_term_offsets_model import PageTermOffsetsModel
+from src.infrastructure.search.encoding import decode_term_offsets, encode_term_offsets
+from src.infrastructure.search.tokenizer import iter_token_spans, tokenize
+
+# Longer tokens (hashes, base64 blobs) are not worth highlighting
+MAX_TERM_LENGTH = 64
+
+# Distinct query words looked up per request
+MAX_QUERY_TERMS = 32
+
+
+def collect_term_offsets(content: str) -> Dict[str, List[Tuple[int, int]]]:
+    """Group the ``(start, end)`` spans of every word in ``content`` by lowercase term."""
+    offsets: Dict[str, List[Tuple[int, int]]] = {}
+    for term, start, end in iter_token_spans(content):
+        if len(term) <= MAX_TERM_LENGTH:
+            offsets.setdefault(term, []).append((start, end))
+    return offsets
+
+
+class HighlightRepository(IHighlightRepository, ISearchIndex):
+    """
+    Term offsets stored as one blob per page in ``page_term_offsets``.
+
+    Page writes do not touch the offsets: each blob is stamped with the page
+    version it was computed from, and a highlight request for a page whose
+    blob is missing or older recomputes it from the content once and stores
+    it. The background reindexer precomputes them through
+    :meth:`index_pages`, so most highlight requests are a single
+    primary-key read that decodes only the query's terms.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def index_page(self, page: Page) -> None:
+        """Replace the stored offsets of a page."""
+        await self.index_pages([page])
+
+    async def index_pages(self, pages: List[Page]) -> None:
+        """Replace the stored offsets of a batch of pages in one upsert."""
+        live = [page for page in pages if not page.is_deleted()]
+        await self.remove_pages([page.id for page in pages if page.is_deleted()])
+        if live:
+            await self.db.execute(
+                self._upsert(),
+                [
+                    self._row(page.id, page.version, collect_term_offsets(page.content))
+                    for page in live
+                ],
+            )
+
+    async def remove_page(self, page_id: str) -> None:
+        """Drop the stored offsets of a page."""
+        await self.remove_pages([page_id])
+
+    async def remove_pages(self, page_ids: List[str]) -> None:
+        """Drop the stored offsets of a batch of pages in one statement."""
+        if page_ids:
+            await self.db.execute(
+                delete(PageTermOffsetsModel).where(PageTermOffsetsModel.page_id.in_(page_ids))
+            )
+
+    async def get_highlights(self, page_id: str, query_text: str) -> Optional[List[HighlightRange]]:
+        """Find where the words of a query occur in a live page's content."""
+        result = await self.db.execute(
+            select(
+                PageModel.version,
+                PageTermOffsetsModel.version.label("offsets_version"),
+                PageTermOffsetsModel.offsets,
+            )
+            .outerjoin(PageTermOffsetsModel, PageTermOffsetsModel.page_id == PageModel.id)
+            .where(PageModel.id == page_id, PageModel.deleted_at.is_(None))
+        )
+        page = result.first()
+        if page is None:
+            return None
+
+        terms = list(dict.fromkeys(tokenize(query_text)))[:MAX_QUERY_TERMS]
+        if not terms:
+            return []
+
+        if page.offsets_version == page.version:
+            spans = decode_term_offsets(page.offsets, terms)
+        else:
+            spans = await self._refresh(page_id, terms)
+
+        ranges = [
+            HighlightRange(start=start, end=end, term=term)
+            for term, term_spans in spans.items()
+            for start, end in term_spans
+        ]
+        ranges.sort(key=lambda r: r.start)
+        return ranges
+
+    async def _refresh(self, page_id: str, terms: List[str]) -> Dict[str, List[Tuple[int, int]]]:
+        result = await self.db.execute(
+            select(PageModel.version, PageModel.content).where(PageModel.id == page_id)
+        )
+        page = result.one()
+        offsets = collect_term_offsets(page.content or "")
+        await self.db.execute(self._upsert(), [self._row(page_id, page.version, offsets)])
+        return {term: offsets[term] for term in terms if term in offsets}
+
+    def _upsert(self):
+        dialect_insert = (
+            postgresql_insert if self.db.bind.dialect.name == "postgresql" else sqlite_insert
+        )
+        statement = dialect_insert(PageTermOffsetsModel)
+        return statement.on_conflict_do_update(
+            index_elements=[PageTermOffsetsModel.page_id],
+            set_={"version": statement.excluded.version, "offsets": statement.excluded.offsets},
+        )
+
+    @staticmethod
+    def _row(page_id: str, version: int, offsets: Dict[str, List[Tuple[int, int]]]) -> dict:
+        return {"page_id": page_id, "version": version, "offsets": encode_term_offsets(offsets)}
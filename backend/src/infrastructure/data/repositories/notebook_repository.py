@@ -1,15 +1,20 @@
 """Notebook repository implementation."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, literal_column, select, tuple_, union_all
 
 from src.core.domain.notebook import Notebook
+from src.core.domain.notebook_tree import NotebookTree
+from src.core.domain.page import PageSummary
+from src.core.domain.section import Section
 from src.core.interfaces.repositories import INotebookRepository
 from src.infrastructure.data.models.notebook_model import NotebookModel
+from src.infrastructure.data.models.section_model import SectionModel
+from src.infrastructure.data.models.page_model import PageModel
+from src.infrastructure.data.load_profiles import SCALARS
 
 
 class NotebookRepository(INotebookRepository):
@@ -54,20 +59,36 @@ class NotebookRepository(INotebookRepository):
     
     async def get_by_id(self, notebook_id: str) -> Optional[Notebook]:
         """Get notebook by ID."""
-        query = select(NotebookModel).where(NotebookModel.id == notebook_id)
+        query = select(NotebookModel).options(*SCALARS).where(NotebookModel.id == notebook_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
         return self._to_domain(model) if model else None
     
-    async def get_all(self, include_deleted: bool = False) -> List[Notebook]:
-        """Get all notebooks."""
-        query = select(NotebookModel)
+    async def get_version(self, notebook_id: str) -> Optional[str]:
+        """Get the notebook's change token: its ``updated_at``, read without loading the row."""
+        query = select(NotebookModel.updated_at).where(NotebookModel.id == notebook_id)
+        updated_at = (await self.db.execute(query)).scalar_one_or_none()
+        
+        return updated_at.isoformat() if updated_at else None
+    
+    async def get_all(
+        self,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> List[Notebook]:
+        """Get notebooks, newest first, optionally after a keyset position."""
+        query = select(NotebookModel).options(*SCALARS)
         
         if not include_deleted:
             query = query.where(NotebookModel.deleted_at.is_(None))
+        if after:
+            query = query.where(tuple_(NotebookModel.created_at, NotebookModel.id) < tuple_(*after))
         
-        query = query.order_by(NotebookModel.created_at.desc())
+        query = query.order_by(NotebookModel.created_at.desc(), NotebookModel.id.desc()).limit(
+            limit
+        )
         result = await self.db.execute(query)
         models = result.scalars().all()
         
@@ -75,7 +96,7 @@ class NotebookRepository(INotebookRepository):
     
     async def update(self, notebook: Notebook) -> Notebook:
         """Update existing notebook."""
-        query = select(NotebookModel).where(NotebookModel.id == notebook.id)
+        query = select(NotebookModel).options(*SCALARS).where(NotebookModel.id == notebook.id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -93,7 +114,7 @@ class NotebookRepository(INotebookRepository):
     
     async def delete(self, notebook_id: str) -> bool:
         """Soft delete notebook."""
-        query = select(NotebookModel).where(NotebookModel.id == notebook_id)
+        query = select(NotebookModel).options(*SCALARS).where(NotebookModel.id == notebook_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -107,7 +128,7 @@ class NotebookRepository(INotebookRepository):
     
     async def restore(self, notebook_id: str) -> bool:
         """Restore soft-deleted notebook."""
-        query = select(NotebookModel).where(NotebookModel.id == notebook_id)
+        query = select(NotebookModel).options(*SCALARS).where(NotebookModel.id == notebook_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -118,3 +139,110 @@ class NotebookRepository(INotebookRepository):
         await self.db.flush()
         
         return True
+    
+    async def get_page_ids(self, notebook_id: str) -> List[str]:
+        """Get the ids of the live pages in a notebook's live sections."""
+        query = (
+            select(PageModel.id)
+            .join(SectionModel, PageModel.section_id == SectionModel.id)
+            .where(
+                SectionModel.notebook_id == notebook_id,
+                SectionModel.deleted_at.is_(None),
+                PageModel.deleted_at.is_(None),
+            )
+        )
+        return list((await self.db.execute(query)).scalars())
+    
+    async def get_tree_version(self, notebook_id: str) -> Optional[str]:
+        """
+        Get a live notebook's tree change token from one aggregate query.
+        
+        Soft deletes, moves and reorders all bump ``updated_at``, so the
+        newest ``updated_at`` across the notebook, its sections and their
+        pages changes with every edit; the row count covers hard deletes.
+        Deleted rows are included on purpose, so a deletion still counts.
+        """
+        rows = union_all(
+            select(NotebookModel.updated_at, literal_column("1").label("is_notebook"))
+            .where(NotebookModel.id == notebook_id, NotebookModel.deleted_at.is_(None)),
+            select(SectionModel.updated_at, literal_column("0"))
+            .where(SectionModel.notebook_id == notebook_id),
+            select(PageModel.updated_at, literal_column("0"))
+            .join(SectionModel, PageModel.section_id == SectionModel.id)
+            .where(SectionModel.notebook_id == notebook_id),
+        ).subquery()
+        query = select(func.max(rows.c.updated_at), func.count(), func.sum(rows.c.is_notebook))
+        latest, count, notebooks = (await self.db.execute(query)).one()
+        
+        return f"{latest}:{count}" if notebooks else None
+    
+    async def get_tree(self, notebook_id: str) -> Optional[NotebookTree]:
+        """Get a live notebook's sections and page metadata, without page content."""
+        # Column selects only, so page content is never read
+        sections_query = (
+            select(
+                NotebookModel.id.label("notebook_id"),
+                SectionModel.id,
+                SectionModel.name,
+                SectionModel.display_order,
+                SectionModel.created_at,
+                SectionModel.updated_at,
+            )
+            .select_from(NotebookModel)
+            .outerjoin(
+                SectionModel,
+                (SectionModel.notebook_id == NotebookModel.id) & SectionModel.deleted_at.is_(None),
+            )
+            .where(NotebookModel.id == notebook_id, NotebookModel.deleted_at.is_(None))
+            .order_by(SectionModel.display_order, SectionModel.id)
+        )
+        rows = (await self.db.execute(sections_query)).all()
+        if not rows:
+            return None
+        
+        tree = NotebookTree(notebook_id=notebook_id)
+        tree.sections = [
+            Section(
+                id=row.id,
+                notebook_id=row.notebook_id,
+                name=row.name,
+                display_order=row.display_order,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in rows if row.id is not None
+        ]
+        if not tree.sections:
+            return tree
+        
+        pages_query = (
+            select(
+                PageModel.id,
+                PageModel.section_id,
+                PageModel.title,
+                PageModel.parent_page_id,
+                PageModel.display_order,
+                PageModel.updated_at,
+            )
+            .join(SectionModel, PageModel.section_id == SectionModel.id)
+            .where(
+                SectionModel.notebook_id == notebook_id,
+                SectionModel.deleted_at.is_(None),
+                PageModel.deleted_at.is_(None),
+            )
+            .order_by(
+                SectionModel.display_order, SectionModel.id, PageModel.display_order, PageModel.id
+            )
+        )
+        tree.pages = [
+            PageSummary(
+                id=row.id,
+                section_id=row.section_id,
+                title=row.title,
+                parent_page_id=row.parent_page_id,
+                display_order=row.display_order,
+                updated_at=row.updated_at,
+            )
+            for row in await self.db.execute(pages_query)
+        ]
+        return tree
@@ -1,14 +1,39 @@
 """Page repository implementation."""
 
-from typing import List, Optional
+from dataclasses import asdict, replace
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import (
+    Text,
+    cast,
+    delete,
+    insert,
+    literal,
+    literal_column,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import aliased
 
-from src.core.domain.page import Page
+from src.core.common.errors import VersionConflictError
+from src.core.domain.breadcrumb import Breadcrumb, BreadcrumbItem
+from src.core.domain.page import Page, PageSummary, PageTreeNode
 from src.core.interfaces.repositories import IPageRepository
+from src.infrastructure.data.models.notebook_model import NotebookModel
+from src.infrastructure.data.models.section_model import SectionModel
 from src.infrastructure.data.models.page_model import PageModel
+from src.infrastructure.data.models.page_path_model import PagePathModel
+from src.infrastructure.data.load_profiles import PAGE_COLUMNS, PAGE_SUMMARY_COLUMNS, SCALARS
+
+
+# Offset that renders any non-negative display order as ten digits, so
+# sibling sort keys concatenate into fixed-width, pre-order sortable paths.
+_ORDER_KEY_OFFSET = 1_000_000_000
 
 
 class PageRepository(IPageRepository):
@@ -27,6 +52,7 @@ class PageRepository(IPageRepository):
             content_plain=model.content_plain,
             parent_page_id=model.parent_page_id,
             display_order=model.display_order,
+            version=model.version,
             created_at=model.created_at,
             updated_at=model.updated_at,
             deleted_at=model.deleted_at,
@@ -42,6 +68,7 @@ class PageRepository(IPageRepository):
             content_plain=entity.content_plain,
             parent_page_id=entity.parent_page_id,
             display_order=entity.display_order,
+            version=entity.version,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
             deleted_at=entity.deleted_at,
@@ -55,57 +82,319 @@ class PageRepository(IPageRepository):
         model = self._to_model(page)
         self.db.add(model)
         await self.db.flush()
+        
+        # Closure rows: the page itself plus every ancestor of its parent
+        paths = select(literal(model.id), literal(model.id), literal(0))
+        if model.parent_page_id:
+            paths = union_all(paths, select(
+                PagePathModel.ancestor_id, literal(model.id), PagePathModel.depth + 1
+            ).where(PagePathModel.descendant_id == model.parent_page_id))
+        await self.db.execute(
+            insert(PagePathModel).from_select(["ancestor_id", "descendant_id", "depth"], paths)
+        )
         await self.db.refresh(model)
         
         return self._to_domain(model)
     
+    async def create_many(self, pages: List[Page]) -> List[Page]:
+        """
+        Create a batch of pages in a fixed number of statements.
+        
+        The existing parents' ancestor rows are read in one query; the
+        pages and their closure rows are then each written with a single
+        executemany insert, without flushing or refreshing ORM instances.
+        """
+        now = datetime.utcnow()
+        created = [
+            replace(
+                page, id=page.id or str(uuid.uuid4()), version=1, created_at=now, updated_at=now
+            )
+            for page in pages
+        ]
+        
+        # Ancestor chains (ancestor_id, depth) of each page, starting with itself
+        chains: Dict[str, List[Tuple[str, int]]] = {}
+        batch_ids = {page.id for page in created}
+        existing_parents = {
+            page.parent_page_id for page in created if page.parent_page_id
+        } - batch_ids
+        if existing_parents:
+            result = await self.db.execute(
+                select(PagePathModel.descendant_id, PagePathModel.ancestor_id, PagePathModel.depth)
+                .where(PagePathModel.descendant_id.in_(existing_parents))
+            )
+            for row in result:
+                chains.setdefault(row.descendant_id, []).append((row.ancestor_id, row.depth))
+        
+        paths = []
+        for page in created:
+            chain = [(page.id, 0)]
+            if page.parent_page_id:
+                if page.parent_page_id not in chains:
+                    raise ValueError(f"Parent page not found: {page.parent_page_id}")
+                chain.extend(
+                    (ancestor_id, depth + 1) for ancestor_id, depth in chains[page.parent_page_id]
+                )
+            chains[page.id] = chain
+            paths.extend(
+                {"ancestor_id": ancestor_id, "descendant_id": page.id, "depth": depth}
+                for ancestor_id, depth in chain
+            )
+        
+        # Core table inserts: one executemany each, however the rows' NULLs fall
+        await self.db.execute(insert(PageModel.__table__), [asdict(page) for page in created])
+        await self.db.execute(insert(PagePathModel.__table__), paths)
+        
+        return created
+    
     async def get_by_id(self, page_id: str) -> Optional[Page]:
         """Get page by ID."""
-        query = select(PageModel).where(PageModel.id == page_id)
+        query = select(PageModel).options(*SCALARS).where(PageModel.id == page_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
         return self._to_domain(model) if model else None
     
-    async def get_by_section_id(self, section_id: str, include_deleted: bool = False) -> List[Page]:
-        """Get all pages in a section."""
-        query = select(PageModel).where(PageModel.section_id == section_id)
+    async def get_version(self, page_id: str) -> Optional[str]:
+        """Get the page's change token: its ``updated_at``, read without loading the row."""
+        query = select(PageModel.updated_at).where(PageModel.id == page_id)
+        updated_at = (await self.db.execute(query)).scalar_one_or_none()
+        
+        return updated_at.isoformat() if updated_at else None
+    
+    async def get_by_section_id(
+        self,
+        section_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[Page]:
+        """Get pages in a section, optionally after a keyset position."""
+        query = select(*PAGE_COLUMNS).where(PageModel.section_id == section_id)
         
         if not include_deleted:
             query = query.where(PageModel.deleted_at.is_(None))
+        if after:
+            query = query.where(tuple_(PageModel.display_order, PageModel.id) > tuple_(*after))
         
-        query = query.order_by(PageModel.display_order)
+        query = query.order_by(PageModel.display_order, PageModel.id).limit(limit)
         result = await self.db.execute(query)
-        models = result.scalars().all()
         
-        return [self._to_domain(model) for model in models]
+        return [Page(**row) for row in result.mappings()]
     
-    async def get_by_parent_id(self, parent_page_id: str, include_deleted: bool = False) -> List[Page]:
-        """Get all subpages of a page."""
-        query = select(PageModel).where(PageModel.parent_page_id == parent_page_id)
+    async def get_by_parent_id(
+        self,
+        parent_page_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[Page]:
+        """Get subpages of a page, optionally after a keyset position."""
+        query = select(*PAGE_COLUMNS).where(PageModel.parent_page_id == parent_page_id)
         
         if not include_deleted:
             query = query.where(PageModel.deleted_at.is_(None))
+        if after:
+            query = query.where(tuple_(PageModel.display_order, PageModel.id) > tuple_(*after))
         
-        query = query.order_by(PageModel.display_order)
+        query = query.order_by(PageModel.display_order, PageModel.id).limit(limit)
         result = await self.db.execute(query)
-        models = result.scalars().all()
         
-        return [self._to_domain(model) for model in models]
+        return [Page(**row) for row in result.mappings()]
     
-    async def update(self, page: Page) -> Page:
-        """Update existing page."""
-        query = select(PageModel).where(PageModel.id == page.id)
+    async def get_summaries_by_section_id(
+        self,
+        section_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[PageSummary]:
+        """Get metadata of pages in a section, without content, after a keyset position."""
+        query = select(*PAGE_SUMMARY_COLUMNS).where(PageModel.section_id == section_id)
+        
+        if not include_deleted:
+            query = query.where(PageModel.deleted_at.is_(None))
+        if after:
+            query = query.where(tuple_(PageModel.display_order, PageModel.id) > tuple_(*after))
+        
+        query = query.order_by(PageModel.display_order, PageModel.id).limit(limit)
+        result = await self.db.execute(query)
+        
+        return [PageSummary(**row) for row in result.mappings()]
+    
+    async def get_summaries_by_parent_id(
+        self,
+        parent_page_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[PageSummary]:
+        """Get metadata of subpages of a page, without content, after a keyset position."""
+        query = select(*PAGE_SUMMARY_COLUMNS).where(PageModel.parent_page_id == parent_page_id)
+        
+        if not include_deleted:
+            query = query.where(PageModel.deleted_at.is_(None))
+        if after:
+            query = query.where(tuple_(PageModel.display_order, PageModel.id) > tuple_(*after))
+        
+        query = query.order_by(PageModel.display_order, PageModel.id).limit(limit)
+        result = await self.db.execute(query)
+        
+        return [PageSummary(**row) for row in result.mappings()]
+    
+    async def get_subtree(
+        self, page_id: str, max_depth: Optional[int] = None, include_deleted: bool = False
+    ) -> List[PageTreeNode]:
+        """
+        Get a page and all its nested subpages from one recursive query.
+        
+        Each level appends the page's zero-padded display order and id to
+        its parent's path, so ordering by path yields pre-order with
+        siblings in display order. Deleted pages are pruned together with
+        everything below them unless ``include_deleted`` is set.
+        """
+        columns = (
+            PageModel.id, PageModel.section_id, PageModel.title,
+            PageModel.parent_page_id, PageModel.display_order, PageModel.updated_at,
+        )
+        root = select(
+            *columns,
+            literal_column("0").label("depth"),
+            cast(literal_column("''"), Text).label("path"),
+        ).where(PageModel.id == page_id)
+        if not include_deleted:
+            root = root.where(PageModel.deleted_at.is_(None))
+        subtree = root.cte("subtree", recursive=True)
+        
+        child = aliased(PageModel)
+        step = select(
+            child.id,
+            child.section_id,
+            child.title,
+            child.parent_page_id,
+            child.display_order,
+            child.updated_at,
+            (subtree.c.depth + 1).label("depth"),
+            cast(
+                subtree.c.path
+                + cast(child.display_order + _ORDER_KEY_OFFSET, Text)
+                + child.id
+                + "/",
+                Text,
+            ).label("path"),
+        ).join(subtree, child.parent_page_id == subtree.c.id)
+        if not include_deleted:
+            step = step.where(child.deleted_at.is_(None))
+        if max_depth is not None:
+            step = step.where(subtree.c.depth < max_depth)
+        subtree = subtree.union_all(step)
+        
+        result = await self.db.execute(select(subtree).order_by(subtree.c.path))
+        return [
+            PageTreeNode(
+                id=row.id,
+                section_id=row.section_id,
+                title=row.title,
+                parent_page_id=row.parent_page_id,
+                display_order=row.display_order,
+                updated_at=row.updated_at,
+                depth=row.depth,
+            )
+            for row in result
+        ]
+    
+    async def get_ancestors(self, page_id: str) -> List[PageSummary]:
+        """Get metadata of a page's ancestors, outermost first."""
+        query = (
+            select(*PAGE_SUMMARY_COLUMNS)
+            .join(PagePathModel, PagePathModel.ancestor_id == PageModel.id)
+            .where(PagePathModel.descendant_id == page_id, PagePathModel.depth > 0)
+            .order_by(PagePathModel.depth.desc())
+        )
+        result = await self.db.execute(query)
+        
+        return [PageSummary(**row) for row in result.mappings()]
+    
+    async def get_breadcrumb(self, page_id: str) -> Optional[Breadcrumb]:
+        """
+        Get a live page's notebook, section and ancestor chain.
+        
+        One query: the page's closure rows joined to each ancestor page and
+        to the page's section and notebook, one row per page in the chain.
+        """
+        ancestor = aliased(PageModel)
+        query = (
+            select(
+                NotebookModel.id.label("notebook_id"),
+                NotebookModel.name.label("notebook_name"),
+                NotebookModel.updated_at.label("notebook_updated_at"),
+                SectionModel.id.label("section_id"),
+                SectionModel.name.label("section_name"),
+                SectionModel.updated_at.label("section_updated_at"),
+                ancestor.id,
+                ancestor.title,
+                ancestor.updated_at,
+            )
+            .select_from(PagePathModel)
+            .join(PageModel, PageModel.id == PagePathModel.descendant_id)
+            .join(ancestor, ancestor.id == PagePathModel.ancestor_id)
+            .join(SectionModel, SectionModel.id == PageModel.section_id)
+            .join(NotebookModel, NotebookModel.id == SectionModel.notebook_id)
+            .where(PagePathModel.descendant_id == page_id, PageModel.deleted_at.is_(None))
+            .order_by(PagePathModel.depth.desc())
+        )
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            return None
+        
+        first = rows[0]
+        items = [
+            BreadcrumbItem(
+                first.notebook_id, "notebook", first.notebook_name, first.notebook_updated_at
+            ),
+            BreadcrumbItem(
+                first.section_id, "section", first.section_name, first.section_updated_at
+            ),
+        ]
+        items.extend(BreadcrumbItem(row.id, "page", row.title, row.updated_at) for row in rows)
+        return Breadcrumb(page_id=page_id, items=items)
+    
+    async def move(self, page_id: str, parent_page_id: Optional[str], display_order: int) -> Page:
+        """
+        Re-parent a page together with its subpages.
+        
+        The subtree's own closure rows are kept; only its links to the old
+        ancestors are replaced by links to the new ones, in two set-based
+        statements whatever the subtree size.
+        """
+        query = select(PageModel).options(*SCALARS).where(PageModel.id == page_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
         if not model:
-            raise ValueError(f"Page not found: {page.id}")
+            raise ValueError(f"Page not found: {page_id}")
+        
+        subtree = select(PagePathModel.descendant_id).where(PagePathModel.ancestor_id == page_id)
+        await self.db.execute(
+            delete(PagePathModel)
+            .where(
+                PagePathModel.descendant_id.in_(subtree), PagePathModel.ancestor_id.not_in(subtree)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if parent_page_id:
+            above = aliased(PagePathModel)
+            below = aliased(PagePathModel)
+            await self.db.execute(insert(PagePathModel).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+                .select_from(above)
+                .join(below, true())  # every new ancestor x every subtree page
+                .where(above.descendant_id == parent_page_id, below.ancestor_id == page_id),
+            ))
         
-        model.title = page.title
-        model.content = page.content
-        model.content_plain = page.content_plain
-        model.display_order = page.display_order
+        model.parent_page_id = parent_page_id
+        model.display_order = display_order
         model.updated_at = datetime.utcnow()
         
         await self.db.flush()
@@ -113,9 +402,77 @@ class PageRepository(IPageRepository):
         
         return self._to_domain(model)
     
+    async def update_fields(
+        self,
+        page_id: str,
+        expected_version: Optional[int] = None,
+        *,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        content_plain: Optional[str] = None,
+        display_order: Optional[int] = None
+    ) -> Optional[Page]:
+        """
+        Change some fields of a page in one ``UPDATE ... RETURNING`` statement.
+        
+        The row comes back from the update itself, so callers validate
+        and index it without reading the page before or after.
+        """
+        changes = {
+            name: value
+            for name, value in (
+                ("title", title),
+                ("content", content),
+                ("content_plain", content_plain),
+                ("display_order", display_order),
+            )
+            if value is not None
+        }
+        statement = (
+            update(PageModel)
+            .where(PageModel.id == page_id)
+            .values(**changes, version=PageModel.version + 1, updated_at=datetime.utcnow())
+            .returning(*PAGE_COLUMNS)
+        )
+        if expected_version is not None:
+            statement = statement.where(PageModel.version == expected_version)
+        row = (await self.db.execute(statement)).mappings().one_or_none()
+        
+        return Page(**row) if row else None
+    
+    async def update(self, page: Page, expected_version: int) -> Page:
+        """
+        Update existing page in one conditional statement.
+        
+        ``UPDATE ... WHERE id = ? AND version = ? RETURNING ...``: the row is
+        neither read first nor refreshed after, and a stale
+        ``expected_version`` simply matches nothing.
+        """
+        statement = (
+            update(PageModel)
+            .where(PageModel.id == page.id, PageModel.version == expected_version)
+            .values(
+                title=page.title,
+                content=page.content,
+                content_plain=page.content_plain,
+                display_order=page.display_order,
+                version=page.version,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(*PAGE_COLUMNS)
+        )
+        row = (await self.db.execute(statement)).mappings().one_or_none()
+        
+        if row is None:
+            raise VersionConflictError(
+                f"Version conflict: page {page.id} is not at version {expected_version}"
+            )
+        
+        return Page(**row)
+    
     async def delete(self, page_id: str) -> bool:
         """Soft delete page."""
-        query = select(PageModel).where(PageModel.id == page_id)
+        query = select(PageModel).options(*SCALARS).where(PageModel.id == page_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -129,7 +486,7 @@ class PageRepository(IPageRepository):
     
     async def restore(self, page_id: str) -> bool:
         """Restore soft-deleted page."""
-        query = select(PageModel).where(PageModel.id == page_id)
+        query = select(PageModel).options(*SCALARS).where(PageModel.id == page_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -0,0 +1,615 @@
+"""Full-text search repository implementation."""
+
+import html
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.search_result import SearchHit
+from src.core.interfaces.repositories import ISearchRepository
+from src.infrastructure.data.models.notebook_model import NotebookModel
+from src.infrastructure.data.models.section_model import SectionModel
+from src.infrastructure.data.models.page_model import PageModel
+from src.infrastructure.search.inverted_index import InvertedIndex
+from src.infrastructure.search.tokenizer import iter_token_spans, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Sentinels wrapped around matched terms by snippet(); swapped for <mark>
+# tags only after the surrounding page text has been HTML-escaped.
+_MATCH_START = "\x02"
+_MATCH_END = "\x03"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Title matches outrank body matches (title weight A, content weight B).
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+SNIPPET_TOKENS = 24
+
+# Best FTS5 matches joined to the live-page filters by an unscoped search;
+# terms found on most pages otherwise join and sort every match.
+RANK_WINDOW = 200
+
+# Text search configuration used by the pages_search_vector_update trigger
+POSTGRES_TS_CONFIG = "english"
+POSTGRES_HEADLINE_OPTIONS = (
+    f"StartSel={_MATCH_START}, StopSel={_MATCH_END}, "
+    f"MaxWords={SNIPPET_TOKENS}, MinWords={SNIPPET_TOKENS // 2}, "
+    "MaxFragments=2, FragmentDelimiter=…"
+)
+
+# Same objects as the Alembic initial migration creates
+POSTGRES_SEARCH_DDL = [
+    "CREATE INDEX IF NOT EXISTS idx_pages_search_vector ON pages USING gin (search_vector)",
+]
+POSTGRES_SEARCH_TRIGGER = """
+    CREATE TRIGGER pages_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, content_plain ON pages
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', title, content_plain)
+"""
+
+# pages has a text primary key, so the FTS5 index refers to pages by their
+# implicit rowid, which VACUUM may renumber; rebuild_search_index repairs it
+SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+        title,
+        content_plain,
+        content='pages',
+        content_rowid='rowid',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pages_fts_after_insert AFTER INSERT ON pages BEGIN
+        INSERT INTO pages_fts(rowid, title, content_plain)
+        VALUES (new.rowid, new.title, new.content_plain);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pages_fts_after_delete AFTER DELETE ON pages BEGIN
+        INSERT INTO pages_fts(pages_fts, rowid, title, content_plain)
+        VALUES ('delete', old.rowid, old.title, old.content_plain);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pages_fts_after_update
+    AFTER UPDATE OF title, content_plain ON pages BEGIN
+        INSERT INTO pages_fts(pages_fts, rowid, title, content_plain)
+        VALUES ('delete', old.rowid, old.title, old.content_plain);
+        INSERT INTO pages_fts(rowid, title, content_plain)
+        VALUES (new.rowid, new.title, new.content_plain);
+    END
+    """,
+]
+
+
+def ensure_search_schema(connection: Connection, search_backend: str = "database") -> None:
+    """
+    Create the database search index and its sync triggers if missing.
+
+    On SQLite the index is an external-content FTS5 table over ``pages``
+    keyed by rowid, so page text is stored once and kept in sync by
+    triggers. When the index is created on a database that already has
+    pages it is rebuilt from the table. On PostgreSQL see
+    :func:`ensure_postgres_search_schema`. Other dialects, the in-memory
+    search backend and SQLite builds without FTS5 are left untouched.
+
+    Args:
+        connection: Synchronous connection (use with ``run_sync``).
+        search_backend: Configured ``SEARCH_BACKEND``; only ``database``
+            searches through FTS5 / tsvector.
+    """
+    if search_backend != "database":
+        return
+    if connection.dialect.name == "postgresql":
+        ensure_postgres_search_schema(connection)
+        return
+    if connection.dialect.name != "sqlite":
+        return
+
+    if not fts5_available(connection):
+        logger.warning("SQLite was built without FTS5; search needs SEARCH_BACKEND=memory")
+        return
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pages_fts'")
+    ).first()
+
+    for statement in SQLITE_FTS_DDL:
+        connection.execute(text(statement))
+
+    if not exists:
+        connection.execute(text("INSERT INTO pages_fts(pages_fts) VALUES ('rebuild')"))
+
+
+def ensure_postgres_search_schema(connection: Connection) -> None:
+    """
+    Give ``pages.search_vector`` the type, GIN index and trigger search needs.
+
+    The Alembic initial migration creates all three; a schema made by
+    ``Base.metadata.create_all`` has neither the index nor the trigger, and
+    databases created before the model declared a tsvector type have a
+    text column. Without them searches silently match nothing, so they
+    are created here, and the vectors of existing pages are filled when
+    the trigger is new.
+
+    Args:
+        connection: Synchronous connection (use with ``run_sync``).
+
+    Raises:
+        RuntimeError: If ``pages.search_vector`` does not exist.
+    """
+    column_type = connection.execute(text(
+        "SELECT data_type FROM information_schema.columns WHERE table_schema = current_schema() "
+        "AND table_name = 'pages' AND column_name = 'search_vector'"
+    )).scalar()
+    if column_type is None:
+        raise RuntimeError("pages.search_vector is missing; run the database migrations")
+    if column_type != "tsvector":
+        connection.execute(text(
+            "ALTER TABLE pages ALTER COLUMN search_vector TYPE tsvector USING NULL::tsvector"
+        ))
+
+    for statement in POSTGRES_SEARCH_DDL:
+        connection.execute(text(statement))
+
+    trigger = connection.execute(text(
+        "SELECT 1 FROM pg_trigger "
+        "WHERE tgname = 'pages_search_vector_update' AND tgrelid = 'pages'::regclass"
+    )).first()
+    if trigger is None:
+        connection.execute(text(POSTGRES_SEARCH_TRIGGER))
+        connection.execute(text(
+            "UPDATE pages SET search_vector = to_tsvector("
+            "'pg_catalog.english', coalesce(title, '') || ' ' || coalesce(content_plain, ''))"
+        ))
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """
+    Rebuild the SQLite FTS5 index from the ``pages`` table.
+
+    ``VACUUM`` may renumber the implicit rowids the index refers to pages
+    by, after which matches, ranks and snippets belong to other pages;
+    rebuilding reads every page again. Databases without the index, and
+    other dialects, are left untouched.
+
+    Args:
+        connection: Synchronous connection (use with ``run_sync``).
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pages_fts'")
+    ).first()
+    if exists:
+        connection.execute(text("INSERT INTO pages_fts(pages_fts) VALUES ('rebuild')"))
+
+
+def fts5_available(connection: Connection) -> bool:
+    """Whether the connected SQLite library was compiled with FTS5."""
+    return bool(
+        connection.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar()
+    )
+
+
+def build_match_expression(query_text: str) -> str:
+    """
+    Turn free user input into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted phrase so FTS5 operators and punctuation
+    typed by the user cannot produce syntax errors; the phrases are
+    implicitly AND-ed.
+
+    Args:
+        query_text: Raw search input.
+
+    Returns:
+        MATCH expression, or an empty string if the input has no words.
+    """
+    tokens = _TOKEN_RE.findall(query_text.lower())
+    return " ".join(f'"{token}"' for token in tokens)
+
+
+def render_snippet(raw_snippet: str) -> str:
+    """Escape snippet text for HTML and mark up the matched terms."""
+    escaped = html.escape(raw_snippet or "")
+    return escaped.replace(_MATCH_START, "<mark>").replace(_MATCH_END, "</mark>")
+
+
+def _scope_filters(
+    notebook_id: Optional[str],
+    section_id: Optional[str],
+    params: Dict[str, Any],
+) -> str:
+    """SQL conditions restricting hits to live pages in live sections/notebooks."""
+    clauses = [
+        "p.deleted_at IS NULL",
+        "s.deleted_at IS NULL",
+        "n.deleted_at IS NULL",
+    ]
+    if notebook_id:
+        clauses.append("s.notebook_id = :notebook_id")
+        params["notebook_id"] = notebook_id
+    if section_id:
+        clauses.append("p.section_id = :section_id")
+        params["section_id"] = section_id
+    return " AND ".join(clauses)
+
+
+def _keyset_filter(
+    after: Optional[Tuple[float, str]],
+    params: Dict[str, Any],
+    id_column: str = "page_id",
+) -> str:
+    """SQL condition selecting hits ordered after ``(rank, page_id)``."""
+    if after is None:
+        return "1 = 1"
+    params["after_rank"], params["after_id"] = after
+    return (
+        f"(score < :after_rank OR (score = :after_rank AND {id_column} > :after_id))"
+    )
+
+
+def _to_hit(row) -> SearchHit:
+    return SearchHit(
+        page_id=row.page_id,
+        section_id=row.section_id,
+        notebook_id=row.notebook_id,
+        title=row.title,
+        snippet=render_snippet(row.snippet),
+        rank=row.score,
+    )
+
+
+class SqliteSearchRepository(ISearchRepository):
+    """Full-text page search backed by the SQLite FTS5 ``pages_fts`` index."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 20,
+        notebook_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> List[SearchHit]:
+        """
+        Search pages, ranked by bm25 with highlighted snippets.
+
+        Unscoped searches rank inside FTS5 first and join only a bounded
+        window of the best matches to the live-page filters; when deleted
+        pages crowd the window, or it may end inside a tie, the search is
+        rerun over every match. Scoped searches join the scope filters
+        into the ranked query directly. Only the rows of the requested
+        page are re-matched to build snippets.
+        """
+        match = build_match_expression(query_text)
+        if not match:
+            return []
+
+        if notebook_id or section_id:
+            rows = await self._search(match, limit, notebook_id, section_id, after)
+            return [_to_hit(row) for row in rows]
+
+        window = max(RANK_WINDOW, 2 * limit)
+        rows = await self._search(match, limit, None, None, after, window=window)
+        complete = rows and (
+            rows[0].window_size < window
+            or (len(rows) == limit and rows[-1].score > rows[0].window_floor)
+        )
+        if not complete:
+            rows = await self._search(match, limit, None, None, after)
+        return [_to_hit(row) for row in rows]
+
+    async def _search(
+        self,
+        match: str,
+        limit: int,
+        notebook_id: Optional[str],
+        section_id: Optional[str],
+        after: Optional[Tuple[float, str]],
+        window: Optional[int] = None,
+    ):
+        """
+        Run the ranked query, over every match or over the best ``window``.
+
+        Windowed rows also carry ``window_size`` and ``window_floor``, the
+        number of matches ranked and the lowest score among them.
+        """
+        params: Dict[str, Any] = {
+            "match": match,
+            "match_start": _MATCH_START,
+            "match_end": _MATCH_END,
+            "limit": limit,
+        }
+        scope = _scope_filters(notebook_id, section_id, params)
+        keyset = _keyset_filter(after, params)
+        score = f"-bm25(pages_fts, {TITLE_WEIGHT}, {CONTENT_WEIGHT})"
+
+        if window is None:
+            candidates = ""
+            source = "pages_fts"
+            match_filter = "pages_fts MATCH :match AND "
+            window_columns = ""
+        else:
+            params["window"] = window
+            score_bound = "1 = 1"
+            if after is not None:
+                score_bound = f"{score} <= :after_rank"
+            candidates = f"""
+            candidates AS (
+                SELECT rowid, {score} AS score
+                FROM pages_fts
+                WHERE pages_fts MATCH :match
+                  AND {score_bound}
+                ORDER BY score DESC
+                LIMIT :window
+            ),
+            bounds AS (
+                SELECT count(*) AS window_size, min(score) AS window_floor FROM candidates
+            ),"""
+            source = "candidates"
+            match_filter = ""
+            window_columns = """,
+                   bounds.window_size,
+                   bounds.window_floor"""
+            score = "candidates.score"
+
+        statement = text(
+            f"""
+            WITH {candidates}
+            matches AS (
+                SELECT {source}.rowid AS fts_rowid,
+                       p.id AS page_id,
+                       p.section_id AS section_id,
+                       s.notebook_id AS notebook_id,
+                       p.title AS title,
+                       {score} AS score
+                FROM {source}
+                JOIN pages AS p ON p.rowid = {source}.rowid
+                JOIN sections AS s ON s.id = p.section_id
+                JOIN notebooks AS n ON n.id = s.notebook_id
+                WHERE {match_filter}{scope}
+            ),
+            ranked AS (
+                SELECT * FROM matches
+                WHERE {keyset}
+                ORDER BY score DESC, page_id
+                LIMIT :limit
+            )
+            SELECT ranked.page_id,
+                   ranked.section_id,
+                   ranked.notebook_id,
+                   ranked.title,
+                   ranked.score,
+                   snippet(pages_fts, -1, :match_start, :match_end, '…', {SNIPPET_TOKENS})
+                       AS snippet{window_columns}
+            FROM ranked
+            JOIN pages_fts ON pages_fts.rowid = ranked.fts_rowid{", bounds" if window else ""}
+            WHERE pages_fts MATCH :match
+            ORDER BY ranked.score DESC, ranked.page_id
+            """
+        )
+        return (await self.db.execute(statement, params)).all()
+
+
+class PostgresSearchRepository(ISearchRepository):
+    """
+    Full-text page search backed by PostgreSQL ``pages.search_vector``.
+
+    The column is maintained by the ``pages_search_vector_update`` trigger
+    and indexed by ``idx_pages_search_vector`` (GIN), both created by the
+    migrations or :func:`ensure_search_schema`. Matching, scoping,
+    ranking, keyset pagination and highlighting run in a single statement;
+    ``ts_headline`` is only evaluated for the rows of the requested page.
+    Ids are compared as text in byte order so ties sort the same whether
+    ``pages.id`` is a native UUID (Alembic schema) or a string
+    (``create_all`` schema).
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 20,
+        notebook_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> List[SearchHit]:
+        """Search pages, ranked by ts_rank_cd with ts_headline highlights."""
+        if not _TOKEN_RE.search(query_text):
+            return []
+
+        params: Dict[str, Any] = {
+            "config": POSTGRES_TS_CONFIG,
+            "query_text": query_text,
+            "headline_options": POSTGRES_HEADLINE_OPTIONS,
+            "limit": limit,
+        }
+        scope = _scope_filters(notebook_id, section_id, params)
+        keyset = _keyset_filter(after, params, id_column='page_id COLLATE "C"')
+
+        statement = text(
+            f"""
+            SELECT ranked.page_id,
+                   ranked.section_id,
+                   ranked.notebook_id,
+                   ranked.title,
+                   ranked.score,
+                   ts_headline(CAST(:config AS regconfig), ranked.content_plain,
+                               ranked.query, :headline_options) AS snippet
+            FROM (
+                SELECT * FROM (
+                    SELECT CAST(p.id AS text) AS page_id,
+                           CAST(p.section_id AS text) AS section_id,
+                           CAST(s.notebook_id AS text) AS notebook_id,
+                           p.title,
+                           p.content_plain,
+                           q.query,
+                           CAST(ts_rank_cd(p.search_vector, q.query) AS double precision) AS score
+                    FROM pages AS p
+                    JOIN sections AS s ON s.id = p.section_id
+                    JOIN notebooks AS n ON n.id = s.notebook_id,
+                         websearch_to_tsquery(CAST(:config AS regconfig), :query_text) AS q(query)
+                    WHERE p.search_vector @@ q.query
+                      AND {scope}
+                ) AS matches
+                WHERE {keyset}
+                ORDER BY score DESC, page_id COLLATE "C"
+                LIMIT :limit
+            ) AS ranked
+            ORDER BY ranked.score DESC, ranked.page_id COLLATE "C"
+            """
+        )
+        result = await self.db.execute(statement, params)
+        return [_to_hit(row) for row in result]
+
+
+class InMemorySearchRepository(ISearchRepository):
+    """
+    Full-text page search backed by the in-process :class:`InvertedIndex`.
+
+    Ranking happens entirely in memory. Scoped searches first read the ids
+    of pages in scope (an indexed range scan); the returned page of hits is
+    then read back by primary key for titles and snippets.
+    """
+
+    def __init__(self, db: AsyncSession, index: InvertedIndex):
+        self.db = db
+        self.index = index
+
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 20,
+        notebook_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> List[SearchHit]:
+        """Search pages, ranked by weighted BM25 with highlighted snippets."""
+        allowed = None
+        if notebook_id or section_id:
+            scope = select(PageModel.id).join(SectionModel, SectionModel.id == PageModel.section_id)
+            if notebook_id:
+                scope = scope.where(SectionModel.notebook_id == notebook_id)
+            if section_id:
+                scope = scope.where(PageModel.section_id == section_id)
+            allowed = set((await self.db.execute(scope)).scalars())
+            if not allowed:
+                return []
+
+        terms = set(tokenize(query_text))
+        hits: List[SearchHit] = []
+        # Ranked pages whose section or notebook is deleted are dropped below;
+        # keep ranking past them so they cannot crowd out live hits.
+        while len(hits) < limit:
+            ranked = self.index.search(query_text, limit=limit, allowed=allowed, after=after)
+            if not ranked:
+                break
+            rows = await self._live_rows([page_id for page_id, _ in ranked])
+            for page_id, score in ranked:
+                row = rows.get(page_id)
+                if row is None:
+                    continue
+                first = self.index.content_positions(page_id, sorted(terms))
+                hits.append(SearchHit(
+                    page_id=row.id,
+                    section_id=row.section_id,
+                    notebook_id=row.notebook_id,
+                    title=row.title,
+                    snippet=render_snippet(
+                        build_snippet(row.content_plain, terms, first[0] if first else 0)
+                    ),
+                    rank=score,
+                ))
+            if len(ranked) < limit:
+                break
+            after = (ranked[-1][1], ranked[-1][0])
+        return hits[:limit]
+
+    async def _live_rows(self, page_ids: List[str]) -> Dict[str, Any]:
+        """Read ranked pages that are not deleted themselves or through a parent."""
+        query = (
+            select(
+                PageModel.id,
+                PageModel.section_id,
+                SectionModel.notebook_id,
+                PageModel.title,
+                PageModel.content_plain,
+            )
+            .join(SectionModel, SectionModel.id == PageModel.section_id)
+            .join(NotebookModel, NotebookModel.id == SectionModel.notebook_id)
+            .where(
+                PageModel.id.in_(page_ids),
+                PageModel.deleted_at.is_(None),
+                SectionModel.deleted_at.is_(None),
+                NotebookModel.deleted_at.is_(None),
+            )
+        )
+        return {row.id: row for row in await self.db.execute(query)}
+
+
+def build_snippet(content: str, terms: set, first_position: int) -> str:
+    """
+    Cut a window of tokens around a token position and mark query terms.
+
+    Args:
+        content: Plain-text page content.
+        terms: Lowercase query terms to mark.
+        first_position: Token position to centre the window on.
+
+    Returns:
+        Snippet text with matches wrapped in the match sentinels.
+    """
+    start_token = max(0, first_position - SNIPPET_TOKENS // 4)
+    end_token = start_token + SNIPPET_TOKENS
+
+    pieces = []
+    last_end = None
+    truncated = False
+    for position, (token, start, end) in enumerate(iter_token_spans(content)):
+        if position < start_token:
+            continue
+        if position >= end_token:
+            truncated = True
+            break
+        if last_end is None:
+            pieces.append("…" if start_token else content[:start])
+        else:
+            pieces.append(content[last_end:start])
+        word = content[start:end]
+        pieces.append(f"{_MATCH_START}{word}{_MATCH_END}" if token in terms else word)
+        last_end = end
+
+    if last_end is None:
+        return ""
+    pieces.append("…" if truncated else content[last_end:])
+    return "".join(pieces)
+
+
+def create_search_repository(db: AsyncSession) -> ISearchRepository:
+    """
+    Create the search repository matching the session's database dialect.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        PostgreSQL tsvector repository on PostgreSQL, FTS5 repository otherwise.
+    """
+    if db.bind.dialect.name == "postgresql":
+        return PostgresSearchRepository(db)
+    return SqliteSearchRepository(db)
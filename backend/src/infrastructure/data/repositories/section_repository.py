@@ -1,14 +1,15 @@
 """Section repository implementation."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 
 from src.core.domain.section import Section
 from src.core.interfaces.repositories import ISectionRepository
 from src.infrastructure.data.models.section_model import SectionModel
+from src.infrastructure.data.load_profiles import SCALARS
 
 
 class SectionRepository(ISectionRepository):
@@ -55,20 +56,39 @@ class SectionRepository(ISectionRepository):
     
     async def get_by_id(self, section_id: str) -> Optional[Section]:
         """Get section by ID."""
-        query = select(SectionModel).where(SectionModel.id == section_id)
+        query = select(SectionModel).options(*SCALARS).where(SectionModel.id == section_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
         return self._to_domain(model) if model else None
     
-    async def get_by_notebook_id(self, notebook_id: str, include_deleted: bool = False) -> List[Section]:
-        """Get all sections in a notebook."""
-        query = select(SectionModel).where(SectionModel.notebook_id == notebook_id)
+    async def get_version(self, section_id: str) -> Optional[str]:
+        """Get the section's change token: its ``updated_at``, read without loading the row."""
+        query = select(SectionModel.updated_at).where(SectionModel.id == section_id)
+        updated_at = (await self.db.execute(query)).scalar_one_or_none()
+        
+        return updated_at.isoformat() if updated_at else None
+    
+    async def get_by_notebook_id(
+        self,
+        notebook_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None
+    ) -> List[Section]:
+        """Get sections in a notebook, optionally after a keyset position."""
+        query = (
+            select(SectionModel).options(*SCALARS).where(SectionModel.notebook_id == notebook_id)
+        )
         
         if not include_deleted:
             query = query.where(SectionModel.deleted_at.is_(None))
+        if after:
+            query = query.where(
+                tuple_(SectionModel.display_order, SectionModel.id) > tuple_(*after)
+            )
         
-        query = query.order_by(SectionModel.display_order)
+        query = query.order_by(SectionModel.display_order, SectionModel.id).limit(limit)
         result = await self.db.execute(query)
         models = result.scalars().all()
         
@@ -76,7 +96,7 @@ class SectionRepository(ISectionRepository):
     
     async def update(self, section: Section) -> Section:
         """Update existing section."""
-        query = select(SectionModel).where(SectionModel.id == section.id)
+        query = select(SectionModel).options(*SCALARS).where(SectionModel.id == section.id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -94,7 +114,7 @@ class SectionRepository(ISectionRepository):
     
     async def delete(self, section_id: str) -> bool:
         """Soft delete section."""
-        query = select(SectionModel).where(SectionModel.id == section_id)
+        query = select(SectionModel).options(*SCALARS).where(SectionModel.id == section_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -108,7 +128,7 @@ class SectionRepository(ISectionRepository):
     
     async def restore(self, section_id: str) -> bool:
         """Restore soft-deleted section."""
-        query = select(SectionModel).where(SectionModel.id == section_id)
+        query = select(SectionModel).options(*SCALARS).where(SectionModel.id == section_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -122,7 +142,7 @@ class SectionRepository(ISectionRepository):
     
     async def reorder(self, section_id: str, new_order: int) -> Section:
         """Update section display order."""
-        query = select(SectionModel).where(SectionModel.id == section_id)
+        query = select(SectionModel).options(*SCALARS).where(SectionModel.id == section_id)
         result = await self.db.execute(query)
         model = result.scalar_one_or_none()
         
@@ -0,0 +1,132 @@
+"""Compact integer encodings for search index storage."""
+
+from typing import Collection, Dict, Iterable, List, Tuple
+
+
+def encode_varints(values: Iterable[int]) -> bytes:
+    """
+    Encode non-negative integers as LEB128 varints.
+
+    Args:
+        values: Non-negative integers.
+
+    Returns:
+        Concatenated varint bytes.
+    """
+    out = bytearray()
+    for value in values:
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def decode_varints(data: bytes) -> List[int]:
+    """Decode bytes produced by :func:`encode_varints`."""
+    values = []
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = 0
+            shift = 0
+    return values
+
+
+def encode_deltas(values: Iterable[int]) -> bytes:
+    """Varint-encode an ascending integer sequence as gaps."""
+    previous = 0
+    gaps = []
+    for value in values:
+        gaps.append(value - previous)
+        previous = value
+    return encode_varints(gaps)
+
+
+def decode_deltas(data: bytes) -> List[int]:
+    """Decode bytes produced by :func:`encode_deltas`."""
+    values = []
+    total = 0
+    for gap in decode_varints(data):
+        total += gap
+        values.append(total)
+    return values
+
+
+def encode_offsets(spans: Iterable[Tuple[int, int]]) -> bytes:
+    """
+    Varint-encode ascending ``(start, end)`` spans.
+
+    Each span is stored as the gap from the previous start followed by its
+    length, so most spans take two or three bytes.
+    """
+    previous = 0
+    values = []
+    for start, end in spans:
+        values.append(start - previous)
+        values.append(end - start)
+        previous = start
+    return encode_varints(values)
+
+
+def decode_offsets(data: bytes) -> List[Tuple[int, int]]:
+    """Decode bytes produced by :func:`encode_offsets`."""
+    values = decode_varints(data)
+    spans = []
+    start = 0
+    for i in range(0, len(values) - 1, 2):
+        start += values[i]
+        spans.append((start, start + values[i + 1]))
+    return spans
+
+
+def encode_term_offsets(offsets: Dict[str, List[Tuple[int, int]]]) -> bytes:
+    """
+    Pack the spans of every term of a page into one blob.
+
+    Each term is stored as its UTF-8 length and bytes followed by the
+    length and bytes of its :func:`encode_offsets` spans, so a reader can
+    skip the terms it does not need without decoding them.
+    """
+    out = bytearray()
+    for term, spans in offsets.items():
+        term_bytes = term.encode("utf-8")
+        span_bytes = encode_offsets(spans)
+        out += encode_varints((len(term_bytes),))
+        out += term_bytes
+        out += encode_varints((len(span_bytes),))
+        out += span_bytes
+    return bytes(out)
+
+
+def decode_term_offsets(data: bytes, terms: Collection[str]) -> Dict[str, List[Tuple[int, int]]]:
+    """Decode the spans of ``terms`` from bytes produced by :func:`encode_term_offsets`."""
+    wanted = {term.encode("utf-8"): term for term in terms}
+    found: Dict[str, List[Tuple[int, int]]] = {}
+    position = 0
+    while position < len(data) and len(found) < len(wanted):
+        length, position = _read_varint(data, position)
+        term = wanted.get(data[position:position + length])
+        position += length
+        length, position = _read_varint(data, position)
+        if term is not None:
+            found[term] = decode_offsets(data[position:position + length])
+        position += length
+    return found
+
+
+def _read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
@@ -0,0 +1,225 @@
+"""Process-wide set of in-memory search indexes kept current by the page services."""
+
+import asyncio
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Protocol, Set, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.domain.page import Page
+from src.core.interfaces.search_index import ISearchIndex
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.data.models.notebook_model import NotebookModel
+from src.infrastructure.data.models.page_model import PageModel
+from src.infrastructure.data.models.section_model import SectionModel
+from src.infrastructure.search.inverted_index import InvertedIndex
+from src.infrastructure.search.prefix_index import PrefixIndex
+from src.infrastructure.search.trigram_index import TrigramIndex
+
+# Pages read and indexed per step of a load; small enough that a load
+# running next to live requests only holds the event loop briefly
+LOAD_BATCH_SIZE = 250
+
+
+class PageIndex(Protocol):
+    """Synchronous in-memory index fed with page text."""
+
+    def add(self, page_id: str, title: str, content_plain: str) -> None: ...
+
+    def add_many(self, pages: Iterable[Tuple[str, str, str]]) -> None: ...
+
+    def remove(self, page_id: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class SearchIndexSet(ISearchIndex):
+    """
+    Fan-out of page changes to every registered in-memory index.
+
+    Page writes reach it through :class:`CommittedSearchIndex`, once their
+    session commits; :meth:`load` fills the indexes from the database at
+    startup, while the server may already be taking writes.
+    """
+
+    def __init__(self, indexes: List[PageIndex]):
+        self.indexes = indexes
+        # Pages written since the running load started; None when not loading
+        self._written: Optional[Set[str]] = None
+
+    async def index_page(self, page: Page) -> None:
+        """Add or replace a page in every index."""
+        self.apply(page.id, page)
+
+    async def remove_page(self, page_id: str) -> None:
+        """Remove a page from every index."""
+        self.apply(page_id, None)
+
+    def apply(self, page_id: str, page: Optional[Page]) -> None:
+        """Add or replace ``page``, or remove ``page_id`` when it is None or deleted."""
+        self._mark_written(page_id)
+        if page is None or page.is_deleted():
+            for index in self.indexes:
+                index.remove(page_id)
+        else:
+            for index in self.indexes:
+                index.add(page.id, page.title, page.content_plain)
+
+    async def load(self, session_factory: async_sessionmaker) -> int:
+        """
+        Rebuild every index from the live pages in the database.
+
+        Pages are read in primary-key order, each batch in its own short
+        session so writers are never held up, and added to the indexes in
+        bulk. Pages written while the load runs are already current in the
+        indexes and are skipped. Pages of deleted sections and notebooks
+        are left out, as they are when those are deleted while the server
+        runs.
+
+        Args:
+            session_factory: Factory for the per-batch read sessions.
+
+        Returns:
+            Number of pages indexed.
+        """
+        if not self.indexes:
+            return 0
+
+        for index in self.indexes:
+            index.clear()
+        self._written = set()
+
+        count = 0
+        last_id = ""
+        query = (
+            select(PageModel.id, PageModel.title, PageModel.content_plain)
+            .join(SectionModel, SectionModel.id == PageModel.section_id)
+            .join(NotebookModel, NotebookModel.id == SectionModel.notebook_id)
+            .where(
+                PageModel.deleted_at.is_(None),
+                SectionModel.deleted_at.is_(None),
+                NotebookModel.deleted_at.is_(None),
+            )
+            .order_by(PageModel.id)
+            .limit(LOAD_BATCH_SIZE)
+        )
+        try:
+            while True:
+                async with session_factory() as session:
+                    rows = (await session.execute(query.where(PageModel.id > last_id))).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+                rows = [row for row in rows if row.id not in self._written]
+                for index in self.indexes:
+                    index.add_many(rows)
+                count += len(rows)
+                await asyncio.sleep(0)
+        finally:
+            self._written = None
+        return count
+
+    def _mark_written(self, page_id: str) -> None:
+        if self._written is not None:
+            self._written.add(page_id)
+
+
+class CommittedSearchIndex(ISearchIndex):
+    """
+    Session-bound queue of page changes for a :class:`SearchIndexSet`.
+
+    The in-memory indexes are shared by every request, so changes are only
+    applied once the session commits; a rolled-back write leaves them as
+    they were. Only the last change queued for a page is applied.
+    """
+
+    def __init__(self, index_set: SearchIndexSet, db: AsyncSession):
+        self.index_set = index_set
+        self.db = db
+        self._pending: Dict[str, Optional[Page]] = {}
+        self._listening = False
+
+    async def index_page(self, page: Page) -> None:
+        """Add or replace a page in every index once the session commits."""
+        self._queue(page.id, page)
+
+    async def remove_page(self, page_id: str) -> None:
+        """Remove a page from every index once the session commits."""
+        self._queue(page_id, None)
+
+    def _queue(self, page_id: str, page: Optional[Page]) -> None:
+        self._pending[page_id] = page
+        if not self._listening:
+            # Kept for the session's lifetime: it may commit or roll back more than once
+            self._listening = True
+            event.listen(self.db.sync_session, "after_commit", self._after_commit)
+            event.listen(self.db.sync_session, "after_rollback", self._after_rollback)
+
+    def _after_commit(self, session) -> None:
+        pending, self._pending = self._pending, {}
+        for page_id, page in pending.items():
+            self.index_set.apply(page_id, page)
+
+    def _after_rollback(self, session) -> None:
+        self._pending = {}
+
+
+class CompositeSearchIndex(ISearchIndex):
+    """
+    Chain of search indexes updated in order.
+
+    Request-scoped indexes that write to the database go first, so a failed
+    write leaves the process-wide in-memory indexes untouched.
+    """
+
+    def __init__(self, indexes: List[ISearchIndex]):
+        self.indexes = indexes
+
+    async def index_page(self, page: Page) -> None:
+        """Add or replace a page in every index."""
+        for index in self.indexes:
+            await index.index_page(page)
+
+    async def index_pages(self, pages: List[Page]) -> None:
+        """Add or replace a batch of pages in every index."""
+        for index in self.indexes:
+            await index.index_pages(pages)
+
+    async def remove_page(self, page_id: str) -> None:
+        """Remove a page from every index."""
+        for index in self.indexes:
+            await index.remove_page(page_id)
+
+    async def remove_pages(self, page_ids: List[str]) -> None:
+        """Remove a batch of pages from every index."""
+        for index in self.indexes:
+            await index.remove_pages(page_ids)
+
+
+@lru_cache()
+def get_inverted_index() -> InvertedIndex:
+    """Get the process-wide inverted index."""
+    return InvertedIndex()
+
+
+@lru_cache()
+def get_prefix_index() -> PrefixIndex:
+    """Get the process-wide autocomplete index."""
+    return PrefixIndex()
+
+
+@lru_cache()
+def get_trigram_index() -> TrigramIndex:
+    """Get the process-wide typo-correction index."""
+    return TrigramIndex()
+
+
+@lru_cache()
+def get_search_index_set() -> SearchIndexSet:
+    """Get the in-memory indexes enabled by the current settings."""
+    settings = get_settings()
+    indexes: List[PageIndex] = [get_prefix_index(), get_trigram_index()]
+    if settings.search_backend == "memory":
+        indexes.append(get_inverted_index())
+    return SearchIndexSet(indexes)
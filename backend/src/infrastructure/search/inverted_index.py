@@ -0,0 +1,265 @@
+"""Pure-Python inverted index over page titles and plain-text content."""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.infrastructure.search.encoding import encode_deltas, decode_deltas
+from src.infrastructure.search.tokenizer import tokenize
+
+# Same weighting as the SQL backends: title matches outrank body matches.
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+# Okapi BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+class _PostingList:
+    """Sorted doc ids with parallel term frequencies and varint-encoded positions."""
+
+    __slots__ = ("doc_ids", "frequencies", "positions")
+
+    def __init__(self):
+        self.doc_ids = array("I")
+        self.frequencies = array("I")
+        self.positions: List[bytes] = []
+
+    def add(self, doc_id: int, positions: Sequence[int]) -> None:
+        """Insert a document, keeping doc ids sorted."""
+        index = len(self.doc_ids)
+        if index and self.doc_ids[-1] > doc_id:
+            index = bisect_left(self.doc_ids, doc_id)
+        self.doc_ids.insert(index, doc_id)
+        self.frequencies.insert(index, len(positions))
+        self.positions.insert(index, encode_deltas(positions))
+
+    def remove(self, doc_id: int) -> None:
+        """Remove a document if present."""
+        index = bisect_left(self.doc_ids, doc_id)
+        if index < len(self.doc_ids) and self.doc_ids[index] == doc_id:
+            del self.doc_ids[index]
+            del self.frequencies[index]
+            del self.positions[index]
+
+    def frequency(self, doc_id: int) -> int:
+        """Term frequency in a document (0 if absent)."""
+        index = bisect_left(self.doc_ids, doc_id)
+        if index < len(self.doc_ids) and self.doc_ids[index] == doc_id:
+            return self.frequencies[index]
+        return 0
+
+    def get_positions(self, doc_id: int) -> List[int]:
+        """Token positions of the term in a document (empty if absent)."""
+        index = bisect_left(self.doc_ids, doc_id)
+        if index < len(self.doc_ids) and self.doc_ids[index] == doc_id:
+            return decode_deltas(self.positions[index])
+        return []
+
+
+class _Field:
+    """Postings and length statistics for one indexed field."""
+
+    __slots__ = ("postings", "lengths", "total_length")
+
+    def __init__(self):
+        self.postings: Dict[str, _PostingList] = {}
+        self.lengths = array("I")
+        self.total_length = 0
+
+    def add(self, doc_id: int, tokens: List[str]) -> Tuple[str, ...]:
+        positions: Dict[str, List[int]] = defaultdict(list)
+        for position, token in enumerate(tokens):
+            positions[token].append(position)
+
+        for term, term_positions in positions.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = _PostingList()
+            posting.add(doc_id, term_positions)
+
+        if doc_id == len(self.lengths):
+            self.lengths.append(len(tokens))
+        else:
+            self.lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+
+        return tuple(positions)
+
+    def remove(self, doc_id: int, terms: Tuple[str, ...]) -> None:
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.remove(doc_id)
+            if not posting.doc_ids:
+                del self.postings[term]
+
+        self.total_length -= self.lengths[doc_id]
+        self.lengths[doc_id] = 0
+
+    def matching(self, term: str) -> Set[int]:
+        posting = self.postings.get(term)
+        return set(posting.doc_ids) if posting else set()
+
+    def score(self, terms: Sequence[str], candidates: Set[int], doc_count: int,
+              scores: Dict[int, float], weight: float) -> None:
+        """Add weighted BM25 contributions of ``terms`` for ``candidates`` to ``scores``."""
+        if not doc_count:
+            return
+        average_length = (self.total_length / doc_count) or 1.0
+
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            document_frequency = len(posting.doc_ids)
+            idf = math.log(
+                1.0 + (doc_count - document_frequency + 0.5) / (document_frequency + 0.5)
+            )
+
+            if len(candidates) * 8 < document_frequency:
+                # Few candidates against a long list: probe by binary search
+                matches = ((doc_id, posting.frequency(doc_id)) for doc_id in candidates)
+            else:
+                matches = zip(posting.doc_ids, posting.frequencies)
+
+            for doc_id, frequency in matches:
+                if not frequency or doc_id not in candidates:
+                    continue
+                length_norm = 1.0 - BM25_B + BM25_B * self.lengths[doc_id] / average_length
+                scores[doc_id] += weight * idf * (
+                    frequency * (BM25_K1 + 1.0) / (frequency + BM25_K1 * length_norm)
+                )
+
+
+class InvertedIndex:
+    """
+    In-process inverted index of pages.
+
+    Each page gets a small integer doc id; every term maps to sorted
+    ``array('I')`` doc-id lists with per-document frequencies and
+    delta/varint-encoded token positions. Queries AND their terms (a term
+    may match in title or content), rank with weighted BM25 and return
+    page ids. Pages are added, replaced and removed incrementally; an
+    updated page keeps its doc id.
+
+    The index lives in the process, so each worker holds its own copy.
+    """
+
+    def __init__(self):
+        self._title = _Field()
+        self._content = _Field()
+        self._doc_ids: Dict[str, int] = {}
+        self._page_ids: List[Optional[str]] = []
+        self._doc_terms: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, page_id: str) -> bool:
+        return page_id in self._doc_ids
+
+    def add(self, page_id: str, title: str, content_plain: str) -> None:
+        """Index a page, replacing any previous version of it."""
+        doc_id = self._doc_ids.get(page_id)
+        if doc_id is None:
+            doc_id = len(self._page_ids)
+            self._page_ids.append(page_id)
+            self._doc_ids[page_id] = doc_id
+        else:
+            self._unindex(doc_id)
+
+        self._doc_terms[doc_id] = (
+            self._title.add(doc_id, tokenize(title)),
+            self._content.add(doc_id, tokenize(content_plain)),
+        )
+
+    def add_many(self, pages: Iterable[Tuple[str, str, str]]) -> None:
+        """Index a batch of ``(page_id, title, content_plain)`` pages."""
+        for page_id, title, content_plain in pages:
+            self.add(page_id, title, content_plain)
+
+    def remove(self, page_id: str) -> None:
+        """Drop a page from the index."""
+        doc_id = self._doc_ids.pop(page_id, None)
+        if doc_id is None:
+            return
+        self._unindex(doc_id)
+        self._page_ids[doc_id] = None
+
+    def clear(self) -> None:
+        """Drop every page."""
+        self.__init__()
+
+    def search(
+        self,
+        query_text: str,
+        limit: int = 20,
+        allowed: Optional[Set[str]] = None,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank pages matching every word of the query.
+
+        Args:
+            query_text: Raw search input.
+            limit: Maximum number of hits.
+            allowed: If given, only these page ids may match.
+            after: ``(score, page_id)`` of the last hit already returned.
+
+        Returns:
+            ``(page_id, score)`` pairs, best first, ties broken by page id.
+        """
+        terms = list(dict.fromkeys(tokenize(query_text)))
+        if not terms:
+            return []
+
+        candidates: Optional[Set[int]] = None
+        if allowed is not None:
+            candidates = {self._doc_ids[page_id] for page_id in allowed if page_id in self._doc_ids}
+
+        # Rarest terms first keeps the intersection small
+        for term in sorted(terms, key=self._document_frequency):
+            matching = self._title.matching(term) | self._content.matching(term)
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates:
+                return []
+
+        doc_count = len(self._doc_ids)
+        scores: Dict[int, float] = dict.fromkeys(candidates, 0.0)
+        self._title.score(terms, candidates, doc_count, scores, TITLE_WEIGHT)
+        self._content.score(terms, candidates, doc_count, scores, CONTENT_WEIGHT)
+
+        keys = ((-score, self._page_ids[doc_id]) for doc_id, score in scores.items())
+        if after is not None:
+            boundary = (-after[0], after[1])
+            keys = (key for key in keys if key > boundary)
+
+        return [(page_id, -negative) for negative, page_id in heapq.nsmallest(limit, keys)]
+
+    def content_positions(self, page_id: str, terms: Sequence[str]) -> List[int]:
+        """Sorted token positions of ``terms`` within a page's content."""
+        doc_id = self._doc_ids.get(page_id)
+        if doc_id is None:
+            return []
+        positions: List[int] = []
+        for term in terms:
+            posting = self._content.postings.get(term)
+            if posting is not None:
+                positions.extend(posting.get_positions(doc_id))
+        return sorted(positions)
+
+    def _document_frequency(self, term: str) -> int:
+        title = self._title.postings.get(term)
+        content = self._content.postings.get(term)
+        return (len(title.doc_ids) if title else 0) + (len(content.doc_ids) if content else 0)
+
+    def _unindex(self, doc_id: int) -> None:
+        title_terms, content_terms = self._doc_terms.pop(doc_id)
+        self._title.remove(doc_id, title_terms)
+        self._content.remove(doc_id, content_terms)
@@ -0,0 +1,182 @@
+"""Memory-resident prefix index for search autocomplete."""
+
+import heapq
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from src.core.domain.search_result import Suggestion
+from src.core.interfaces.search_index import ISuggestionIndex
+from src.infrastructure.search.tokenizer import distinct_terms, iter_token_spans, tokenize
+
+# Upper bound on sorted entries inspected per keystroke, keeping one-letter
+# prefixes over a large vocabulary within a few milliseconds.
+MAX_SCAN = 5000
+
+MIN_TERM_LENGTH = 2
+
+# Highest code point, used to build the exclusive end key of a prefix range
+_PREFIX_END = "\U0010ffff"
+
+
+class PrefixIndex(ISuggestionIndex):
+    """
+    Sorted-array prefix index over page titles and content terms.
+
+    Titles are stored once per word start, so ``"no"`` completes both
+    ``"Notes"`` and ``"Meeting notes"``. Terms carry the number of pages
+    that contain them and are suggested most-frequent first. Lookups are
+    two ``bisect`` calls plus a bounded scan; pages are added, renamed and
+    removed incrementally. Bulk loads append unsorted and the arrays are
+    sorted once, before the next lookup or single-page change.
+    """
+
+    def __init__(self):
+        self._title_keys: List[Tuple[str, str]] = []
+        self._titles: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        self._terms: List[str] = []
+        self._term_counts: Counter = Counter()
+        self._doc_terms: Dict[str, FrozenSet[str]] = {}
+        self._unsorted = False
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def add(self, page_id: str, title: str, content_plain: str) -> None:
+        """Index a page's title and terms, replacing any previous version."""
+        self.remove(page_id)
+        self._sort()
+
+        keys, terms = self._entries(page_id, title, content_plain)
+        for key in keys:
+            insort(self._title_keys, (key, page_id))
+        for term in terms:
+            if not self._term_counts[term]:
+                insort(self._terms, term)
+            self._term_counts[term] += 1
+
+    def add_many(self, pages: Iterable[Tuple[str, str, str]]) -> None:
+        """
+        Index a batch of ``(page_id, title, content_plain)`` pages.
+
+        Entries are appended instead of inserted with one ``insort`` per
+        key, which made loading quadratic in the number of keys; the arrays
+        are sorted when next needed.
+        """
+        pages = {page_id: (title, content_plain) for page_id, title, content_plain in pages}
+        for page_id in pages:
+            self.remove(page_id)
+
+        for page_id, (title, content_plain) in pages.items():
+            keys, terms = self._entries(page_id, title, content_plain)
+            self._title_keys.extend((key, page_id) for key in keys)
+            self._terms.extend(term for term in terms if term not in self._term_counts)
+            self._term_counts.update(terms)
+        self._unsorted = True
+
+    def _entries(
+        self, page_id: str, title: str, content_plain: str
+    ) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """Record a page's title keys and vocabulary terms, and return them."""
+        lowered = title.lower()
+        keys = tuple(dict.fromkeys(lowered[start:] for _, start, _ in iter_token_spans(lowered)))
+        self._titles[page_id] = (title, keys)
+
+        terms = frozenset(
+            term for term in distinct_terms(f"{title} {content_plain}")
+            if len(term) >= MIN_TERM_LENGTH and not term.isdigit()
+        )
+        self._doc_terms[page_id] = terms
+        return keys, terms
+
+    def remove(self, page_id: str) -> None:
+        """Forget a page."""
+        entry = self._titles.pop(page_id, None)
+        if entry is None:
+            return
+        self._sort()
+
+        for key in entry[1]:
+            index = bisect_left(self._title_keys, (key, page_id))
+            if index < len(self._title_keys) and self._title_keys[index] == (key, page_id):
+                del self._title_keys[index]
+
+        for term in self._doc_terms.pop(page_id):
+            self._term_counts[term] -= 1
+            if not self._term_counts[term]:
+                del self._term_counts[term]
+                index = bisect_left(self._terms, term)
+                if index < len(self._terms) and self._terms[index] == term:
+                    del self._terms[index]
+
+    def clear(self) -> None:
+        """Drop every page."""
+        self.__init__()
+
+    def _sort(self) -> None:
+        if self._unsorted:
+            self._title_keys.sort()
+            self._terms.sort()
+            self._unsorted = False
+
+    def term_frequency(self, term: str) -> int:
+        """Number of indexed pages containing ``term``."""
+        return self._term_counts.get(term, 0)
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[Suggestion]:
+        """
+        Complete a partial query.
+
+        Args:
+            prefix: What the user has typed so far.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            Matching page titles followed by completions of the last word.
+        """
+        query = " ".join(prefix.lower().split())
+        if not query:
+            return []
+        self._sort()
+
+        titles = self._complete_titles(query, limit)
+        terms = self._complete_terms(query, limit)
+
+        title_share = min(len(titles), max(limit - len(terms), (limit + 1) // 2))
+        return (titles[:title_share] + terms)[:limit]
+
+    def _complete_titles(self, query: str, limit: int) -> List[Suggestion]:
+        start = bisect_left(self._title_keys, (query, ""))
+        end = min(bisect_left(self._title_keys, (query + _PREFIX_END, "")), start + MAX_SCAN)
+
+        seen = set()
+        suggestions = []
+        for _, page_id in self._title_keys[start:end]:
+            if page_id in seen:
+                continue
+            seen.add(page_id)
+            suggestions.append(
+                Suggestion(text=self._titles[page_id][0], kind="title", page_id=page_id)
+            )
+            if len(suggestions) >= limit:
+                break
+        return suggestions
+
+    def _complete_terms(self, query: str, limit: int) -> List[Suggestion]:
+        words = tokenize(query)
+        if not words or not query[-1].isalnum():
+            return []
+        last = words[-1]
+        lead = query[: query.rfind(last)]
+
+        start = bisect_left(self._terms, last)
+        end = min(bisect_left(self._terms, last + _PREFIX_END), start + MAX_SCAN)
+        best = heapq.nsmallest(
+            limit,
+            self._terms[start:end],
+            key=lambda term: (-self._term_counts[term], term),
+        )
+        return [
+            Suggestion(text=f"{lead}{term}", kind="term", count=self._term_counts[term])
+            for term in best
+        ]
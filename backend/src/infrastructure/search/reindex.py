@@ -0,0 +1,248 @@
+"""Batched background rebuild of page search data.
+
+Run from the command line with::
+
+    python -m src.infrastructure.search.reindex --batch-size 200
+
+Add ``--rebuild-fulltext`` after a SQLite ``VACUUM``, which may renumber
+the rowids the FTS5 index refers to pages by.
+
+The command line rewrites what lives in the database (plain text, the
+FTS5 / tsvector index through their triggers, highlight offsets). The
+in-memory indexes of a running server are only refreshed through
+``POST /api/admin/reindex`` or a restart.
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.common.markdown import extract_plain_text
+from src.core.domain.page import Page
+from src.core.domain.reindex_progress import ReindexProgress
+from src.core.interfaces.search_index import ISearchIndex, ISearchReindexer
+from src.infrastructure.data.models.notebook_model import NotebookModel
+from src.infrastructure.data.models.page_model import PageModel
+from src.infrastructure.data.models.section_model import SectionModel
+from src.infrastructure.data.repositories.search_repository import rebuild_search_index
+
+DEFAULT_BATCH_SIZE = 200
+
+
+class PageReindexer(ISearchReindexer):
+    """
+    Rebuilds search data for every page, ``batch_size`` pages at a time.
+
+    Pages are walked in primary-key order and each batch runs in its own
+    short transaction: stale ``content_plain`` values are recomputed with
+    :func:`extract_plain_text` and written back (the FTS5 / tsvector
+    triggers follow), then every page is passed to the search indexes;
+    pages of deleted sections and notebooks are removed from them.
+    The event loop is yielded between batches, so writers only ever wait
+    for one batch and the server keeps serving while a rebuild runs.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        index_factory: Callable[[AsyncSession], ISearchIndex]
+    ):
+        """
+        Initialize the reindexer.
+
+        Args:
+            session_factory: Factory for the per-batch sessions.
+            index_factory: Builds the search indexes bound to a batch session.
+        """
+        self.session_factory = session_factory
+        self.index_factory = index_factory
+        self.progress = ReindexProgress()
+        self._task: Optional[asyncio.Task] = None
+
+    def get_progress(self) -> ReindexProgress:
+        """Get the progress of the current or last reindex."""
+        return self.progress
+
+    async def start(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, rebuild_fulltext: bool = False
+    ) -> ReindexProgress:
+        """
+        Start a reindex in the background unless one is already running.
+
+        Args:
+            batch_size: Number of pages per batch.
+            rebuild_fulltext: First rebuild the SQLite FTS5 index from the
+                pages table, in one transaction.
+        """
+        if not self.progress.is_running():
+            self.progress = ReindexProgress(
+                status="running", batch_size=batch_size, started_at=datetime.utcnow()
+            )
+            self._task = asyncio.create_task(self._run(batch_size, rebuild_fulltext))
+        return self.progress
+
+    async def run(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, rebuild_fulltext: bool = False
+    ) -> ReindexProgress:
+        """Reindex every page and wait for the job to finish."""
+        await self.start(batch_size, rebuild_fulltext)
+        await self._task
+        return self.progress
+
+    async def _run(self, batch_size: int, rebuild_fulltext: bool) -> None:
+        progress = self.progress
+        try:
+            if rebuild_fulltext:
+                async with self.session_factory() as session:
+                    connection = await session.connection()
+                    await connection.run_sync(rebuild_search_index)
+                    await session.commit()
+
+            async with self.session_factory() as session:
+                progress.total = (
+                    await session.execute(select(func.count(PageModel.id)))
+                ).scalar_one()
+
+            last_id = ""
+            while True:
+                async with self.session_factory() as session:
+                    batch = await self._reindex_batch(session, last_id, batch_size)
+                    await session.commit()
+                if not batch:
+                    break
+                last_id = batch[-1].id
+                progress.processed += len(batch)
+                await asyncio.sleep(0)
+
+            progress.status = "completed"
+        except Exception as e:
+            progress.status = "failed"
+            progress.error = str(e)
+        finally:
+            progress.finished_at = datetime.utcnow()
+
+    async def _reindex_batch(
+        self, session: AsyncSession, last_id: str, batch_size: int
+    ) -> List[Page]:
+        result = await session.execute(
+            select(
+                PageModel.id,
+                PageModel.section_id,
+                PageModel.title,
+                PageModel.content,
+                PageModel.content_plain,
+                PageModel.version,
+                PageModel.deleted_at,
+                SectionModel.deleted_at.label("section_deleted_at"),
+                NotebookModel.deleted_at.label("notebook_deleted_at"),
+            )
+            .outerjoin(SectionModel, SectionModel.id == PageModel.section_id)
+            .outerjoin(NotebookModel, NotebookModel.id == SectionModel.notebook_id)
+            .where(PageModel.id > last_id)
+            .order_by(PageModel.id)
+            .limit(batch_size)
+        )
+        rows = result.all()
+        # Pages of deleted sections and notebooks keep their search data in
+        # the database but stay out of the in-memory indexes
+        hidden = {row.id for row in rows if row.section_deleted_at or row.notebook_deleted_at}
+        pages = [
+            Page(
+                id=row.id,
+                section_id=row.section_id,
+                title=row.title,
+                content=row.content,
+                content_plain=row.content_plain,
+                version=row.version,
+                deleted_at=row.deleted_at,
+            )
+            for row in rows
+        ]
+        if not pages:
+            return pages
+
+        stale = {}
+        for page in pages:
+            content_plain = extract_plain_text(page.content or "")
+            if content_plain != page.content_plain:
+                page.content_plain = content_plain
+                stale[page.id] = {
+                    "b_id": page.id,
+                    "b_version": page.version,
+                    "b_content_plain": content_plain,
+                }
+
+        table = PageModel.__table__
+        if stale:
+            # Core executemany; a page saved since it was read keeps the plain
+            # text its save wrote, and updated_at stays since this is not an edit
+            connection = await session.connection()
+            await connection.execute(
+                update(table)
+                .where(table.c.id == bindparam("b_id"), table.c.version == bindparam("b_version"))
+                .values(content_plain=bindparam("b_content_plain"), updated_at=table.c.updated_at),
+                list(stale.values()),
+            )
+
+        # Pages saved or deleted since the batch was read were indexed by that
+        # write; indexing the text read here would put them back out of date
+        current = {
+            row.id: (row.version, row.deleted_at)
+            for row in await session.execute(
+                select(PageModel.id, PageModel.version, PageModel.deleted_at)
+                .where(PageModel.id.in_([page.id for page in pages]))
+            )
+        }
+        unchanged = [
+            page for page in pages if current.get(page.id) == (page.version, page.deleted_at)
+        ]
+        self.progress.updated += sum(1 for page in unchanged if page.id in stale)
+
+        index = self.index_factory(session)
+        for page in unchanged:
+            if page.is_deleted() or page.id in hidden:
+                await index.remove_page(page.id)
+            else:
+                await index.index_page(page)
+        return pages
+
+
+async def _main(batch_size: int, rebuild_fulltext: bool) -> None:
+    from src.infrastructure.config.database import AsyncSessionLocal
+    from src.infrastructure.data.models import (
+        notebook_model,
+        section_model,
+        page_term_offsets_model,
+        page_path_model,
+    )  # noqa: F401
+    from src.infrastructure.data.repositories.highlight_repository import HighlightRepository
+
+    reindexer = PageReindexer(AsyncSessionLocal, HighlightRepository)
+    await reindexer.start(batch_size, rebuild_fulltext)
+    while reindexer.get_progress().is_running():
+        await asyncio.sleep(1)
+        progress = reindexer.get_progress()
+        print(
+            f"{progress.processed}/{progress.total} pages, {progress.updated} updated", flush=True
+        )
+
+    progress = reindexer.get_progress()
+    if progress.status == "failed":
+        raise SystemExit(f"Reindex failed: {progress.error}")
+    print(f"Reindex completed: {progress.processed} pages, {progress.updated} updated")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild page search data in batches.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--rebuild-fulltext",
+        action="store_true",
+        help="rebuild the SQLite FTS5 index first; needed after VACUUM",
+    )
+    args = parser.parse_args()
+    asyncio.run(_main(args.batch_size, args.rebuild_fulltext))
@@ -0,0 +1,142 @@
+"""LRU cache of search result pages, invalidated by a content generation counter."""
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Hashable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.domain.page import Page
+from src.core.domain.search_result import SearchHit
+from src.core.interfaces.repositories import ISearchRepository
+from src.core.interfaces.search_index import ISearchCache, ISearchIndex
+from src.infrastructure.config.settings import get_settings
+
+
+class SearchResultCache:
+    """
+    Bounded LRU map from search parameters to hits.
+
+    Every entry records the content generation it was computed under. A
+    write bumps the generation, which makes all older entries misses
+    without walking the cache; they age out through the LRU bound.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, Tuple[int, List[SearchHit]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bump(self) -> None:
+        """Invalidate every cached entry."""
+        self.generation += 1
+
+    def get(self, key: Hashable) -> Optional[List[SearchHit]]:
+        """Cached hits for ``key`` from the current generation, or ``None``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] != self.generation:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, generation: int, hits: List[SearchHit]) -> None:
+        """
+        Store hits computed under ``generation``.
+
+        Results from a generation that has since been bumped are dropped,
+        so a search racing a write never caches what it read before it.
+        """
+        if generation != self.generation or self.max_entries <= 0:
+            return
+        self._entries[key] = (generation, hits)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class CachedSearchRepository(ISearchRepository):
+    """Search repository decorator answering repeated searches from a :class:`SearchResultCache`."""
+
+    def __init__(self, inner: ISearchRepository, cache: SearchResultCache):
+        self.inner = inner
+        self.cache = cache
+
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 20,
+        notebook_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        after: Optional[Tuple[float, str]] = None
+    ) -> List[SearchHit]:
+        """Search live pages, reusing hits cached for the same parameters."""
+        key = (" ".join(query_text.lower().split()), limit, notebook_id, section_id, after)
+        hits = self.cache.get(key)
+        if hits is not None:
+            return list(hits)
+
+        generation = self.cache.generation
+        hits = await self.inner.search(
+            query_text,
+            limit=limit,
+            notebook_id=notebook_id,
+            section_id=section_id,
+            after=after
+        )
+        self.cache.put(key, generation, list(hits))
+        return hits
+
+
+class SearchCacheInvalidator(ISearchIndex, ISearchCache):
+    """
+    Session-bound hook that bumps the cache generation on page writes.
+
+    The generation is bumped immediately and again after the session
+    commits, so searches that ran between the write and the commit (and
+    so saw the old rows) are not served afterwards.
+    """
+
+    def __init__(self, cache: SearchResultCache, db: Optional[AsyncSession] = None):
+        self.cache = cache
+        self.db = db
+        self._listening = False
+
+    async def index_page(self, page: Page) -> None:
+        """Invalidate cached results after a page is written."""
+        await self.invalidate()
+
+    async def index_pages(self, pages: List[Page]) -> None:
+        """Invalidate cached results once after a batch of pages is written."""
+        await self.invalidate()
+
+    async def remove_page(self, page_id: str) -> None:
+        """Invalidate cached results after a page is removed."""
+        await self.invalidate()
+
+    async def remove_pages(self, page_ids: List[str]) -> None:
+        """Invalidate cached results once after a batch of pages is removed."""
+        await self.invalidate()
+
+    async def invalidate(self) -> None:
+        """Discard every cached result now and once the transaction commits."""
+        self.cache.bump()
+        if self.db is not None and not self._listening:
+            self._listening = True
+            event.listen(self.db.sync_session, "after_commit", self._after_commit, once=True)
+
+    def _after_commit(self, session) -> None:
+        self._listening = False
+        self.cache.bump()
+
+
+@lru_cache()
+def get_search_result_cache() -> SearchResultCache:
+    """Get the process-wide search result cache."""
+    return SearchResultCache(get_settings().search_cache_size)
@@ -0,0 +1,22 @@
+"""Tokenization shared by the in-process search indexes."""
+
+import re
+from typing import Iterator, List, Set, Tuple
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return list(map(str.lower, _TOKEN_RE.findall(text or "")))
+
+
+def distinct_terms(text: str) -> Set[str]:
+    """The distinct lowercase word tokens of a text, deduplicated before lowercasing."""
+    return set(map(str.lower, set(_TOKEN_RE.findall(text or ""))))
+
+
+def iter_token_spans(text: str) -> Iterator[Tuple[str, int, int]]:
+    """Yield ``(token, start, end)`` for each word, token lowercased, offsets into ``text``."""
+    for match in _TOKEN_RE.finditer(text or ""):
+        yield match.group().lower(), match.start(), match.end()
@@ -0,0 +1,167 @@
+"""Character trigram index for typo-tolerant search."""
+
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from src.core.interfaces.search_index import ISpellingIndex
+from src.infrastructure.search.tokenizer import distinct_terms, iter_token_spans
+
+MIN_TERM_LENGTH = 3
+
+# Share of a misspelling's trigrams a candidate must also contain
+MIN_TRIGRAM_OVERLAP = 0.3
+
+# Candidates verified with edit distance per misspelled word
+MAX_CANDIDATES = 50
+
+
+def trigrams(term: str) -> Set[str]:
+    """Padded character trigrams of a term (``"cat"`` -> ``{"$ca", "cat", "at$"}``)."""
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_edits(term: str) -> int:
+    """Edit budget for a word: one typo for short words, two for longer ones."""
+    return 1 if len(term) <= 5 else 2
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance between ``a`` and ``b``, giving up past ``limit``.
+
+    Returns:
+        The distance, or ``limit + 1`` if it exceeds ``limit``.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) > len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            )
+            row_min = min(row_min, current[j])
+        if row_min > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+class TrigramIndex(ISpellingIndex):
+    """
+    Trigram index over the vocabulary of page titles and content.
+
+    Each distinct term is indexed under its character trigrams. A word
+    that is not in the vocabulary is corrected by collecting terms that
+    share enough trigrams with it, then verifying the few best candidates
+    with a bounded edit distance; ties go to the term found on more pages.
+    Lookups touch only the trigram lists of the misspelled word, never
+    every page or every term.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._term_counts: Counter = Counter()
+        self._doc_terms: Dict[str, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._term_counts)
+
+    def add(self, page_id: str, title: str, content_plain: str) -> None:
+        """Index a page's terms, replacing any previous version."""
+        self.remove(page_id)
+        terms = frozenset(
+            term for term in distinct_terms(f"{title} {content_plain}")
+            if len(term) >= MIN_TERM_LENGTH and term.isalpha()
+        )
+        for term in terms:
+            if term not in self._term_counts:
+                for gram in trigrams(term):
+                    self._postings.setdefault(gram, set()).add(term)
+        self._term_counts.update(terms)
+        self._doc_terms[page_id] = terms
+
+    def add_many(self, pages: Iterable[Tuple[str, str, str]]) -> None:
+        """Index a batch of ``(page_id, title, content_plain)`` pages."""
+        for page_id, title, content_plain in pages:
+            self.add(page_id, title, content_plain)
+
+    def remove(self, page_id: str) -> None:
+        """Forget a page."""
+        for term in self._doc_terms.pop(page_id, ()):
+            self._term_counts[term] -= 1
+            if self._term_counts[term]:
+                continue
+            del self._term_counts[term]
+            for gram in trigrams(term):
+                bucket = self._postings.get(gram)
+                if bucket is not None:
+                    bucket.discard(term)
+                    if not bucket:
+                        del self._postings[gram]
+
+    def clear(self) -> None:
+        """Drop every page."""
+        self.__init__()
+
+    def closest_term(self, word: str) -> Optional[str]:
+        """
+        Best vocabulary term within the edit budget of ``word``.
+
+        Returns:
+            The word itself if known, a correction, or ``None``.
+        """
+        if word in self._term_counts:
+            return word
+        if len(word) < MIN_TERM_LENGTH or not word.isalpha():
+            return None
+
+        grams = trigrams(word)
+        overlap: Counter = Counter()
+        for gram in grams:
+            overlap.update(self._postings.get(gram, ()))
+
+        needed = max(1, int(len(grams) * MIN_TRIGRAM_OVERLAP))
+        candidates = [
+            term for term, shared in overlap.most_common(MAX_CANDIDATES) if shared >= needed
+        ]
+
+        limit = max_edits(word)
+        best = None
+        best_key = None
+        for term in candidates:
+            distance = bounded_edit_distance(word, term, limit)
+            if distance > limit:
+                continue
+            key = (distance, -self._term_counts[term], term)
+            if best_key is None or key < best_key:
+                best, best_key = term, key
+        return best
+
+    async def correct(self, query_text: str) -> Optional[str]:
+        """
+        Rewrite a query with misspelled words replaced.
+
+        Returns:
+            The corrected query, or ``None`` if nothing could be corrected.
+        """
+        pieces: List[str] = []
+        cursor = 0
+        changed = False
+        lowered = query_text.lower()
+        for token, start, end in iter_token_spans(lowered):
+            replacement = self.closest_term(token) or token
+            changed = changed or replacement != token
+            pieces.append(lowered[cursor:start])
+            pieces.append(replacement)
+            cursor = end
+        pieces.append(lowered[cursor:])
+        return "".join(pieces) if changed else None
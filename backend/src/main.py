@@ -1,17 +1,23 @@
 """FastAPI application entry point and dependency injection setup."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.infrastructure.config.settings import get_settings
-from src.infrastructure.config.database import init_db
+from src.infrastructure.config.database import init_db, AsyncSessionLocal
+from src.infrastructure.search.index_set import get_search_index_set
+from src.api.dependencies import get_autosave_buffer
 from src.api.middleware.error_handler import error_handler_middleware
+from src.api.middleware.compression import CompressionMiddleware
+from src.api.static_files import PrecompressedStaticFiles, precompress_directory
 
 # Import routers
-from src.api.routes import notebooks, sections, pages, tags, search
+from src.api.routes import notebooks, sections, pages, tags, search, admin
+
+STATIC_DIR = "src/api/static"
 
 
 @asynccontextmanager
@@ -20,9 +26,27 @@ async def lifespan(app: FastAPI):
     # Startup
     settings = get_settings()
     await init_db()
+    index_set = get_search_index_set()
+    index_load = None
+    if settings.search_backend == "memory":
+        # The in-memory indexes answer searches, so they must be complete
+        await index_set.load(AsyncSessionLocal)
+    else:
+        # Only suggestions and typo correction use them; serve while they fill
+        index_load = asyncio.create_task(index_set.load(AsyncSessionLocal))
+    if settings.precompress_static:
+        precompress_directory(STATIC_DIR)
+    autosave_buffer = get_autosave_buffer()
+    if autosave_buffer:
+        # Write autosaves a crashed process left in the journal
+        await autosave_buffer.replay()
+        autosave_buffer.start(settings.autosave_flush_interval_seconds)
     yield
     # Shutdown
-    pass
+    if index_load and not index_load.done():
+        index_load.cancel()
+    if autosave_buffer:
+        await autosave_buffer.stop()
 
 
 # Initialize FastAPI app
@@ -48,15 +72,20 @@ app.add_middleware(
 # Error handling middleware
 app.middleware("http")(error_handler_middleware)
 
+# Compression wraps everything above, so error responses are compressed too
+if settings.response_compression:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_minimum_size)
+
 # Include API routers
 app.include_router(notebooks.router)
 app.include_router(sections.router)
 app.include_router(pages.router)
 app.include_router(tags.router)
 app.include_router(search.router)
+app.include_router(admin.router)
 
 # Mount static files
-app.mount("/static", StaticFiles(directory="src/api/static"), name="static")
+app.mount("/static", PrecompressedStaticFiles(directory=STATIC_DIR), name="static")
 
 # Setup Jinja2 templates
 templates = Jinja2Templates(directory="src/api/templates")
@@ -73,7 +102,10 @@ async def health_check():
 @app.get("/")
 async def root(request: Request):
     """Root endpoint - serves the main UI."""
-    return templates.TemplateResponse("index_tree.html", {"request": request})
+    return templates.TemplateResponse(
+        "index_tree.html",
+        {"request": request, "auto_save_interval_ms": settings.auto_save_interval_ms},
+    )
 
 # Legacy UI endpoint
 @app.get("/legacy")
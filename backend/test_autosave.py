@@ -0,0 +1,244 @@
+"""Tests for incremental page autosaves."""
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.commands.notebook_commands import CreateNotebookCommand
+from src.core.commands.page_commands import (
+    AutosavePageCommand,
+    CreatePageCommand,
+    MovePageCommand,
+    UpdatePageCommand,
+)
+from src.core.commands.section_commands import CreateSectionCommand
+from src.core.common.markdown import extract_plain_text
+from src.core.common.text_patch import TextPatch, apply_patches
+from src.core.queries.queries import GetPageByIdQuery, SearchPagesQuery
+from src.core.services.autosave_page_service import AutosavePageService
+from src.core.services.create_notebook_service import CreateNotebookService
+from src.core.services.create_page_service import CreatePageService
+from src.core.services.create_section_service import CreateSectionService
+from src.core.services.get_pages_service import GetPagesService
+from src.core.services.move_page_service import MovePageService
+from src.core.services.search_pages_service import SearchPagesService
+from src.core.services.update_page_service import UpdatePageService
+from src.infrastructure.data.autosave_buffer import AutosaveBuffer
+from src.infrastructure.data.repositories.highlight_repository import HighlightRepository
+from src.infrastructure.data.repositories.notebook_repository import NotebookRepository
+from src.infrastructure.data.repositories.page_repository import PageRepository
+from src.infrastructure.data.repositories.search_repository import SqliteSearchRepository
+from src.infrastructure.data.repositories.section_repository import SectionRepository
+
+
+async def _create_page(session, content):
+    notebook = await CreateNotebookService(NotebookRepository(session)).execute(
+        CreateNotebookCommand(name="Autosave")
+    )
+    section = await CreateSectionService(SectionRepository(session)).execute(
+        CreateSectionCommand(notebook_id=notebook.data.id, name="Drafts")
+    )
+    page = await CreatePageService(PageRepository(session)).execute(
+        CreatePageCommand(section_id=section.data.id, title="Draft", content=content)
+    )
+    return page.data
+
+
+def test_apply_patches_against_base_offsets():
+    base = "The quick brown fox"
+    patches = [TextPatch(4, 9, "slow"), TextPatch(10, 15, "red"), TextPatch(19, 19, "!")]
+    assert apply_patches(base, patches) == "The slow red fox!"
+    assert apply_patches("a😀b", [TextPatch(1, 2, "é")]) == "aéb"
+    assert apply_patches(base, []) == base
+
+    for bad in ([TextPatch(5, 4)], [TextPatch(0, 20)], [TextPatch(4, 9), TextPatch(8, 10)]):
+        with pytest.raises(ValueError):
+            apply_patches(base, bad)
+
+
+async def test_autosave_applies_patches_and_acks_new_version(db_session):
+    page = await _create_page(db_session, "# Notes\n\nfirst draft")
+    repository = PageRepository(db_session)
+    service = AutosavePageService(repository)
+
+    result = await service.execute(AutosavePageCommand(
+        id=page.id, base_version=page.version, patches=[TextPatch(15, 20, "second")]
+    ))
+    assert result.success, result.message
+    ack = result.data
+    assert ack.id == page.id
+    assert ack.version == page.version + 1
+
+    saved = await repository.get_by_id(page.id)
+    assert saved.content == "# Notes\n\nfirst second"
+    assert saved.content_plain == extract_plain_text(saved.content)
+
+    # Chained autosaves base themselves on the previous ack
+    result = await service.execute(AutosavePageCommand(
+        id=page.id, base_version=ack.version, patches=[TextPatch(9, 15, "")]
+    ))
+    assert result.success, result.message
+    assert (await repository.get_by_id(page.id)).content == "# Notes\n\nsecond"
+
+
+async def test_autosave_rejects_stale_base_and_bad_patches(db_session):
+    page = await _create_page(db_session, "shared text")
+    service = AutosavePageService(PageRepository(db_session))
+    stale = page.version
+    assert (await service.execute(AutosavePageCommand(id=page.id, content="someone else"))).success
+
+    conflict = await service.execute(AutosavePageCommand(
+        id=page.id, base_version=stale, patches=[TextPatch(0, 6, "mine")]
+    ))
+    assert not conflict.success
+    assert conflict.message.startswith("Version conflict")
+
+    current = (await PageRepository(db_session).get_by_id(page.id)).version
+    out_of_range = await service.execute(AutosavePageCommand(
+        id=page.id, base_version=current, patches=[TextPatch(0, 500, "x")]
+    ))
+    assert out_of_range.errors[0].field == "patches"
+    no_base = await service.execute(AutosavePageCommand(id=page.id, patches=[TextPatch(0, 1, "x")]))
+    assert no_base.errors[0].field == "base_version"
+    missing = await service.execute(AutosavePageCommand(id="missing", content="x"))
+    assert "not found" in missing.message
+
+
+async def test_autosave_keeps_search_in_sync(db_session):
+    page = await _create_page(db_session, "alpha beta")
+    search = SearchPagesService(SqliteSearchRepository(db_session))
+
+    await AutosavePageService(PageRepository(db_session)).execute(AutosavePageCommand(
+        id=page.id, base_version=page.version, patches=[TextPatch(0, 5, "gamma")]
+    ))
+
+    assert (await search.execute(SearchPagesQuery(q="alpha"))).data.hits == []
+    assert len((await search.execute(SearchPagesQuery(q="gamma"))).data.hits) == 1
+
+
+async def _buffered_page(db_engine, tmp_path, content):
+    """A committed page and a write-behind buffer journaling to ``tmp_path``."""
+    sessions = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with sessions() as session:
+        page = await _create_page(session, content)
+        await session.commit()
+    buffer = AutosaveBuffer(sessions, HighlightRepository, tmp_path / "autosave.jsonl")
+    return sessions, buffer, page
+
+
+async def _autosave(sessions, buffer, command):
+    """One autosave request: its own session, committed like ``get_db`` does."""
+    async with sessions() as session:
+        result = await AutosavePageService(PageRepository(session), autosave_buffer=buffer).execute(
+            command
+        )
+        await session.commit()
+    assert result.success, result.message
+    return result.data
+
+
+async def _stored(sessions, page_id):
+    async with sessions() as session:
+        return await PageRepository(session).get_by_id(page_id)
+
+
+async def test_write_behind_coalesces_autosaves(db_engine, tmp_path, count_statements):
+    sessions, buffer, page = await _buffered_page(db_engine, tmp_path, "v0")
+
+    version = page.version
+    with count_statements() as statements:
+        for n in range(1, 4):
+            ack = await _autosave(sessions, buffer, AutosavePageCommand(
+                id=page.id, base_version=version, patches=[TextPatch(1, 2, str(n))]
+            ))
+            version = ack.version
+    # Only the first autosave reads the page; none of them writes
+    assert len(statements) == 1, statements
+    assert (await _stored(sessions, page.id)).content == "v0"
+    assert buffer.pending_ids() == [page.id]
+    assert len((tmp_path / "autosave.jsonl").read_bytes().splitlines()) == 3
+
+    assert await buffer.flush() == 1
+    stored = await _stored(sessions, page.id)
+    assert stored.content == "v3"
+    assert stored.content_plain == "v3"
+    assert stored.version == version
+    assert buffer.pending_ids() == []
+    assert not (tmp_path / "autosave.jsonl").exists()
+
+    # The next autosave bases itself on the flushed page
+    await _autosave(
+        sessions, buffer, AutosavePageCommand(id=page.id, base_version=version, content="v4")
+    )
+    await buffer.stop()
+    assert (await _stored(sessions, page.id)).content == "v4"
+
+
+async def test_journal_is_replayed_after_a_crash(db_engine, tmp_path):
+    sessions, buffer, page = await _buffered_page(db_engine, tmp_path, "draft")
+    await _autosave(sessions, buffer, AutosavePageCommand(id=page.id, content="first"))
+    ack = await _autosave(sessions, buffer, AutosavePageCommand(id=page.id, content="second"))
+    with open(tmp_path / "autosave.jsonl", "ab") as journal:
+        journal.write(b'{"id": "torn wri')  # crash in the middle of an append
+
+    restarted = AutosaveBuffer(sessions, HighlightRepository, tmp_path / "autosave.jsonl")
+    assert await restarted.replay() == 1
+    stored = await _stored(sessions, page.id)
+    assert stored.content == "second"
+    assert stored.version == ack.version
+
+    # Replaying an already written journal changes nothing
+    assert (
+        await AutosaveBuffer(sessions, HighlightRepository, tmp_path / "autosave.jsonl").replay()
+        == 0
+    )
+
+
+async def test_reads_and_explicit_saves_flush_pending_autosaves(db_engine, tmp_path):
+    sessions, buffer, page = await _buffered_page(db_engine, tmp_path, "draft")
+
+    await _autosave(sessions, buffer, AutosavePageCommand(id=page.id, content="typed"))
+    async with sessions() as session:
+        read = await GetPagesService(PageRepository(session), buffer).get_by_id(
+            GetPageByIdQuery(id=page.id)
+        )
+    assert read.data.content == "typed"
+    assert buffer.pending_ids() == []
+
+    await _autosave(sessions, buffer, AutosavePageCommand(id=page.id, content="typed more"))
+    async with sessions() as session:
+        result = await UpdatePageService(PageRepository(session), autosave_buffer=buffer).execute(
+            UpdatePageCommand(id=page.id, title="Renamed")
+        )
+        await session.commit()
+    assert result.data.content == "typed more"
+    assert (await _stored(sessions, page.id)).title == "Renamed"
+    assert buffer.pending_ids() == []
+
+    # A flush after a move must not restore the display order the autosave read
+    await _autosave(sessions, buffer, AutosavePageCommand(id=page.id, content="typed again"))
+    async with sessions() as session:
+        await MovePageService(PageRepository(session), buffer).execute(
+            MovePageCommand(id=page.id, display_order=7)
+        )
+        await session.commit()
+    await buffer.flush()
+    stored = await _stored(sessions, page.id)
+    assert (stored.content, stored.display_order) == ("typed again", 7)
+
+
+async def test_flushed_autosaves_change_the_notebook_tree_version(db_engine, tmp_path):
+    sessions, buffer, page = await _buffered_page(db_engine, tmp_path, "draft")
+    await _autosave(sessions, buffer, AutosavePageCommand(id=page.id, content="typed"))
+
+    # A page written after the autosave was accepted, but before the flush
+    async with sessions() as session:
+        await CreatePageService(PageRepository(session)).execute(
+            CreatePageCommand(section_id=page.section_id, title="Later", content="")
+        )
+        notebook_id = (await SectionRepository(session).get_by_id(page.section_id)).notebook_id
+        await session.commit()
+        before = await NotebookRepository(session).get_tree_version(notebook_id)
+
+    await buffer.flush()
+    async with sessions() as session:
+        assert await NotebookRepository(session).get_tree_version(notebook_id) != before
@@ -0,0 +1,133 @@
+"""Tests for bulk page creation."""
+
+from sqlalchemy import func, select
+
+from src.core.commands.notebook_commands import CreateNotebookCommand
+from src.core.commands.page_commands import BulkCreatePagesCommand, BulkPageItem, CreatePageCommand
+from src.core.commands.section_commands import CreateSectionCommand
+from src.core.common.markdown import extract_plain_text
+from src.core.queries.queries import SearchPagesQuery
+from src.core.services.bulk_create_pages_service import BulkCreatePagesService
+from src.core.services.create_notebook_service import CreateNotebookService
+from src.core.services.create_page_service import CreatePageService
+from src.core.services.create_section_service import CreateSectionService
+from src.core.services.search_pages_service import SearchPagesService
+from src.infrastructure.data.models.page_term_offsets_model import PageTermOffsetsModel
+from src.infrastructure.data.repositories.highlight_repository import HighlightRepository
+from src.infrastructure.data.repositories.notebook_repository import NotebookRepository
+from src.infrastructure.data.repositories.page_repository import PageRepository
+from src.infrastructure.data.repositories.search_repository import SqliteSearchRepository
+from src.infrastructure.data.repositories.section_repository import SectionRepository
+from src.infrastructure.search.index_set import CompositeSearchIndex, SearchIndexSet
+from src.infrastructure.search.inverted_index import InvertedIndex
+
+
+async def _create_section(session) -> str:
+    notebook = await CreateNotebookService(NotebookRepository(session)).execute(
+        CreateNotebookCommand(name="Imported")
+    )
+    section = await CreateSectionService(SectionRepository(session)).execute(
+        CreateSectionCommand(notebook_id=notebook.data.id, name="Archive")
+    )
+    return section.data.id
+
+
+def _items(section_id, count, parent_page_id=None):
+    """A top-level chapter and ``count - 1`` pages nested under it, every tenth a level deeper."""
+    items = [
+        BulkPageItem(
+            section_id=section_id,
+            title="Chapter",
+            content="# Chapter",
+            parent_page_id=parent_page_id,
+        )
+    ]
+    for n in range(1, count):
+        parent_index = n - 1 if n % 10 == 0 else 0
+        items.append(BulkPageItem(
+            section_id=section_id, title=f"Note {n}", content=f"**Imported** note number{n}",
+            parent_index=parent_index, display_order=n,
+        ))
+    return items
+
+
+async def test_bulk_create_is_a_fixed_number_of_statements(db_session, count_statements):
+    section_id = await _create_section(db_session)
+    repository = PageRepository(db_session)
+    service = BulkCreatePagesService(repository, HighlightRepository(db_session))
+
+    counts = []
+    for size in (20, 200):
+        with count_statements() as statements:
+            result = await service.execute(BulkCreatePagesCommand(pages=_items(section_id, size)))
+        assert result.success, result.message
+        counts.append(len(statements))
+    # Pages, closure rows, then one offsets upsert
+    assert counts == [3, 3]
+
+    pages = result.data
+    assert [page.title for page in pages[:3]] == ["Chapter", "Note 1", "Note 2"]
+    assert pages[1].content_plain == extract_plain_text(pages[1].content) == "Imported note number1"
+    assert pages[10].parent_page_id == pages[9].id
+    assert all(page.version == 1 and page.created_at for page in pages)
+
+    # Closure rows are those single creates would have written
+    ancestors = await repository.get_ancestors(pages[10].id)
+    assert [ancestor.id for ancestor in ancestors] == [pages[0].id, pages[9].id]
+    subtree = await repository.get_subtree(pages[0].id)
+    assert len(subtree) == 200
+    assert (await repository.get_by_id(pages[10].id)).content == pages[10].content
+
+    offset_rows = (await db_session.execute(
+        select(func.count()).select_from(PageTermOffsetsModel)
+        .where(PageTermOffsetsModel.page_id.in_([page.id for page in pages]))
+    )).scalar_one()
+    assert offset_rows == 200  # one blob per page
+
+
+async def test_bulk_created_pages_are_searchable_and_nest_under_existing_pages(db_session):
+    section_id = await _create_section(db_session)
+    repository = PageRepository(db_session)
+    existing = await CreatePageService(repository).execute(CreatePageCommand(
+        section_id=section_id, title="Existing", content="root"
+    ))
+    inverted = InvertedIndex()
+    index = CompositeSearchIndex([HighlightRepository(db_session), SearchIndexSet([inverted])])
+
+    result = await BulkCreatePagesService(repository, index).execute(
+        BulkCreatePagesCommand(pages=_items(section_id, 5, parent_page_id=existing.data.id))
+    )
+    assert result.success, result.message
+    assert len(inverted) == 5
+    hits = (
+        await SearchPagesService(SqliteSearchRepository(db_session)).execute(
+            SearchPagesQuery(q="number3")
+        )
+    ).data.hits
+    assert [hit.page_id for hit in hits] == [result.data[3].id]
+    ancestors = await repository.get_ancestors(result.data[1].id)
+    assert [ancestor.id for ancestor in ancestors] == [existing.data.id, result.data[0].id]
+
+
+async def test_bulk_create_validates_every_page_before_writing(db_session, count_statements):
+    section_id = await _create_section(db_session)
+    service = BulkCreatePagesService(PageRepository(db_session))
+
+    forward = _items(section_id, 3)
+    forward[1].parent_index = 2
+    blank = _items(section_id, 3)
+    blank[2].title = "  "
+    with count_statements() as statements:
+        assert (await service.execute(BulkCreatePagesCommand(pages=forward))).errors[
+            0
+        ].field == "pages[1].parent_index"
+        assert (await service.execute(BulkCreatePagesCommand(pages=blank))).message == (
+            "Validation failed: page 2: Page title cannot be empty"
+        )
+        assert (await service.execute(BulkCreatePagesCommand(pages=[]))).errors[0].field == "pages"
+    assert statements == []
+
+    missing_parent = await service.execute(
+        BulkCreatePagesCommand(pages=_items(section_id, 2, parent_page_id="missing"))
+    )
+    assert "Parent page not found" in missing_parent.message
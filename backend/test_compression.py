@@ -0,0 +1,114 @@
+"""Tests for response compression and precompressed static files."""
+
+import gzip
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Mount, Route
+
+from src.api.middleware.compression import (
+    CompressionMiddleware,
+    accepted_encodings,
+    choose_encoding,
+)
+from src.api.static_files import PrecompressedStaticFiles, precompress_directory
+
+BIG = {"content": "# Heading\n\nSome markdown text. " * 200}
+
+
+def _app(static_dir=None):
+    async def big(request):
+        return JSONResponse(BIG, headers={"ETag": '"v1"'})
+
+    async def small(request):
+        return JSONResponse({"ok": True})
+
+    async def stream(request):
+        async def chunks():
+            for _ in range(50):
+                yield b"streamed line of text\n" * 20
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async def chunked_small(request):
+        async def chunks():
+            for part in (b'{"ok":', b" true", b"}"):
+                yield part
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    async def binary(request):
+        return PlainTextResponse("x" * 5000, media_type="image/png")
+
+    routes = [Route("/big", big), Route("/small", small), Route("/stream", stream),
+              Route("/chunked-small", chunked_small), Route("/binary", binary)]
+    if static_dir:
+        routes.append(Mount("/static", PrecompressedStaticFiles(directory=static_dir)))
+    app = Starlette(routes=routes)
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+    return app
+
+
+async def _get(app, path, accept_encoding="gzip", **headers):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding, **headers})
+
+
+def test_accept_encoding_negotiation():
+    assert accepted_encodings("gzip;q=0.5, br;q=0, identity") == {"gzip", "identity"}
+    assert choose_encoding("deflate, gzip") == "gzip"
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding("") is None
+
+
+async def test_large_json_is_compressed_and_etag_weakened():
+    response = await _get(_app(), "/big")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < 1000
+    assert response.json() == BIG
+
+    identity = await _get(_app(), "/big", accept_encoding="identity")
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] == '"v1"'
+
+
+async def test_small_and_binary_responses_pass_through():
+    assert "content-encoding" not in (await _get(_app(), "/small")).headers
+    assert "content-encoding" not in (await _get(_app(), "/binary")).headers
+
+    chunked = await _get(_app(), "/chunked-small")
+    assert "content-encoding" not in chunked.headers
+    assert chunked.json() == {"ok": True}
+
+
+async def test_streaming_response_is_compressed_incrementally():
+    response = await _get(_app(), "/stream")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == "streamed line of text\n" * 1000
+
+
+async def test_precompressed_static_variant_is_served(tmp_path):
+    script = tmp_path / "app.js"
+    script.write_text("console.log('hello');\n" * 200)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" + bytes(2000))
+    assert precompress_directory(tmp_path) == 1
+    assert precompress_directory(tmp_path) == 0  # up to date
+
+    app = _app(tmp_path)
+    response = await _get(app, "/static/app.js")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/javascript") or \
+        response.headers["content-type"].startswith("application/javascript")
+    assert int(response.headers["content-length"]) == (tmp_path / "app.js.gz").stat().st_size
+    assert response.text == script.read_text()
+    assert gzip.decompress((tmp_path / "app.js.gz").read_bytes()) == script.read_bytes()
+
+    revalidated = await _get(app, "/static/app.js", **{"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+
+    plain = await _get(app, "/static/app.js", accept_encoding="identity")
+    assert "content-encoding" not in plain.headers
+    assert plain.text == script.read_text()
@@ -0,0 +1,109 @@
+"""Tests for optimistic concurrency and round trips of page writes."""
+
+from src.core.commands.notebook_commands import CreateNotebookCommand
+from src.core.commands.page_commands import (
+    AutosavePageCommand,
+    CreatePageCommand,
+    UpdatePageCommand,
+)
+from src.core.commands.section_commands import CreateSectionCommand
+from src.core.services.autosave_page_service import AutosavePageService
+from src.core.services.create_notebook_service import CreateNotebookService
+from src.core.services.create_page_service import CreatePageService
+from src.core.services.create_section_service import CreateSectionService
+from src.core.services.update_page_service import UpdatePageService
+from src.infrastructure.data.repositories.notebook_repository import NotebookRepository
+from src.infrastructure.data.repositories.page_repository import PageRepository
+from src.infrastructure.data.repositories.section_repository import SectionRepository
+
+
+async def _create_page(session):
+    notebook = await CreateNotebookService(NotebookRepository(session)).execute(
+        CreateNotebookCommand(name="Shared")
+    )
+    section = await CreateSectionService(SectionRepository(session)).execute(
+        CreateSectionCommand(notebook_id=notebook.data.id, name="Drafts")
+    )
+    page = await CreatePageService(PageRepository(session)).execute(
+        CreatePageCommand(section_id=section.data.id, title="Plan", content="v1")
+    )
+    return page.data
+
+
+async def test_updates_apply_only_to_the_version_they_were_based_on(db_session):
+    page = await _create_page(db_session)
+    assert page.version == 1
+    service = UpdatePageService(PageRepository(db_session))
+
+    first = await service.execute(UpdatePageCommand(id=page.id, content="alice", base_version=1))
+    assert first.success, first.message
+    assert first.data.version == 2
+
+    # A second editor still on version 1 is refused instead of overwriting
+    second = await service.execute(UpdatePageCommand(id=page.id, content="bob", base_version=1))
+    assert not second.success
+    assert second.message.startswith("Version conflict")
+    assert (await PageRepository(db_session).get_by_id(page.id)).content == "alice"
+
+    # Without a base version the update applies to the current one
+    forced = await service.execute(UpdatePageCommand(id=page.id, content="bob"))
+    assert forced.data.version == 3
+    assert forced.data.content == "bob"
+
+
+async def test_autosaves_and_updates_share_the_version_sequence(db_session):
+    page = await _create_page(db_session)
+    autosave = AutosavePageService(PageRepository(db_session))
+    update = UpdatePageService(PageRepository(db_session))
+
+    ack = await autosave.execute(
+        AutosavePageCommand(id=page.id, base_version=page.version, content="typed")
+    )
+    assert ack.data.version == 2
+
+    saved = await update.execute(
+        UpdatePageCommand(id=page.id, title="Renamed", base_version=ack.data.version)
+    )
+    assert saved.data.version == 3
+    assert saved.data.content == "typed"
+
+    stale = await autosave.execute(
+        AutosavePageCommand(id=page.id, base_version=ack.data.version, content="late")
+    )
+    assert stale.message.startswith("Version conflict")
+
+
+async def test_updates_and_content_autosaves_are_one_statement(db_session, count_statements):
+    page = await _create_page(db_session)
+    update = UpdatePageService(PageRepository(db_session))
+    autosave = AutosavePageService(PageRepository(db_session))
+
+    with count_statements() as statements:
+        saved = await update.execute(
+            UpdatePageCommand(id=page.id, title=" Renamed ", base_version=1)
+        )
+        ack = await autosave.execute(
+            AutosavePageCommand(id=page.id, base_version=2, content="# typed")
+        )
+    assert len(statements) == 2, statements
+    assert (saved.data.title, saved.data.content) == ("Renamed", "v1")
+    assert ack.data.version == 3
+    stored = await PageRepository(db_session).get_by_id(page.id)
+    assert (stored.content, stored.content_plain) == ("# typed", "typed")
+
+    # Commands are validated before anything is written
+    with count_statements() as statements:
+        invalid = await update.execute(UpdatePageCommand(id=page.id, title="   "))
+    assert invalid.message == "Validation failed: Page title cannot be empty"
+    assert statements == []
+
+    # Failed conditional updates tell missing pages from stale versions
+    assert (
+        "not found"
+        in (
+            await update.execute(UpdatePageCommand(id="missing", title="x", base_version=1))
+        ).message
+    )
+    assert (
+        await autosave.execute(AutosavePageCommand(id=page.id, base_version=2, content="x"))
+    ).message.startswith("Version conflict")
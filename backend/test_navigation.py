@@ -0,0 +1,373 @@
+"""Tests for notebook navigation queries (tree, subtrees, breadcrumbs, paging)."""
+
+import json
+from datetime import datetime
+
+from starlette.requests import Request
+
+from src.api.http_cache import is_not_modified, make_etag, validator_headers
+from src.api.responses import FastJSONResponse
+from src.api.schemas import (
+    NotebookResponse,
+    PageResponse,
+    PageSummaryResponse,
+    SectionResponse,
+    SubtreePageResponse,
+)
+
+from src.infrastructure.data.repositories.notebook_repository import NotebookRepository
+from src.infrastructure.data.repositories.section_repository import SectionRepository
+from src.infrastructure.data.repositories.page_repository import PageRepository
+
+from src.core.services.create_notebook_service import CreateNotebookService
+from src.core.services.create_section_service import CreateSectionService
+from src.core.services.create_page_service import CreatePageService
+from src.core.services.delete_page_service import DeletePageService
+from src.core.services.move_page_service import MovePageService
+from src.core.services.get_notebooks_service import GetNotebooksService
+from src.core.services.update_page_service import UpdatePageService
+from src.core.services.get_sections_service import GetSectionsService
+
+from src.core.commands.notebook_commands import CreateNotebookCommand
+from src.core.commands.section_commands import CreateSectionCommand
+from src.core.commands.page_commands import (
+    CreatePageCommand,
+    DeletePageCommand,
+    MovePageCommand,
+    UpdatePageCommand,
+)
+from src.core.services.get_pages_service import GetPagesService
+from src.core.queries.queries import (
+    GetNotebooksQuery,
+    GetNotebookTreeQuery,
+    GetSectionsQuery,
+    GetPagesQuery,
+    GetPageByIdQuery,
+    GetPageBreadcrumbQuery,
+    GetPageSubtreeQuery,
+)
+
+async def _create_notebook(session, sections=2, pages=3):
+    """Create a notebook with ``sections`` sections of ``pages`` pages each."""
+    notebook = (await CreateNotebookService(NotebookRepository(session)).execute(
+        CreateNotebookCommand(name="Navigation")
+    )).data
+    create_section = CreateSectionService(SectionRepository(session))
+    create_page = CreatePageService(PageRepository(session))
+    section_ids, page_ids = [], []
+    for s in range(sections):
+        section = (await create_section.execute(CreateSectionCommand(
+            notebook_id=notebook.id, name=f"Section {s}", display_order=sections - s
+        ))).data
+        section_ids.append(section.id)
+        for p in range(pages):
+            page = (
+                await create_page.execute(
+                    CreatePageCommand(
+                        section_id=section.id,
+                        title=f"Page {s}.{p}",
+                        content="# Big\n" * 100,
+                        display_order=p,
+                    )
+                )
+            ).data
+            page_ids.append(page.id)
+    return notebook.id, section_ids, page_ids
+
+
+async def test_notebook_tree_returns_structure_without_content(db_session, count_statements):
+    """The tree comes from two queries and lists live sections and pages in order."""
+    notebook_id, section_ids, page_ids = await _create_notebook(db_session)
+    await DeletePageService(PageRepository(db_session)).execute(DeletePageCommand(id=page_ids[0]))
+    service = GetNotebooksService(NotebookRepository(db_session))
+
+    with count_statements() as statements:
+        result = await service.get_tree(GetNotebookTreeQuery(notebook_id=notebook_id))
+    assert result.success, result.message
+    assert len(statements) == 2
+    assert all("content" not in statement for statement in statements)
+
+    tree = result.data
+    assert [section.id for section in tree.sections] == list(reversed(section_ids))
+    assert [page.title for page in tree.pages] == [
+        "Page 1.0",
+        "Page 1.1",
+        "Page 1.2",
+        "Page 0.1",
+        "Page 0.2",
+    ]
+    assert not hasattr(tree.pages[0], "content")
+
+    missing = await service.get_tree(GetNotebookTreeQuery(notebook_id="missing"))
+    assert not missing.success and "not found" in missing.message
+
+
+async def test_notebook_tree_of_empty_notebook(db_session):
+    """A notebook without sections has an empty tree."""
+    notebook_id, _, _ = await _create_notebook(db_session, sections=0)
+    tree = await NotebookRepository(db_session).get_tree(notebook_id)
+    assert tree.sections == [] and tree.pages == []
+
+
+async def test_summary_page_listing_defers_content(db_session, count_statements):
+    """view=summary selects metadata columns only and keeps display order."""
+    _, section_ids, page_ids = await _create_notebook(db_session, sections=1, pages=4)
+    db_session.expunge_all()
+    service = GetPagesService(PageRepository(db_session))
+
+    with count_statements() as statements:
+        result = await service.get_summaries(GetPagesQuery(section_id=section_ids[0]))
+    assert result.success, result.message
+    assert [page.id for page in result.data] == page_ids
+    assert len(statements) == 1 and "content" not in statements[0]
+
+    # Full loads in the same session still see the deferred columns
+    page = (await service.get_by_id(GetPageByIdQuery(id=page_ids[0]))).data
+    assert page.content.startswith("# Big")
+
+
+async def test_page_subtree_is_one_preorder_query(db_session, count_statements):
+    """The whole hierarchy comes back in pre-order with depths from one statement."""
+    _, section_ids, page_ids = await _create_notebook(db_session, sections=1, pages=1)
+    root_id = page_ids[0]
+    create_page = CreatePageService(PageRepository(db_session))
+
+    async def add(title, parent_id, order):
+        return (
+            await create_page.execute(
+                CreatePageCommand(
+                    section_id=section_ids[0],
+                    title=title,
+                    content="",
+                    parent_page_id=parent_id,
+                    display_order=order,
+                )
+            )
+        ).data.id
+
+    b = await add("b", root_id, 2)
+    a = await add("a", root_id, 1)
+    await add("a2", a, 2)
+    a1 = await add("a1", a, 1)
+    await add("a1x", a1, 0)
+    await add("b1", b, 0)
+    gone = await add("gone", root_id, 3)
+    await add("under gone", gone, 0)
+    await PageRepository(db_session).delete(gone)  # the service refuses pages with subpages
+    service = GetPagesService(PageRepository(db_session))
+
+    with count_statements() as statements:
+        result = await service.get_subtree(GetPageSubtreeQuery(page_id=root_id))
+    assert result.success, result.message
+    assert len(statements) == 1
+    assert "content" not in statements[0]
+    assert [(node.title, node.depth) for node in result.data] == [
+        ("Page 0.0", 0), ("a", 1), ("a1", 2), ("a1x", 3), ("a2", 2), ("b", 1), ("b1", 2),
+    ]
+
+    shallow = await service.get_subtree(GetPageSubtreeQuery(page_id=root_id, max_depth=1))
+    assert [node.title for node in shallow.data] == ["Page 0.0", "a", "b"]
+    only_root = await service.get_subtree(GetPageSubtreeQuery(page_id=root_id, max_depth=0))
+    assert [node.title for node in only_root.data] == ["Page 0.0"]
+
+    assert not (await service.get_subtree(GetPageSubtreeQuery(page_id=gone))).success
+    assert not (
+        await service.get_subtree(GetPageSubtreeQuery(page_id=root_id, max_depth=-1))
+    ).success
+
+
+async def test_page_paths_follow_creates_and_moves(db_session, count_statements):
+    """Ancestors come from the closure table, which moves keep in step."""
+    _, section_ids, page_ids = await _create_notebook(db_session, sections=2, pages=2)
+    create_page = CreatePageService(PageRepository(db_session))
+
+    async def add(title, parent_id, section_id=section_ids[0]):
+        return (await create_page.execute(CreatePageCommand(
+            section_id=section_id, title=title, content="", parent_page_id=parent_id
+        ))).data.id
+
+    a, b = page_ids[0], page_ids[1]
+    a1 = await add("a1", a)
+    a1x = await add("a1x", a1)
+    repository = PageRepository(db_session)
+
+    with count_statements() as statements:
+        ancestors = await repository.get_ancestors(a1x)
+    assert len(statements) == 1
+    assert [page.id for page in ancestors] == [a, a1]
+
+    move = MovePageService(repository)
+    result = await move.execute(MovePageCommand(id=a1, parent_page_id=b, display_order=4))
+    assert result.success, result.message
+    assert result.data.parent_page_id == b and result.data.display_order == 4
+    assert [page.id for page in await repository.get_ancestors(a1x)] == [b, a1]
+    subtree = await GetPagesService(repository).get_subtree(GetPageSubtreeQuery(page_id=b))
+    assert [(node.title, node.depth) for node in subtree.data] == [
+        ("Page 0.1", 0),
+        ("a1", 1),
+        ("a1x", 2),
+    ]
+
+    assert (await move.execute(MovePageCommand(id=a1, parent_page_id=None))).success
+    assert [page.id for page in await repository.get_ancestors(a1x)] == [a1]
+
+    assert (
+        "own subpages" in (await move.execute(MovePageCommand(id=a1, parent_page_id=a1x))).message
+    )
+    assert "under itself" in (await move.execute(MovePageCommand(id=a1, parent_page_id=a1))).message
+    assert (
+        "same section"
+        in (await move.execute(MovePageCommand(id=a1, parent_page_id=page_ids[2]))).message
+    )
+    assert "not found" in (await move.execute(MovePageCommand(id="missing"))).message
+
+
+async def test_breadcrumb_is_one_joined_query(db_session, count_statements):
+    """Notebook, section and every parent page come back from one statement."""
+    notebook_id, section_ids, page_ids = await _create_notebook(db_session, sections=1, pages=1)
+    child = (await CreatePageService(PageRepository(db_session)).execute(CreatePageCommand(
+        section_id=section_ids[0], title="Child", content="", parent_page_id=page_ids[0]
+    ))).data
+    service = GetPagesService(PageRepository(db_session))
+
+    with count_statements() as statements:
+        result = await service.get_breadcrumb(GetPageBreadcrumbQuery(page_id=child.id))
+    assert result.success, result.message
+    assert len(statements) == 1
+    assert [(item.kind, item.name) for item in result.data.items] == [
+        ("notebook", "Navigation"),
+        ("section", "Section 0"),
+        ("page", "Page 0.0"),
+        ("page", "Child"),
+    ]
+    assert result.data.last_modified() == max(item.updated_at for item in result.data.items)
+
+    assert not (await service.get_breadcrumb(GetPageBreadcrumbQuery(page_id="missing"))).success
+
+
+def test_if_none_match_uses_weak_comparison():
+    etag = make_etag("page", datetime(2025, 1, 1))
+    assert etag.startswith('"') and etag != make_etag("page", datetime(2025, 1, 2))
+
+    def request(if_none_match=None):
+        headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+        return Request({"type": "http", "headers": headers})
+
+    assert is_not_modified(request(etag), etag)
+    assert is_not_modified(request(f'"other", W/{etag}'), etag)
+    assert is_not_modified(request("*"), etag)
+    assert not is_not_modified(request('"other"'), etag)
+    assert not is_not_modified(request(), etag)
+    assert (
+        validator_headers(etag, datetime(2025, 1, 1))["Last-Modified"]
+        == "Wed, 01 Jan 2025 00:00:00 GMT"
+    )
+
+
+async def test_keyset_pagination_walks_lists_in_order(db_session, count_statements):
+    """Pages of ``limit`` items chain through cursors and match the unpaginated order."""
+    notebook_id, section_ids, _ = await _create_notebook(db_session, sections=5, pages=5)
+    await _create_notebook(db_session, sections=0)
+
+    async def walk(list_paginated, make_query):
+        items, cursor = [], None
+        while True:
+            with count_statements() as statements:
+                result = await list_paginated(make_query(cursor))
+            assert result.success, result.message
+            assert len(statements) == 1
+            assert len(result.data.items) <= 2
+            items.extend(item.id for item in result.data.items)
+            cursor = result.data.next_cursor
+            if not cursor:
+                return items
+
+    pages = GetPagesService(PageRepository(db_session))
+    full = await pages.execute(GetPagesQuery(section_id=section_ids[0]))
+    assert await walk(pages.list_paginated, lambda cursor: GetPagesQuery(
+        section_id=section_ids[0], limit=2, cursor=cursor
+    )) == [page.id for page in full.data]
+
+    sections = GetSectionsService(SectionRepository(db_session))
+    full = await sections.execute(GetSectionsQuery(notebook_id=notebook_id))
+    assert await walk(sections.list_paginated, lambda cursor: GetSectionsQuery(
+        notebook_id=notebook_id, limit=2, cursor=cursor
+    )) == [section.id for section in full.data] == list(reversed(section_ids))
+
+    notebooks = GetNotebooksService(NotebookRepository(db_session))
+    full = await notebooks.execute(GetNotebooksQuery())
+    assert len(full.data) == 2
+    assert await walk(notebooks.list_paginated, lambda cursor: GetNotebooksQuery(
+        limit=1, cursor=cursor
+    )) == [notebook.id for notebook in full.data]
+
+    assert not (
+        await pages.list_paginated(GetPagesQuery(section_id=section_ids[0], cursor="bad"))
+    ).success
+    assert not (
+        await pages.list_paginated(GetPagesQuery(section_id=section_ids[0], limit=0))
+    ).success
+
+
+async def test_version_probes_track_changes(db_session, count_statements):
+    """Version tokens come from one column-only query and change with every edit."""
+    notebook_id, section_ids, page_ids = await _create_notebook(db_session, sections=2, pages=2)
+    notebooks = GetNotebooksService(NotebookRepository(db_session))
+    pages = GetPagesService(PageRepository(db_session))
+    tree_query = GetNotebookTreeQuery(notebook_id=notebook_id)
+
+    with count_statements() as statements:
+        tree_version = (await notebooks.get_tree_version(tree_query)).data
+        page_version = (await pages.get_version(GetPageByIdQuery(id=page_ids[0]))).data
+    assert len(statements) == 2
+    assert all("content" not in statement for statement in statements)
+    assert tree_version and page_version
+
+    await UpdatePageService(PageRepository(db_session)).execute(
+        UpdatePageCommand(id=page_ids[0], content="edited")
+    )
+    assert (await pages.get_version(GetPageByIdQuery(id=page_ids[0]))).data != page_version
+    edited_version = (await notebooks.get_tree_version(tree_query)).data
+    assert edited_version != tree_version
+
+    await DeletePageService(PageRepository(db_session)).execute(DeletePageCommand(id=page_ids[3]))
+    assert (await notebooks.get_tree_version(tree_query)).data != edited_version
+
+    assert not (await pages.get_version(GetPageByIdQuery(id="missing"))).success
+    assert not (
+        await notebooks.get_tree_version(GetNotebookTreeQuery(notebook_id="missing"))
+    ).success
+
+
+async def test_fast_json_matches_response_models(db_session):
+    """Domain objects encoded by orjson match what the response models would produce."""
+    notebook_id, section_ids, page_ids = await _create_notebook(db_session, sections=1, pages=2)
+    pages_service = GetPagesService(PageRepository(db_session))
+    await CreatePageService(PageRepository(db_session)).execute(CreatePageCommand(
+        section_id=section_ids[0], title="Child", content="text", parent_page_id=page_ids[0]
+    ))
+
+    def assert_matches(items, model):
+        encoded = json.loads(FastJSONResponse(items).body)
+        assert encoded == [
+            model.model_validate(item, from_attributes=True).model_dump(mode="json")
+            for item in items
+        ]
+
+    query = GetPagesQuery(section_id=section_ids[0])
+    assert_matches((await pages_service.list_paginated(query)).data.items, PageResponse)
+    assert_matches(
+        (await pages_service.list_paginated(query, summaries=True)).data.items, PageSummaryResponse
+    )
+    assert_matches(
+        (await pages_service.get_subtree(GetPageSubtreeQuery(page_id=page_ids[0]))).data,
+        SubtreePageResponse,
+    )
+    sections = await GetSectionsService(SectionRepository(db_session)).list_paginated(
+        GetSectionsQuery(notebook_id=notebook_id)
+    )
+    assert_matches(sections.data.items, SectionResponse)
+    notebooks = await GetNotebooksService(NotebookRepository(db_session)).list_paginated(
+        GetNotebooksQuery()
+    )
+    assert_matches(notebooks.data.items, NotebookResponse)
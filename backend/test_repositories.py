@@ -0,0 +1,145 @@
+"""Statement-count tests for the notebook, section and page repositories.
+
+Relationships never load implicitly, so every repository method issues a
+fixed number of statements regardless of how much data hangs off a row.
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from src.core.common.errors import VersionConflictError
+from src.core.domain.notebook import Notebook
+from src.core.domain.section import Section
+from src.core.domain.page import Page
+from src.infrastructure.data.load_profiles import SCALARS
+from src.infrastructure.data.models.notebook_model import NotebookModel
+from src.infrastructure.data.repositories.notebook_repository import NotebookRepository
+from src.infrastructure.data.repositories.section_repository import SectionRepository
+from src.infrastructure.data.repositories.page_repository import PageRepository
+
+
+async def _seed(session, sections=3, pages=4):
+    """A notebook whose sections each hold ``pages`` pages, the first being a parent."""
+    notebook = await NotebookRepository(session).create(Notebook(id="", name="Counted"))
+    section_ids, page_ids = [], []
+    for s in range(sections):
+        section = await SectionRepository(session).create(
+            Section(id="", notebook_id=notebook.id, name=f"Section {s}", display_order=s)
+        )
+        section_ids.append(section.id)
+        parent = None
+        for p in range(pages):
+            page = await PageRepository(session).create(Page(
+                id="", section_id=section.id, title=f"Page {s}.{p}", content="text",
+                parent_page_id=parent, display_order=p,
+            ))
+            parent = parent or page.id
+            page_ids.append(page.id)
+    session.expunge_all()
+    return notebook.id, section_ids, page_ids
+
+
+async def _assert_statements(count_statements, expected, call):
+    with count_statements() as statements:
+        result = await call()
+    assert len(statements) == expected, statements
+    return result
+
+
+async def test_notebook_repository_statement_counts(db_session, count_statements):
+    notebook_id, _, _ = await _seed(db_session)
+    repository = NotebookRepository(db_session)
+
+    await _assert_statements(
+        count_statements, 2, lambda: repository.create(Notebook(id="", name="New"))
+    )
+    notebook = await _assert_statements(
+        count_statements, 1, lambda: repository.get_by_id(notebook_id)
+    )
+    assert notebook.name == "Counted"
+    notebooks = await _assert_statements(count_statements, 1, lambda: repository.get_all())
+    assert len(notebooks) == 2
+
+    db_session.expunge_all()
+    notebook.name = "Renamed"
+    await _assert_statements(count_statements, 3, lambda: repository.update(notebook))
+    db_session.expunge_all()
+    assert await _assert_statements(count_statements, 2, lambda: repository.delete(notebook_id))
+    db_session.expunge_all()
+    assert await _assert_statements(count_statements, 2, lambda: repository.restore(notebook_id))
+    db_session.expunge_all()
+    await _assert_statements(count_statements, 2, lambda: repository.get_tree(notebook_id))
+
+
+async def test_section_repository_statement_counts(db_session, count_statements):
+    notebook_id, section_ids, _ = await _seed(db_session)
+    repository = SectionRepository(db_session)
+
+    section = await _assert_statements(
+        count_statements, 1, lambda: repository.get_by_id(section_ids[0])
+    )
+    sections = await _assert_statements(
+        count_statements, 1, lambda: repository.get_by_notebook_id(notebook_id)
+    )
+    assert len(sections) == 3
+
+    db_session.expunge_all()
+    section.name = "Renamed"
+    await _assert_statements(count_statements, 3, lambda: repository.update(section))
+    db_session.expunge_all()
+    await _assert_statements(count_statements, 3, lambda: repository.reorder(section_ids[0], 5))
+    db_session.expunge_all()
+    assert await _assert_statements(count_statements, 2, lambda: repository.delete(section_ids[1]))
+    db_session.expunge_all()
+    assert await _assert_statements(count_statements, 2, lambda: repository.restore(section_ids[1]))
+
+
+async def test_page_repository_statement_counts(db_session, count_statements):
+    _, section_ids, page_ids = await _seed(db_session)
+    repository = PageRepository(db_session)
+
+    page = await _assert_statements(count_statements, 1, lambda: repository.get_by_id(page_ids[0]))
+    pages = await _assert_statements(
+        count_statements, 1, lambda: repository.get_by_section_id(section_ids[0])
+    )
+    assert len(pages) == 4
+    children = await _assert_statements(
+        count_statements, 1, lambda: repository.get_by_parent_id(page_ids[0])
+    )
+    assert len(children) == 3
+    await _assert_statements(
+        count_statements, 1, lambda: repository.get_summaries_by_section_id(section_ids[0])
+    )
+    await _assert_statements(
+        count_statements, 1, lambda: repository.get_summaries_by_parent_id(page_ids[0])
+    )
+
+    db_session.expunge_all()
+    page.content = "changed"
+    page.version += 1
+    saved = await _assert_statements(count_statements, 1, lambda: repository.update(page, 1))
+    assert (saved.content, saved.version) == ("changed", 2)
+    with pytest.raises(VersionConflictError):
+        await _assert_statements(count_statements, 1, lambda: repository.update(page, 1))
+    changed = await _assert_statements(
+        count_statements, 1, lambda: repository.update_fields(page.id, 2, title="Renamed")
+    )
+    assert (changed.title, changed.content, changed.version) == ("Renamed", "changed", 3)
+    assert await _assert_statements(
+        count_statements, 1, lambda: repository.update_fields(page.id, 2, title="Stale")
+    ) is None
+    db_session.expunge_all()
+    assert await _assert_statements(count_statements, 2, lambda: repository.delete(page_ids[1]))
+    db_session.expunge_all()
+    assert await _assert_statements(count_statements, 2, lambda: repository.restore(page_ids[1]))
+
+
+async def test_relationships_are_never_loaded_implicitly(db_session):
+    notebook_id, _, _ = await _seed(db_session)
+    model = (await db_session.execute(
+        select(NotebookModel).options(*SCALARS).where(NotebookModel.id == notebook_id)
+    )).scalar_one()
+
+    with pytest.raises(InvalidRequestError):
+        model.sections
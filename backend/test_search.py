@@ -0,0 +1,786 @@
+"""Tests for full-text page search."""
+
+import asyncio
+import sqlite3
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
+
+from src.infrastructure.data.repositories.notebook_repository import NotebookRepository
+from src.infrastructure.data.repositories.section_repository import SectionRepository
+from src.infrastructure.data.repositories.page_repository import PageRepository
+from src.infrastructure.data.repositories import search_repository
+from src.infrastructure.data.repositories.search_repository import (
+    SqliteSearchRepository,
+    build_match_expression,
+    create_search_repository,
+    ensure_search_schema,
+    InMemorySearchRepository,
+)
+from src.infrastructure.config.database import Base
+from src.infrastructure.search.encoding import (
+    encode_varints,
+    encode_deltas,
+    decode_deltas,
+    encode_offsets,
+    decode_offsets,
+    encode_term_offsets,
+    decode_term_offsets,
+)
+from src.infrastructure.data.repositories.highlight_repository import HighlightRepository
+from src.infrastructure.search import index_set as index_set_module
+from src.infrastructure.search.index_set import (
+    CommittedSearchIndex,
+    CompositeSearchIndex,
+    SearchIndexSet,
+)
+from src.infrastructure.search import reindex
+from src.infrastructure.search.reindex import PageReindexer
+from src.infrastructure.search.inverted_index import InvertedIndex
+from src.infrastructure.search.prefix_index import PrefixIndex
+from src.infrastructure.search.result_cache import (
+    CachedSearchRepository,
+    SearchCacheInvalidator,
+    SearchResultCache,
+)
+from src.infrastructure.search.trigram_index import TrigramIndex, bounded_edit_distance
+
+from src.core.services.create_notebook_service import CreateNotebookService
+from src.core.services.create_section_service import CreateSectionService
+from src.core.services.create_page_service import CreatePageService
+from src.core.services.update_page_service import UpdatePageService
+from src.core.services.delete_page_service import DeletePageService
+from src.core.services.search_pages_service import SearchPagesService
+from src.core.services.delete_notebook_service import DeleteNotebookService
+
+from src.core.commands.notebook_commands import CreateNotebookCommand, DeleteNotebookCommand
+from src.core.commands.section_commands import CreateSectionCommand
+from src.core.commands.page_commands import CreatePageCommand, UpdatePageCommand, DeletePageCommand
+from src.core.common.markdown import extract_plain_text
+from src.core.queries.queries import SearchPagesQuery
+from src.api.dependencies import get_search_index
+
+
+async def _create_section(session) -> str:
+    notebook = await CreateNotebookService(NotebookRepository(session)).execute(
+        CreateNotebookCommand(name="Search Notebook")
+    )
+    section = await CreateSectionService(SectionRepository(session)).execute(
+        CreateSectionCommand(notebook_id=notebook.data.id, name="Search Section")
+    )
+    return section.data.id
+
+
+async def test_search_ranks_and_highlights(db_session):
+    """Pages are found through FTS5, ranked by bm25, with escaped snippets."""
+    section_id = await _create_section(db_session)
+    create_page = CreatePageService(PageRepository(db_session))
+    search = SearchPagesService(SqliteSearchRepository(db_session))
+
+    title_hit = await create_page.execute(CreatePageCommand(
+        section_id=section_id, title="Kubernetes cheatsheet", content="Pods and <b>services</b>."
+    ))
+    body_hit = await create_page.execute(CreatePageCommand(
+        section_id=section_id, title="Misc", content="We once deployed kubernetes on a laptop."
+    ))
+    await create_page.execute(CreatePageCommand(
+        section_id=section_id, title="Groceries", content="Milk, eggs."
+    ))
+
+    result = await search.execute(SearchPagesQuery(q="kubernetes"))
+    assert result.success, result.message
+    assert [hit.page_id for hit in result.data.hits] == [title_hit.data.id, body_hit.data.id]
+    assert "<mark>kubernetes</mark>" in result.data.hits[1].snippet
+
+    result = await search.execute(SearchPagesQuery(q="services"))
+    assert "&lt;b&gt;<mark>services</mark>&lt;/b&gt;" in result.data.hits[0].snippet
+
+
+async def test_search_index_follows_updates_and_deletes(db_session):
+    """Triggers keep the index in sync; soft-deleted pages are excluded."""
+    section_id = await _create_section(db_session)
+    page_repo = PageRepository(db_session)
+    search = SearchPagesService(SqliteSearchRepository(db_session))
+
+    page = await CreatePageService(page_repo).execute(CreatePageCommand(
+        section_id=section_id, title="Draft", content="alpha"
+    ))
+    await UpdatePageService(page_repo).execute(UpdatePageCommand(id=page.data.id, content="omega"))
+
+    assert (await search.execute(SearchPagesQuery(q="alpha"))).data.hits == []
+    assert len((await search.execute(SearchPagesQuery(q="omega"))).data.hits) == 1
+
+    await DeletePageService(page_repo).execute(DeletePageCommand(id=page.data.id))
+    assert (await search.execute(SearchPagesQuery(q="omega"))).data.hits == []
+
+
+async def test_search_query_validation(db_session):
+    """Operators in user input are neutralised and bad paging is rejected."""
+    search = SearchPagesService(SqliteSearchRepository(db_session))
+
+    assert build_match_expression('foo AND "bar" NEAR(') == '"foo" "and" "bar" "near"'
+    assert (await search.execute(SearchPagesQuery(q='"unbalanced'))).success
+    assert (await search.execute(SearchPagesQuery(q="   "))).data.hits == []
+    assert not (await search.execute(SearchPagesQuery(q="x", limit=0))).success
+    assert not (await search.execute(SearchPagesQuery(q="x", cursor="not-a-cursor"))).success
+
+
+async def test_search_repository_follows_dialect(db_session):
+    """The FTS5 repository is selected on SQLite sessions."""
+    assert isinstance(create_search_repository(db_session), SqliteSearchRepository)
+
+
+async def test_in_memory_backend_tracks_page_services(db_session):
+    """The inverted index is updated incrementally by create/update/delete."""
+    section_id = await _create_section(db_session)
+    page_repo = PageRepository(db_session)
+    index = InvertedIndex()
+    index_set = SearchIndexSet([index])
+    search = SearchPagesService(InMemorySearchRepository(db_session, index))
+
+    first = await CreatePageService(page_repo, index_set).execute(CreatePageCommand(
+        section_id=section_id, title="Rust notes", content="Ownership and borrowing in rust."
+    ))
+    second = await CreatePageService(page_repo, index_set).execute(CreatePageCommand(
+        section_id=section_id, title="Misc", content="Learning rust slowly."
+    ))
+
+    hits = (await search.execute(SearchPagesQuery(q="rust"))).data.hits
+    assert [hit.page_id for hit in hits] == [first.data.id, second.data.id]
+    assert "<mark>rust</mark>" in hits[1].snippet
+    first_page = (await search.execute(SearchPagesQuery(q="rust", limit=1))).data
+    next_page = (
+        await search.execute(SearchPagesQuery(q="rust", limit=1, cursor=first_page.next_cursor))
+    ).data
+    assert [hit.page_id for hit in next_page.hits] == [second.data.id]
+    assert next_page.next_cursor is None
+
+    await UpdatePageService(page_repo, index_set).execute(
+        UpdatePageCommand(id=second.data.id, content="Learning go.")
+    )
+    assert [h.page_id for h in (await search.execute(SearchPagesQuery(q="rust"))).data.hits] == [
+        first.data.id
+    ]
+    assert len((await search.execute(SearchPagesQuery(q="learning go"))).data.hits) == 1
+
+    await DeletePageService(page_repo, index_set).execute(DeletePageCommand(id=first.data.id))
+    assert (await search.execute(SearchPagesQuery(q="rust"))).data.hits == []
+    assert len(index) == 1
+
+
+async def test_in_memory_index_loads_from_database(db_engine, db_session):
+    """Startup loading indexes every live page."""
+    section_id = await _create_section(db_session)
+    await CreatePageService(PageRepository(db_session)).execute(CreatePageCommand(
+        section_id=section_id, title="Persisted", content="durable words"
+    ))
+    await db_session.commit()
+
+    index = InvertedIndex()
+    loaded = await SearchIndexSet([index]).load(
+        async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    )
+    assert loaded == 1
+    assert index.search("durable")[0][1] > 0
+
+
+def test_varint_encoding_round_trips():
+    """Position lists survive delta/varint encoding."""
+    positions = [0, 1, 127, 128, 16384, 2 ** 31]
+    assert decode_deltas(encode_deltas(positions)) == positions
+    assert len(encode_varints([1, 2, 3])) == 3
+
+
+async def test_prefix_index_suggests_titles_and_frequent_terms():
+    """Suggestions follow page creation, renames and deletion."""
+    index = PrefixIndex()
+    index.add("p1", "Meeting notes", "project kickoff and project budget")
+    index.add("p2", "Notes on Python", "python project layout")
+    index.add("p3", "Groceries", "milk")
+
+    titles = [s.text for s in await index.suggest("no") if s.kind == "title"]
+    assert sorted(titles) == ["Meeting notes", "Notes on Python"]
+
+    terms = [s for s in await index.suggest("what pro") if s.kind == "term"]
+    assert terms[0].text == "what project" and terms[0].count == 2
+
+    index.add("p3", "Shopping list", "milk")
+    assert await index.suggest("groc") == []
+    assert [s.page_id for s in await index.suggest("shop") if s.kind == "title"] == ["p3"]
+
+    index.remove("p1")
+    assert index.term_frequency("project") == 1
+    assert index.term_frequency("kickoff") == 0
+    assert await index.suggest("meet") == []
+
+
+def test_prefix_index_bulk_adds_match_single_adds():
+    """Loading in batches builds the same sorted arrays as adding pages one by one."""
+    pages = [
+        (f"p{i}", f"Note {i} on topic{i % 7}", f"shared words term{i % 13} {i}") for i in range(60)
+    ]
+    single, bulk = PrefixIndex(), PrefixIndex()
+    for page in pages:
+        single.add(*page)
+    bulk.add_many(pages[:40])
+    bulk.add_many(pages[30:])  # overlapping pages are replaced, not duplicated
+    bulk._sort()  # bulk loads defer sorting until the next lookup
+
+    assert (bulk._title_keys, bulk._terms, bulk._titles) == (
+        single._title_keys,
+        single._terms,
+        single._titles,
+    )
+    assert bulk.term_frequency("shared") == 60
+
+
+async def test_deleted_notebooks_leave_suggestions_and_typo_correction(db_session):
+    """A deleted notebook's pages are dropped from the in-memory indexes."""
+    prefix, trigrams = PrefixIndex(), TrigramIndex()
+    index_set = SearchIndexSet([prefix, trigrams])
+    create_page = CreatePageService(PageRepository(db_session), index_set)
+    doomed, kept = await _create_section(db_session), await _create_section(db_session)
+    for i in range(3):
+        await create_page.execute(
+            CreatePageCommand(section_id=doomed, title=f"Zebra {i}", content="zebras")
+        )
+    await create_page.execute(
+        CreatePageCommand(section_id=kept, title="Giraffe", content="giraffes")
+    )
+
+    notebook_id = (await SectionRepository(db_session).get_by_id(doomed)).notebook_id
+    result = await DeleteNotebookService(NotebookRepository(db_session), index_set).execute(
+        DeleteNotebookCommand(id=notebook_id)
+    )
+    assert result.success, result.message
+    assert await prefix.suggest("zeb") == []
+    assert trigrams.closest_term("zebraz") is None
+    assert [s.text for s in await prefix.suggest("gir") if s.kind == "title"] == ["Giraffe"]
+
+
+async def test_memory_indexes_change_only_when_the_write_commits(db_session):
+    """Writes reach the shared indexes after commit; rolled-back writes never do."""
+    prefix = PrefixIndex()
+    index = CommittedSearchIndex(SearchIndexSet([prefix]), db_session)
+    page_repo = PageRepository(db_session)
+    section_id = await _create_section(db_session)
+
+    page = await CreatePageService(page_repo, index).execute(CreatePageCommand(
+        section_id=section_id, title="Quokka", content="marsupial"
+    ))
+    assert await prefix.suggest("quo") == []
+    await db_session.commit()
+    assert [s.text for s in await prefix.suggest("quo") if s.kind == "title"] == ["Quokka"]
+
+    await UpdatePageService(page_repo, index).execute(UpdatePageCommand(
+        id=page.data.id, title="Wombat"
+    ))
+    await db_session.rollback()
+    assert await prefix.suggest("wom") == []
+    assert [s.text for s in await prefix.suggest("quo") if s.kind == "title"] == ["Quokka"]
+
+    await DeletePageService(page_repo, index).execute(DeletePageCommand(id=page.data.id))
+    await db_session.commit()
+    assert await prefix.suggest("quo") == []
+
+
+async def test_index_load_skips_deleted_notebooks_and_pages_written_meanwhile(
+    db_engine, db_session, monkeypatch
+):
+    """Loading runs next to live writes: pages they touched are not overwritten with older rows."""
+    monkeypatch.setattr(index_set_module, "LOAD_BATCH_SIZE", 1)
+    create_page = CreatePageService(PageRepository(db_session))
+    section_id, deleted_section_id = await _create_section(db_session), await _create_section(
+        db_session
+    )
+    pages = sorted(
+        [(await create_page.execute(CreatePageCommand(
+            section_id=section_id, title=f"Original {i}", content="text"
+        ))).data for i in range(3)],
+        key=lambda page: page.id,
+    )
+    await create_page.execute(
+        CreatePageCommand(section_id=deleted_section_id, title="Gone", content="text")
+    )
+    await NotebookRepository(db_session).delete(
+        (await SectionRepository(db_session).get_by_id(deleted_section_id)).notebook_id
+    )
+    await db_session.commit()
+
+    prefix = PrefixIndex()
+    index_set = SearchIndexSet([prefix])
+    load = asyncio.create_task(
+        index_set.load(async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False))
+    )
+    await asyncio.sleep(0)
+    # A rename is indexed before the load reaches the page's row
+    await index_set.index_page(replace(pages[-1], title="Renamed"))
+    assert await load == 2
+
+    titles = sorted(
+        s.text for s in await prefix.suggest("o") + await prefix.suggest("r") if s.kind == "title"
+    )
+    assert titles == sorted([page.title for page in pages[:-1]] + ["Renamed"])
+    assert await prefix.suggest("gone") == []
+
+
+@pytest.mark.parametrize("backend, fts5", [("memory", True), ("database", False)])
+async def test_search_schema_is_skipped_without_the_fts5_backend(
+    tmp_path, monkeypatch, backend, fts5
+):
+    """Startup needs no FTS5 unless SEARCH_BACKEND=database on a build that has it."""
+    monkeypatch.setattr(search_repository, "fts5_available", lambda connection: fts5)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(ensure_search_schema, backend)
+            tables = (await conn.execute(text(
+                "SELECT name FROM sqlite_master WHERE name LIKE 'pages_fts%'"
+            ))).scalars().all()
+    finally:
+        await engine.dispose()
+    assert tables == []
+
+
+class _PostgresConnection:
+    """Records statements; answers the column-type and trigger probes."""
+
+    class dialect:
+        name = "postgresql"
+
+    def __init__(self, column_type, has_trigger):
+        self.answers = {"information_schema": column_type, "pg_trigger": has_trigger or None}
+        self.statements = []
+
+    def execute(self, statement):
+        sql = str(statement)
+        self.statements.append(" ".join(sql.split()))
+        answer = next((v for k, v in self.answers.items() if k in sql), None)
+        return SimpleNamespace(scalar=lambda: answer, first=lambda: answer)
+
+
+def test_postgres_search_schema_is_completed_on_create_all_databases():
+    """A text search_vector without index or trigger gets all three; a full schema is kept."""
+    connection = _PostgresConnection("text", has_trigger=False)
+    ensure_search_schema(connection)
+    executed = "\n".join(connection.statements)
+    assert "ALTER COLUMN search_vector TYPE tsvector" in executed
+    assert "CREATE INDEX IF NOT EXISTS idx_pages_search_vector" in executed
+    assert "CREATE TRIGGER pages_search_vector_update" in executed
+    assert "UPDATE pages SET search_vector" in executed
+
+    migrated = _PostgresConnection("tsvector", has_trigger=True)
+    ensure_search_schema(migrated)
+    assert not any(
+        statement.startswith(("ALTER", "CREATE TRIGGER", "UPDATE"))
+        for statement in migrated.statements
+    )
+
+    with pytest.raises(RuntimeError, match="search_vector is missing"):
+        ensure_search_schema(_PostgresConnection(None, has_trigger=False))
+    ensure_search_schema(_PostgresConnection(None, has_trigger=False), "memory")
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "memory"])
+async def test_scoped_search_pages_through_keyset_cursors(db_session, backend):
+    """Notebook/section scopes apply inside the ranked query; cursors walk every hit once."""
+    index = InvertedIndex()
+    index_set = SearchIndexSet([index])
+    create_page = CreatePageService(PageRepository(db_session), index_set)
+    if backend == "sqlite":
+        search = SearchPagesService(SqliteSearchRepository(db_session))
+    else:
+        search = SearchPagesService(InMemorySearchRepository(db_session, index))
+
+    notebook_repo = NotebookRepository(db_session)
+    section_ids = [await _create_section(db_session) for _ in range(2)]
+    notebook_ids = [
+        (await SectionRepository(db_session).get_by_id(s)).notebook_id for s in section_ids
+    ]
+    expected = []
+    for section_id in section_ids:
+        for i in range(5):
+            page = await create_page.execute(CreatePageCommand(
+                section_id=section_id, title=f"Page {i}", content="shared " * (i + 1)
+            ))
+            if section_id == section_ids[0]:
+                expected.append(page.data.id)
+
+    seen, cursor = [], None
+    while True:
+        result = await search.execute(SearchPagesQuery(
+            q="shared", notebook_id=notebook_ids[0], limit=2, cursor=cursor
+        ))
+        assert result.success, result.message
+        seen.extend(hit.page_id for hit in result.data.hits)
+        assert all(hit.notebook_id == notebook_ids[0] for hit in result.data.hits)
+        cursor = result.data.next_cursor
+        if cursor is None:
+            break
+    assert sorted(seen) == sorted(expected)
+
+    scoped = await search.execute(SearchPagesQuery(q="shared", section_id=section_ids[1]))
+    assert len(scoped.data.hits) == 5
+    assert all(hit.section_id == section_ids[1] for hit in scoped.data.hits)
+
+    await notebook_repo.delete(notebook_ids[1])
+    unscoped = await search.execute(SearchPagesQuery(q="shared", limit=100))
+    assert sorted(hit.page_id for hit in unscoped.data.hits) == sorted(expected)
+
+
+async def test_memory_search_ranks_past_pages_of_deleted_notebooks(db_session):
+    """Deleted notebooks' pages still in the index cannot fill the page of hits."""
+    index = InvertedIndex()
+    create_page = CreatePageService(PageRepository(db_session), SearchIndexSet([index]))
+    search = SearchPagesService(InMemorySearchRepository(db_session, index))
+    live_section, deleted_section = await _create_section(db_session), await _create_section(
+        db_session
+    )
+
+    for _ in range(6):
+        # Better ranked than every live page
+        await create_page.execute(CreatePageCommand(
+            section_id=deleted_section, title="Walrus", content="walrus " * 10
+        ))
+    live = []
+    for i in range(3):
+        page = await create_page.execute(CreatePageCommand(
+            section_id=live_section, title=f"Live {i}", content="walrus"
+        ))
+        live.append(page.data.id)
+    await NotebookRepository(db_session).delete(
+        (await SectionRepository(db_session).get_by_id(deleted_section)).notebook_id
+    )
+
+    first = await search.execute(SearchPagesQuery(q="walrus", limit=2))
+    assert len(first.data.hits) == 2 and first.data.next_cursor is not None
+    rest = await search.execute(
+        SearchPagesQuery(q="walrus", limit=2, cursor=first.data.next_cursor)
+    )
+    assert rest.data.next_cursor is None
+    assert sorted(hit.page_id for hit in first.data.hits + rest.data.hits) == sorted(live)
+
+
+async def test_unscoped_search_ranks_a_window_and_falls_back_when_it_is_short(
+    db_session, monkeypatch
+):
+    """Deleted pages crowding the ranked window, or ties across its edge, rerun over every match."""
+    monkeypatch.setattr(search_repository, "RANK_WINDOW", 1)
+    section_id = await _create_section(db_session)
+    page_repo = PageRepository(db_session)
+    create_page = CreatePageService(page_repo)
+    search = SearchPagesService(SqliteSearchRepository(db_session))
+
+    deleted, live = [], []
+    for i in range(8):
+        page = await create_page.execute(CreatePageCommand(
+            section_id=section_id, title=f"Deleted {i}", content="zebra " * 5
+        ))
+        deleted.append(page.data.id)
+    for i in range(7):
+        page = await create_page.execute(CreatePageCommand(
+            section_id=section_id, title=f"Live {i}", content="zebra"
+        ))
+        live.append(page.data.id)
+    for page_id in deleted:
+        await page_repo.delete(page_id)
+
+    async def walk(query_text):
+        seen, cursor = [], None
+        while True:
+            result = await search.execute(SearchPagesQuery(q=query_text, limit=2, cursor=cursor))
+            assert result.success, result.message
+            seen.extend(hit.page_id for hit in result.data.hits)
+            cursor = result.data.next_cursor
+            if cursor is None:
+                return seen
+
+    # The live pages score the same, so they page through in id order
+    assert await walk("zebra") == sorted(live)
+    assert await walk("absent") == []
+
+
+async def test_fuzzy_fallback_corrects_misspelled_queries(db_session):
+    """Too few exact hits retry the search with trigram-corrected terms."""
+    section_id = await _create_section(db_session)
+    trigrams = TrigramIndex()
+    create_page = CreatePageService(PageRepository(db_session), SearchIndexSet([trigrams]))
+    search = SearchPagesService(SqliteSearchRepository(db_session), trigrams)
+
+    for i in range(3):
+        await create_page.execute(CreatePageCommand(
+            section_id=section_id, title=f"Kubernetes notes {i}", content="deployment manifests"
+        ))
+
+    assert bounded_edit_distance("kubernetes", "kuberentes", 2) == 2
+    assert bounded_edit_distance("kubernetes", "kbrnts", 2) == 3
+    assert await trigrams.correct("Kuberentes deploymnet") == "kubernetes deployment"
+    assert await trigrams.correct("kubernetes") is None
+
+    result = await search.execute(SearchPagesQuery(q="kuberentes"))
+    assert result.data.corrected_query == "kubernetes"
+    assert len(result.data.hits) == 3
+
+    exact = await search.execute(SearchPagesQuery(q="kuberentes", fuzzy=False))
+    assert exact.data.hits == [] and exact.data.corrected_query is None
+    assert (await search.execute(SearchPagesQuery(q="zzzzqqq"))).data.corrected_query is None
+
+
+async def test_highlights_come_from_stored_offsets(db_session):
+    """Offsets are written on create/update and looked up per query term."""
+    section_id = await _create_section(db_session)
+    page_repo = PageRepository(db_session)
+    highlights = HighlightRepository(db_session)
+    content = "# Deploy\n\nWe **deploy** on Fridays. deploy-bot helps."
+
+    assert decode_offsets(encode_offsets([(3, 9), (300, 306)])) == [(3, 9), (300, 306)]
+    packed = encode_term_offsets({"deploy": [(3, 9)], "ünïcode": [(12, 19)], "bot": [(30, 33)]})
+    assert decode_term_offsets(packed, ["bot", "ünïcode", "absent"]) == {
+        "bot": [(30, 33)],
+        "ünïcode": [(12, 19)],
+    }
+
+    page = await CreatePageService(page_repo, highlights).execute(CreatePageCommand(
+        section_id=section_id, title="Ops", content=content
+    ))
+    ranges = await highlights.get_highlights(page.data.id, "DEPLOY fridays")
+    assert [content[r.start:r.end] for r in ranges] == ["Deploy", "deploy", "Fridays", "deploy"]
+    assert [r.start for r in ranges] == sorted(r.start for r in ranges)
+
+    await UpdatePageService(page_repo, highlights).execute(UpdatePageCommand(
+        id=page.data.id, content="nothing here"
+    ))
+    assert await highlights.get_highlights(page.data.id, "deploy") == []
+
+    await DeletePageService(page_repo, highlights).execute(DeletePageCommand(id=page.data.id))
+    assert await highlights.get_highlights(page.data.id, "nothing") is None
+
+
+async def test_page_writes_leave_offsets_to_the_first_highlight_request(
+    db_session, count_statements
+):
+    """Saves are one statement; stale offsets are recomputed once, when highlighted."""
+    section_id = await _create_section(db_session)
+    page_repo = PageRepository(db_session)
+    highlights = HighlightRepository(db_session)
+    page = await CreatePageService(page_repo, highlights).execute(CreatePageCommand(
+        section_id=section_id, title="Ops", content="alpha beta"
+    ))
+    update = UpdatePageService(page_repo, get_search_index(db_session))
+
+    with count_statements() as statements:
+        result = await update.execute(UpdatePageCommand(
+            id=page.data.id, content="gamma alpha", base_version=page.data.version
+        ))
+    assert result.success, result.message
+    assert not any("page_term_offsets" in statement for statement in statements)
+
+    with count_statements() as statements:
+        ranges = await highlights.get_highlights(page.data.id, "alpha beta")
+        assert [(r.start, r.end) for r in ranges] == [(6, 11)]
+    assert len(statements) == 3  # version check, content read, offsets upsert
+    with count_statements() as statements:
+        assert len(await highlights.get_highlights(page.data.id, "gamma")) == 1
+    assert len(statements) == 1
+
+
+async def test_highlights_backfill_pages_indexed_before_offsets(db_session):
+    """Pages without stored offsets are indexed on their first highlight request."""
+    section_id = await _create_section(db_session)
+    page = await CreatePageService(PageRepository(db_session)).execute(CreatePageCommand(
+        section_id=section_id, title="Legacy", content="legacy content, legacy format"
+    ))
+    highlights = HighlightRepository(db_session)
+
+    ranges = await highlights.get_highlights(page.data.id, "legacy")
+    assert [(r.start, r.end) for r in ranges] == [(0, 6), (16, 22)]
+    assert len(await highlights.get_highlights(page.data.id, "format")) == 1
+
+
+class _CountingSearchRepository(SqliteSearchRepository):
+    calls = 0
+
+    async def search(self, *args, **kwargs):
+        self.calls += 1
+        return await super().search(*args, **kwargs)
+
+
+async def test_search_cache_serves_repeats_until_a_write(db_session):
+    """Repeated pages of a search are cached; page and notebook writes invalidate them."""
+    section_id = await _create_section(db_session)
+    cache = SearchResultCache(max_entries=8)
+    invalidator = SearchCacheInvalidator(cache, db_session)
+    inner = _CountingSearchRepository(db_session)
+    search = SearchPagesService(CachedSearchRepository(inner, cache))
+    create_page = CreatePageService(PageRepository(db_session), invalidator)
+
+    await create_page.execute(
+        CreatePageCommand(section_id=section_id, title="Cache", content="warm")
+    )
+    first = await search.execute(SearchPagesQuery(q="warm", limit=1))
+    second = await search.execute(SearchPagesQuery(q="  WARM ", limit=1))
+    assert inner.calls == 1
+    assert second.data.hits == first.data.hits
+
+    await create_page.execute(
+        CreatePageCommand(section_id=section_id, title="Cache 2", content="warm")
+    )
+    assert len((await search.execute(SearchPagesQuery(q="warm"))).data.hits) == 2
+    assert inner.calls == 2
+
+    generation = cache.generation
+    await db_session.commit()
+    assert cache.generation == generation + 1
+
+    section = await SectionRepository(db_session).get_by_id(section_id)
+    await DeleteNotebookService(NotebookRepository(db_session), invalidator).execute(
+        DeleteNotebookCommand(id=section.notebook_id)
+    )
+    assert (await search.execute(SearchPagesQuery(q="warm"))).data.hits == []
+
+
+def test_search_cache_is_bounded_and_drops_racing_results():
+    """Entries computed before a bump are never stored; the LRU bound holds."""
+    cache = SearchResultCache(max_entries=2)
+    stale_generation = cache.generation
+    cache.bump()
+    cache.put("stale", stale_generation, [])
+    assert cache.get("stale") is None
+
+    for key in ("a", "b", "c"):
+        cache.put(key, cache.generation, [])
+    assert len(cache) == 2 and cache.get("a") is None and cache.get("c") == []
+
+
+async def test_reindex_rewrites_stale_plain_text_in_batches(db_engine, db_session):
+    """The reindex job repairs content_plain, the FTS index and in-memory indexes."""
+    section_id = await _create_section(db_session)
+    create_page = CreatePageService(PageRepository(db_session))
+    pages = [
+        (await create_page.execute(CreatePageCommand(
+            section_id=section_id, title=f"Imported {i}", content=f"**bold{i}** text"
+        ))).data
+        for i in range(5)
+    ]
+    await db_session.execute(text("UPDATE pages SET content_plain = 'stale'"))
+    await db_session.commit()
+
+    search = SearchPagesService(SqliteSearchRepository(db_session))
+    assert (await search.execute(SearchPagesQuery(q="bold3"))).data.hits == []
+
+    inverted = InvertedIndex()
+    reindexer = PageReindexer(
+        async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False),
+        lambda session: CompositeSearchIndex(
+            [HighlightRepository(session), SearchIndexSet([inverted])]
+        ),
+    )
+    progress = await reindexer.run(batch_size=2)
+    assert progress.status == "completed", progress.error
+    assert (progress.total, progress.processed, progress.updated) == (5, 5, 5)
+
+    db_session.expire_all()
+    reindexed = await PageRepository(db_session).get_by_id(pages[3].id)
+    assert reindexed.content_plain == "bold3 text"
+    assert reindexed.updated_at == pages[3].updated_at
+    assert [
+        hit.page_id for hit in (await search.execute(SearchPagesQuery(q="bold3"))).data.hits
+    ] == [pages[3].id]
+    assert [page_id for page_id, _ in inverted.search("text", 10)] != []
+    assert len(await HighlightRepository(db_session).get_highlights(pages[0].id, "bold0")) == 1
+
+    again = await reindexer.run(batch_size=2)
+    assert again.updated == 0
+
+
+async def test_reindex_can_rebuild_the_fulltext_index(db_engine, db_session):
+    """A reindex with rebuild_fulltext repairs an FTS5 index out of step with its rowids."""
+    section_id = await _create_section(db_session)
+    await CreatePageService(PageRepository(db_session)).execute(CreatePageCommand(
+        section_id=section_id, title="Vacuumed", content="renumbered rowids"
+    ))
+    # What a VACUUM renumbering leaves behind: index entries for other rowids
+    await db_session.execute(text("INSERT INTO pages_fts(pages_fts) VALUES ('delete-all')"))
+    await db_session.execute(text(
+        "INSERT INTO pages_fts(rowid, title, content_plain) VALUES (999, 'Vacuumed', 'stale')"
+    ))
+    await db_session.commit()
+    search = SearchPagesService(SqliteSearchRepository(db_session))
+    assert (await search.execute(SearchPagesQuery(q="renumbered"))).data.hits == []
+
+    reindexer = PageReindexer(
+        async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False),
+        HighlightRepository,
+    )
+    progress = await reindexer.run(rebuild_fulltext=True)
+    assert progress.status == "completed", progress.error
+    hits = (await search.execute(SearchPagesQuery(q="renumbered"))).data.hits
+    assert [hit.title for hit in hits] == ["Vacuumed"]
+
+
+async def test_reindex_leaves_pages_saved_during_a_batch_alone(db_engine, db_session, monkeypatch):
+    """A save between the batch read and its write keeps its own plain text and index entries."""
+    section_id = await _create_section(db_session)
+    page = (await CreatePageService(PageRepository(db_session)).execute(CreatePageCommand(
+        section_id=section_id, title="Racing", content="old words"
+    ))).data
+    await db_session.execute(text("UPDATE pages SET content_plain = 'stale'"))
+    await db_session.commit()
+
+    def save_while_reindexing(content):
+        # Another connection saves the page after the batch was read
+        with sqlite3.connect(db_engine.url.database) as connection:
+            connection.execute(
+                "UPDATE pages SET content = 'new words', content_plain = 'new words', "
+                "version = version + 1 WHERE id = ?",
+                (page.id,),
+            )
+        return extract_plain_text(content)
+
+    monkeypatch.setattr(reindex, "extract_plain_text", save_while_reindexing)
+    inverted = InvertedIndex()
+    reindexer = PageReindexer(
+        async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False),
+        lambda session: CompositeSearchIndex(
+            [HighlightRepository(session), SearchIndexSet([inverted])]
+        ),
+    )
+    progress = await reindexer.run()
+    assert progress.status == "completed", progress.error
+    assert (progress.processed, progress.updated) == (1, 0)
+
+    db_session.expire_all()
+    assert (await PageRepository(db_session).get_by_id(page.id)).content_plain == "new words"
+    search = SearchPagesService(SqliteSearchRepository(db_session))
+    assert (await search.execute(SearchPagesQuery(q="old"))).data.hits == []
+    assert inverted.search("old") == []
+
+
+async def test_reindex_keeps_pages_of_deleted_notebooks_out_of_memory_indexes(
+    db_engine, db_session
+):
+    """Reindexing does not bring back suggestions for pages of a deleted notebook."""
+    prefix = PrefixIndex()
+    index_set = SearchIndexSet([prefix])
+    create_page = CreatePageService(PageRepository(db_session), index_set)
+    doomed, kept = await _create_section(db_session), await _create_section(db_session)
+    await create_page.execute(CreatePageCommand(section_id=doomed, title="Zebra", content="zebra"))
+    await create_page.execute(CreatePageCommand(section_id=kept, title="Zebu", content="zebu"))
+    notebook_id = (await SectionRepository(db_session).get_by_id(doomed)).notebook_id
+    await DeleteNotebookService(NotebookRepository(db_session), index_set).execute(
+        DeleteNotebookCommand(id=notebook_id)
+    )
+    await db_session.commit()
+
+    reindexer = PageReindexer(
+        async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False),
+        lambda session: index_set,
+    )
+    progress = await reindexer.run(batch_size=1)
+    assert progress.status == "completed", progress.error
+    assert progress.processed == 2
+    assert [s.text for s in await prefix.suggest("zeb") if s.kind == "title"] == ["Zebu"]